@@ -17,6 +17,7 @@ from app.core.database import get_db
 from app.core.deps import get_current_user, require_admin
 from app.models.user import User
 from app.models.action_mapping import ActionMapping
+from app.services.action_executor import invalidate_action_cache
 from app.schemas.action_mapping import (
     ActionMappingCreate,
     ActionMappingUpdate,
@@ -354,6 +355,7 @@ def create_action_mapping(
 
     db.add(new_action)
     db.commit()
+    invalidate_action_cache()
     db.refresh(new_action)
 
     logger.info(
@@ -406,6 +408,7 @@ def update_action_mapping(
         setattr(action, field, value)
 
     db.commit()
+    invalidate_action_cache()
     db.refresh(action)
 
     logger.info(
@@ -464,6 +467,7 @@ def delete_action_mapping(
         logger.info(f"✅ Admin {current_user.email} soft-deleted action '{action_id}'")
 
     db.commit()
+    invalidate_action_cache()
 
     return None
 
@@ -500,6 +504,7 @@ def activate_action_mapping(
 
     action.is_active = True
     db.commit()
+    invalidate_action_cache()
     db.refresh(action)
 
     logger.info(f"✅ Admin {current_user.email} activated action '{action_id}'")
@@ -539,6 +544,7 @@ def deactivate_action_mapping(
 
     action.is_active = False
     db.commit()
+    invalidate_action_cache()
     db.refresh(action)
 
     logger.info(f"✅ Admin {current_user.email} deactivated action '{action_id}'")
@@ -18,6 +18,7 @@ from datetime import datetime, timedelta
 # Database and security imports
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.responses import trusted_response
 
 # Models
 from app.models.user import User
@@ -25,7 +26,8 @@ from app.models.gesture import Gesture, ActivityLog
 from sqlalchemy import text
 
 # Pydantic schemas
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
+from app.schemas.user import Email
 
 router = APIRouter()
 
@@ -37,7 +39,7 @@ router = APIRouter()
 class UserUpdateAdmin(BaseModel):
     """Schema for updating user by admin"""
     full_name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     role: Optional[str] = Field(None, pattern="^(USER|ADMIN|MODERATOR)$")
     status: Optional[str] = Field(None, pattern="^(ACTIVE|INACTIVE)$")
     accessibility_settings: Optional[dict] = None
@@ -665,7 +667,7 @@ from app.schemas.admin_settings import (
     AdminSettingsUpdate,
     AdminSettingsResponse,
     AdminSettingsUpdateResponse,
-    DEFAULT_ADMIN_SETTINGS
+    default_admin_settings
 )
 
 # Settings Service
@@ -692,10 +694,11 @@ def get_admin_settings(
 
     settings = load_admin_settings()
 
-    return AdminSettingsResponse(
+    response = AdminSettingsResponse.model_construct(
         settings=settings,
         message="Settings retrieved successfully"
     )
+    return trusted_response(response)
 
 
 @router.put("/settings", response_model=AdminSettingsUpdateResponse)
@@ -719,13 +722,13 @@ def update_admin_settings(
     # Load current settings
     current_settings = load_admin_settings()
 
-    # Merge with updates
+    # Merge with updates (only update provided fields)
     if settings_update.system:
-        current_settings.system = settings_update.system
+        current_settings.system.update(settings_update.system)
     if settings_update.defaults:
-        current_settings.defaults = settings_update.defaults
+        current_settings.defaults.update(settings_update.defaults)
     if settings_update.gesture_system:
-        current_settings.gesture_system = settings_update.gesture_system
+        current_settings.gesture_system.update(settings_update.gesture_system)
 
     # Save to file
     if not save_admin_settings(current_settings):
@@ -737,11 +740,12 @@ def update_admin_settings(
     # Apply to runtime
     applied = apply_admin_settings_to_runtime(current_settings)
 
-    return AdminSettingsUpdateResponse(
+    response = AdminSettingsUpdateResponse.model_construct(
         settings=current_settings,
         message="Settings updated successfully",
         applied_to_runtime=applied
     )
+    return trusted_response(response)
 
 
 @router.post("/settings/reset", response_model=AdminSettingsUpdateResponse)
@@ -759,7 +763,7 @@ def reset_admin_settings(
     verify_admin(current_user)
 
     # Get default settings
-    default_settings = DEFAULT_ADMIN_SETTINGS.model_copy()
+    default_settings = default_admin_settings().model_copy(deep=True)
 
     # Save to file
     if not save_admin_settings(default_settings):
@@ -771,11 +775,12 @@ def reset_admin_settings(
     # Apply to runtime
     applied = apply_admin_settings_to_runtime(default_settings)
 
-    return AdminSettingsUpdateResponse(
+    response = AdminSettingsUpdateResponse.model_construct(
         settings=default_settings,
         message="Settings reset to defaults",
         applied_to_runtime=applied
     )
+    return trusted_response(response)
 
 
 @router.get("/maintenance-status")
@@ -786,4 +791,4 @@ def get_maintenance_status():
     Used by user-facing pages to show/hide the maintenance banner.
     """
     settings = load_admin_settings()
-    return {"maintenance_mode": settings.system.maintenance_mode}
+    return {"maintenance_mode": settings.system["maintenance_mode"]}
@@ -79,7 +79,7 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
             "created_at": "2024-01-01T00:00:00Z"
         }
     """
-    return current_user
+    return UserResponse.from_orm_fast(current_user)
 
 
 # ============================================
@@ -168,7 +168,7 @@ async def register(
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": new_user
+        "user": UserResponse.from_orm_fast(new_user)
     }
 
 
@@ -251,7 +251,7 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": user
+        "user": UserResponse.from_orm_fast(user)
     }
 
 
@@ -434,7 +434,7 @@ async def google_auth(
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": user,
+        "user": UserResponse.from_orm_fast(user),
         "is_new_user": is_new_user
     }
 
@@ -4,6 +4,8 @@ from typing import List, Dict, Any
 from datetime import datetime
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.responses import trusted_response
+from app.core.routing import ModelJSONRoute
 from app.models.user import User
 from app.models.gesture import Gesture, ActivityLog
 from app.schemas.gesture import GestureCreate, GestureResponse
@@ -19,7 +21,7 @@ import time
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ModelJSONRoute)
 
 # Phase 3: Track if index needs rebuilding
 _index_needs_rebuild = True
@@ -98,7 +100,7 @@ def record_gesture(
     reload_user_gestures(current_user.id, db)
 
     logger.info(f"✅ Gesture recorded: '{new_gesture.name}'")
-    return new_gesture
+    return trusted_response(GestureResponse.from_orm_fast(new_gesture), status_code=status.HTTP_201_CREATED)
 
 @router.get("/", response_model=List[GestureResponse])
 def get_user_gestures(
@@ -146,7 +148,7 @@ def get_user_gestures(
             else:
                 logger.warning(f"⚠️ Gesture '{gesture.name}' (ID: {gesture.id}): No landmark_data found")
 
-    return gestures
+    return trusted_response(GestureResponse.from_orm_fast(gesture) for gesture in gestures)
 
 @router.put("/{gesture_id}", response_model=GestureResponse)
 def update_gesture(
@@ -218,7 +220,7 @@ def update_gesture(
     reload_user_gestures(current_user.id, db)
 
     logger.info(f"✅ Gesture updated: '{gesture.name}'")
-    return gesture
+    return trusted_response(GestureResponse.from_orm_fast(gesture))
 
 @router.delete("/{gesture_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_gesture(
@@ -16,13 +16,14 @@ import logging
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.responses import trusted_response
 from app.models.user import User
 from app.schemas.settings import (
     UserSettings,
     UserSettingsUpdate,
     UserSettingsResponse,
     UserSettingsUpdateResponse,
-    DEFAULT_USER_SETTINGS
+    default_user_settings
 )
 
 logger = logging.getLogger(__name__)
@@ -31,28 +32,28 @@ router = APIRouter()
 
 def get_effective_defaults() -> UserSettings:
     """
-    Combine hardcoded DEFAULT_USER_SETTINGS with admin-defined defaults.
+    Combine hardcoded default user settings with admin-defined defaults.
     """
     try:
         from app.services.admin_settings_service import load_admin_settings
         admin_settings = load_admin_settings()
 
-        defaults = DEFAULT_USER_SETTINGS.model_copy()
+        defaults = default_user_settings().model_copy(deep=True)
 
         # Map admin defaults to user settings
-        defaults.cursor.cursor_speed = admin_settings.defaults.default_cursor_speed
-        defaults.cursor.smoothing_level = admin_settings.defaults.default_smoothing_level
-        defaults.cursor.dead_zone = admin_settings.defaults.default_dead_zone
-        defaults.click.click_sensitivity = admin_settings.defaults.default_click_sensitivity
+        defaults.cursor["cursor_speed"] = admin_settings.defaults["default_cursor_speed"]
+        defaults.cursor["smoothing_level"] = admin_settings.defaults["default_smoothing_level"]
+        defaults.cursor["dead_zone"] = admin_settings.defaults["default_dead_zone"]
+        defaults.click["click_sensitivity"] = admin_settings.defaults["default_click_sensitivity"]
 
         # Use gesture_system settings as the effective defaults for users
-        defaults.gesture.gesture_sensitivity = admin_settings.gesture_system.system_gesture_sensitivity
-        defaults.gesture.gesture_hold_time = admin_settings.gesture_system.gesture_hold_time
+        defaults.gesture["gesture_sensitivity"] = admin_settings.gesture_system["system_gesture_sensitivity"]
+        defaults.gesture["gesture_hold_time"] = admin_settings.gesture_system["gesture_hold_time"]
 
         return defaults
     except Exception as e:
         logger.error(f"Error getting effective defaults: {e}")
-        return DEFAULT_USER_SETTINGS.model_copy()
+        return default_user_settings().model_copy(deep=True)
 
 
 def get_user_settings(user: User) -> UserSettings:
@@ -104,53 +105,36 @@ def apply_settings_to_runtime(settings: UserSettings, user_id: int) -> bool:
 
         # Apply cursor settings
         cursor_controller = get_cursor_controller()
-        cursor_controller.movement_scale = settings.cursor.cursor_speed
-        cursor_controller.dead_zone_threshold = settings.cursor.dead_zone
-        cursor_controller.cursor_enabled = settings.cursor.cursor_enabled
+        cursor_controller.movement_scale = settings.cursor["cursor_speed"]
+        cursor_controller.dead_zone_threshold = settings.cursor["dead_zone"]
+        cursor_controller.cursor_enabled = settings.cursor["cursor_enabled"]
         # Note: _dz_min/_dz_max are internal to the adaptive dead zone system
         # and must not be overwritten from the user-facing dead_zone value.
 
-        # Update smoothing - initialize filters if they don't exist
-        from app.services.temporal_smoothing import OneEuroFilter
-
-        if not hasattr(cursor_controller, 'filter_x') or cursor_controller.filter_x is None:
-            cursor_controller.filter_x = OneEuroFilter(
-                min_cutoff=settings.cursor.smoothing_level,
-                beta=0.009,
-                d_cutoff=1.0
-            )
-            cursor_controller.filter_y = OneEuroFilter(
-                min_cutoff=settings.cursor.smoothing_level,
-                beta=0.009,
-                d_cutoff=1.0
-            )
-            cursor_controller.smoothing_enabled = True
-            logger.info("Initialized cursor smoothing filters")
-        else:
-            cursor_controller.filter_x.min_cutoff = settings.cursor.smoothing_level
-            cursor_controller.filter_y.min_cutoff = settings.cursor.smoothing_level
-
-        logger.info(f"Applied cursor settings: speed={settings.cursor.cursor_speed}, "
-                   f"smoothing={settings.cursor.smoothing_level}, dead_zone={settings.cursor.dead_zone}")
+        # Update smoothing - initializes the filter if it doesn't exist
+        cursor_controller.set_smoothing_level(settings.cursor["smoothing_level"])
+
+        logger.info(f"Applied cursor settings: speed={settings.cursor['cursor_speed']}, "
+                   f"smoothing={settings.cursor['smoothing_level']}, dead_zone={settings.cursor['dead_zone']}")
 
         # Apply click settings
         hand_pose_detector = get_hand_pose_detector()
-        hand_pose_detector.pinch_threshold = settings.click.click_sensitivity
+        hand_pose_detector.pinch_threshold = settings.click["click_sensitivity"]
         # Note: click_enabled is checked at runtime in hybrid mode controller
 
-        logger.info(f"Applied click settings: sensitivity={settings.click.click_sensitivity}")
+        logger.info(f"Applied click settings: sensitivity={settings.click['click_sensitivity']}")
 
         # Apply gesture settings
         gesture_matcher = get_gesture_matcher()
-        gesture_matcher.similarity_threshold = settings.gesture.gesture_sensitivity
+        gesture_matcher.similarity_threshold = settings.gesture["gesture_sensitivity"]
 
-        logger.info(f"Applied gesture settings: sensitivity={settings.gesture.gesture_sensitivity}")
+        logger.info(f"Applied gesture settings: sensitivity={settings.gesture['gesture_sensitivity']}")
 
         # Apply gesture hold time to state machine
         state_machine = get_hybrid_state_machine()
-        state_machine.stationary_duration_threshold = settings.gesture.gesture_hold_time
+        state_machine.stationary_duration_threshold = settings.gesture["gesture_hold_time"]
 
-        logger.info(f"Applied state machine settings: hold_time={settings.gesture.gesture_hold_time}")
+        logger.info(f"Applied state machine settings: hold_time={settings.gesture['gesture_hold_time']}")
 
         logger.info(f"All runtime settings applied successfully for user {user_id}")
         return True
@@ -188,10 +172,11 @@ def get_settings(
     """
     settings = get_user_settings(current_user)
 
-    return UserSettingsResponse(
+    response = UserSettingsResponse.model_construct(
         settings=settings,
         message="Settings retrieved successfully"
     )
+    return trusted_response(response)
 
 
 @router.put("", response_model=UserSettingsUpdateResponse)
@@ -227,13 +212,13 @@ def update_settings(
 
     # Merge with updates (only update provided fields)
     if settings_update.cursor:
-        current_settings.cursor = settings_update.cursor
+        current_settings.cursor.update(settings_update.cursor)
     if settings_update.click:
-        current_settings.click = settings_update.click
+        current_settings.click.update(settings_update.click)
     if settings_update.gesture:
-        current_settings.gesture = settings_update.gesture
+        current_settings.gesture.update(settings_update.gesture)
     if settings_update.display:
-        current_settings.display = settings_update.display
+        current_settings.display.update(settings_update.display)
 
     # Persist to database
     try:
@@ -252,11 +237,12 @@ def update_settings(
     # Apply to runtime
     applied = apply_settings_to_runtime(current_settings, current_user.id)
 
-    return UserSettingsUpdateResponse(
+    response = UserSettingsUpdateResponse.model_construct(
         settings=current_settings,
         message="Settings updated successfully",
         applied_to_runtime=applied
     )
+    return trusted_response(response)
 
 
 @router.post("/reset", response_model=UserSettingsUpdateResponse)
@@ -289,11 +275,12 @@ def reset_settings(
     # Apply to runtime
     applied = apply_settings_to_runtime(default_settings, current_user.id)
 
-    return UserSettingsUpdateResponse(
+    response = UserSettingsUpdateResponse.model_construct(
         settings=default_settings,
         message="Settings reset to defaults",
         applied_to_runtime=applied
     )
+    return trusted_response(response)
 
 
 @router.post("/apply", response_model=UserSettingsUpdateResponse)
@@ -313,8 +300,9 @@ def apply_settings(
     settings = get_user_settings(current_user)
     applied = apply_settings_to_runtime(settings, current_user.id)
 
-    return UserSettingsUpdateResponse(
+    response = UserSettingsUpdateResponse.model_construct(
         settings=settings,
         message="Settings applied to runtime" if applied else "Failed to apply settings",
         applied_to_runtime=applied
     )
+    return trusted_response(response)
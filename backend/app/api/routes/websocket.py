@@ -82,9 +82,13 @@ async def hand_tracking_hybrid_websocket(websocket: WebSocket):
             "cursor": {
                 "success": true,
                 "cursor_enabled": true,
-                "hand_position": {"raw": {...}, "smoothed": {...}, "filtered": {...}},
+                "moved": false,
+                // Only every CursorController.VERBOSE_RESULT_INTERVAL (30)
+                // frames; other frames carry just the three fields above
                 "screen_position": {"x": 1024, "y": 768},
-                "latency_ms": 5.2
+                "hand_position": {"raw": {...}, "smoothed": {...}, "filtered": {...}},
+                "latency_ms": 5.2,
+                "stats": {...}
             },
             "clicks": {
                 "click_type": "left_click" | "right_click" | "none",
@@ -9,7 +9,7 @@ Author: Muhammad Shawaiz
 Project: AirClick FYP
 """
 
-from typing import Dict, List
+from typing import Dict, List, Literal
 from enum import Enum
 
 
@@ -22,6 +22,10 @@ class AppContext(str, Enum):
     MEDIA = "MEDIA"
 
 
+# Same values as AppContext, for schema fields validated directly by pydantic-core
+AppContextName = Literal["GLOBAL", "POWERPOINT", "WORD", "BROWSER", "MEDIA"]
+
+
 class ActionCategory(str, Enum):
     """Categories of actions"""
     NAVIGATION = "NAVIGATION"
@@ -0,0 +1,33 @@
+"""
+Optional Numba JIT support.
+
+Hot numeric loops (cursor pipeline, DTW) are written as plain Python/NumPy
+functions decorated with njit. When numba is installed they are compiled to
+machine code on first call (and cached on disk with cache=True); without it
+the decorator is a no-op and the same functions run as ordinary Python.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("⚠ numba not installed. Numeric kernels will run as plain Python. Install with: pip install numba")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
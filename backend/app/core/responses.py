@@ -0,0 +1,36 @@
+"""
+Response helpers for endpoints that return server-built schemas.
+
+FastAPI re-validates whatever an endpoint returns against its response_model
+before serializing it. For schemas the server has just built itself (settings,
+gesture rows) that second validation pass is pure overhead, so these helpers
+dump the model once and hand FastAPI a ready-made response, which it sends
+as-is. Routes keep their response_model so the OpenAPI docs stay unchanged.
+"""
+
+from typing import Iterable, Union
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def trusted_response(
+    content: Union[BaseModel, Iterable[BaseModel]],
+    status_code: int = 200
+) -> ORJSONResponse:
+    """
+    Serialize a trusted model (or list of models) without re-validation.
+
+    Args:
+        content: Model instance or iterable of model instances
+        status_code: HTTP status code for the response
+
+    Returns:
+        ORJSONResponse with the dumped model data
+    """
+    if isinstance(content, BaseModel):
+        payload = content.model_dump()
+    else:
+        payload = [item.model_dump() for item in content]
+
+    return ORJSONResponse(content=payload, status_code=status_code)
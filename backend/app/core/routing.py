@@ -0,0 +1,67 @@
+"""
+Custom route class for endpoints with large pydantic request bodies.
+
+FastAPI normally parses a JSON body with the stdlib json module and then
+validates the resulting dict against the body model. For gesture payloads
+(90 frames x 21 landmarks, ~100KB of JSON) parsing dominates, so routes using
+ModelJSONRoute hand the raw bytes straight to model_validate_json(), letting
+pydantic-core parse and validate in a single pass.
+"""
+
+import inspect
+from typing import Any, Callable, Coroutine, Optional, Type
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+
+
+class _ModelJSONRequest(Request):
+    """Request whose json() returns an already-validated body model."""
+
+    body_model: Optional[Type[BaseModel]] = None
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = self.body_model.model_validate_json(await self.body())
+            except ValidationError:
+                # Fall back to the regular dict path so FastAPI builds its
+                # usual 422 response for invalid payloads
+                return await super().json()
+        return self._json
+
+
+class ModelJSONRoute(APIRoute):
+    """
+    APIRoute that validates a pydantic body model directly from raw JSON bytes.
+
+    Routes without a single pydantic model body (e.g. List[Dict] bodies)
+    keep FastAPI's default request handling.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        # Only a single, non-embedded model body is parsed this way; embedded
+        # bodies are wrapped in a generated model and must stay dicts
+        body_params = self.dependant.body_params
+        if self.body_field is None or len(body_params) != 1:
+            return original_route_handler
+        body_model = self.body_field.type_
+        if body_model is not body_params[0].type_:
+            return original_route_handler
+        if not (inspect.isclass(body_model) and issubclass(body_model, BaseModel)):
+            return original_route_handler
+
+        request_class = type(
+            f"{body_model.__name__}JSONRequest",
+            (_ModelJSONRequest,),
+            {"body_model": body_model}
+        )
+
+        async def custom_route_handler(request: Request) -> Response:
+            request = request_class(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
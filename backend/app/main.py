@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
 from app.core.database import Base, engine
 from app.api.routes import api_router, ws_router
@@ -45,7 +46,8 @@ except Exception as e:
 app = FastAPI(
     title="AirClick API",
     description="Hand gesture recognition backend API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes faster than the stdlib json encoder
 )
 
 # Configure CORS
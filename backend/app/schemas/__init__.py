@@ -9,7 +9,8 @@ from app.schemas.settings import (
     ClickSettings,
     GestureSettings,
     DisplaySettings,
-    DEFAULT_USER_SETTINGS
+    DEFAULT_USER_SETTINGS_DICT,
+    default_user_settings
 )
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     "ClickSettings",
     "GestureSettings",
     "DisplaySettings",
-    "DEFAULT_USER_SETTINGS"
+    "DEFAULT_USER_SETTINGS_DICT",
+    "default_user_settings"
 ]
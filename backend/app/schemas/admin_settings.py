@@ -5,101 +5,96 @@ These schemas define the structure of request/response data for admin settings e
 Admin settings control system-wide defaults and configurations.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional
+from typing_extensions import TypedDict
+from functools import lru_cache
+from app.core.actions import AppContextName
 
 
-class SystemSettings(BaseModel):
+class SystemSettings(TypedDict, total=False):
     """
     System-wide settings controlled by admin.
     """
-    system_name: str = Field(
-        default="AirClick Gesture Control",
+    system_name: Annotated[str, Field(
         max_length=100,
         description="Display name for the system"
-    )
-    maintenance_mode: bool = Field(
-        default=False,
+    )]
+    maintenance_mode: Annotated[bool, Field(
         description="Enable maintenance mode to temporarily disable user access"
-    )
-    default_app_context: str = Field(
-        default="GLOBAL",
+    )]
+    default_app_context: Annotated[AppContextName, Field(
         description="Default application context for gestures"
-    )
+    )]
 
 
-class DefaultUserSettings(BaseModel):
+class DefaultUserSettings(TypedDict, total=False):
     """
     Default settings applied to new users.
     Admins can configure system-wide defaults here.
     """
-    default_cursor_speed: float = Field(
-        default=1.0,
+    default_cursor_speed: Annotated[float, Field(
         ge=0.5,
         le=4.0,
         description="Default cursor speed for new users"
-    )
-    default_gesture_sensitivity: float = Field(
-        default=0.75,
+    )]
+    default_gesture_sensitivity: Annotated[float, Field(
         ge=0.5,
         le=0.95,
         description="Default gesture matching threshold for new users"
-    )
-    default_click_sensitivity: float = Field(
-        default=0.08,
+    )]
+    default_click_sensitivity: Annotated[float, Field(
         ge=0.03,
         le=0.15,
         description="Default click sensitivity for new users"
-    )
-    default_smoothing_level: float = Field(
-        default=1.0,
+    )]
+    default_smoothing_level: Annotated[float, Field(
         ge=0.1,
         le=2.0,
         description="Default cursor smoothing for new users"
-    )
-    default_dead_zone: float = Field(
-        default=0.003,
+    )]
+    default_dead_zone: Annotated[float, Field(
         ge=0.0,
         le=0.1,
         description="Default cursor dead zone for new users"
-    )
-    default_gesture_hold_time: float = Field(
-        default=2.0,
+    )]
+    default_gesture_hold_time: Annotated[float, Field(
         ge=0.5,
         le=4.0,
         description="Default gesture trigger delay for new users"
-    )
+    )]
 
 
-class GestureSystemSettings(BaseModel):
+class GestureSystemSettings(TypedDict, total=False):
     """
     Settings for the gesture recognition system.
     These affect how gestures are collected and matched.
     """
-    system_gesture_sensitivity: float = Field(
-        default=0.75,
+    system_gesture_sensitivity: Annotated[float, Field(
         ge=0.5,
         le=0.95,
         description="Global similarity threshold for gesture matching"
-    )
-    gesture_collection_frames: int = Field(
-        default=90,
+    )]
+    gesture_collection_frames: Annotated[int, Field(
         ge=30,
         le=150,
         description="Maximum frames to collect for a gesture"
-    )
-    gesture_hold_time: float = Field(
-        default=1.5,
+    )]
+    gesture_hold_time: Annotated[float, Field(
         ge=0.5,
         le=3.0,
         description="Seconds hand must be still before gesture collection starts"
-    )
-    gesture_cooldown_duration: float = Field(
-        default=1.0,
+    )]
+    gesture_cooldown_duration: Annotated[float, Field(
         ge=0.5,
         le=3.0,
         description="Cooldown period after gesture match (seconds)"
-    )
+    )]
+
+
+def _default_section(section: str):
+    """default_factory returning a fresh copy of one default settings section."""
+    return lambda: dict(DEFAULT_ADMIN_SETTINGS_DICT[section])
 
 
 class AdminSettings(BaseModel):
@@ -107,10 +102,12 @@ class AdminSettings(BaseModel):
     Complete admin settings schema.
 
     Combines all admin settings categories.
+    Sections are TypedDicts (plain dicts at runtime); access values by key,
+    e.g. settings.defaults["default_cursor_speed"].
     """
-    system: SystemSettings = Field(default_factory=SystemSettings)
-    defaults: DefaultUserSettings = Field(default_factory=DefaultUserSettings)
-    gesture_system: GestureSystemSettings = Field(default_factory=GestureSystemSettings)
+    system: SystemSettings = Field(default_factory=_default_section("system"))
+    defaults: DefaultUserSettings = Field(default_factory=_default_section("defaults"))
+    gesture_system: GestureSystemSettings = Field(default_factory=_default_section("gesture_system"))
 
     class Config:
         from_attributes = True
@@ -122,6 +119,8 @@ class AdminSettingsUpdate(BaseModel):
 
     All fields are optional - only provided fields will be updated.
     """
+    model_config = ConfigDict(defer_build=True)
+
     system: Optional[SystemSettings] = None
     defaults: Optional[DefaultUserSettings] = None
     gesture_system: Optional[GestureSystemSettings] = None
@@ -147,25 +146,39 @@ class AdminSettingsUpdateResponse(BaseModel):
     )
 
 
-# Default admin settings
-DEFAULT_ADMIN_SETTINGS = AdminSettings(
-    system=SystemSettings(
-        system_name="AirClick Gesture Control",
-        maintenance_mode=False,
-        default_app_context="GLOBAL"
-    ),
-    defaults=DefaultUserSettings(
-        default_cursor_speed=1.0,
-        default_gesture_sensitivity=0.75,
-        default_click_sensitivity=0.08,
-        default_smoothing_level=1.0,
-        default_dead_zone=0.003,
-        default_gesture_hold_time=2.0
-    ),
-    gesture_system=GestureSystemSettings(
-        system_gesture_sensitivity=0.75,
-        gesture_collection_frames=90,
-        gesture_hold_time=1.5,
-        gesture_cooldown_duration=1.0
-    )
-)
+# Default admin settings.
+# Kept as a plain dict so importing this module does not run model validation.
+DEFAULT_ADMIN_SETTINGS_DICT: dict = {
+    "system": {
+        "system_name": "AirClick Gesture Control",
+        "maintenance_mode": False,
+        "default_app_context": "GLOBAL"
+    },
+    "defaults": {
+        "default_cursor_speed": 1.0,
+        "default_gesture_sensitivity": 0.75,
+        "default_click_sensitivity": 0.08,
+        "default_smoothing_level": 1.0,
+        "default_dead_zone": 0.003,
+        "default_gesture_hold_time": 2.0
+    },
+    "gesture_system": {
+        "system_gesture_sensitivity": 0.75,
+        "gesture_collection_frames": 90,
+        "gesture_hold_time": 1.5,
+        "gesture_cooldown_duration": 1.0
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def default_admin_settings() -> AdminSettings:
+    """
+    Default AdminSettings, built on first use without validation.
+
+    The instance is cached and shared - treat it as read-only and call
+    model_copy(deep=True) before changing any field.
+    """
+    return AdminSettings.model_construct(**{
+        section: dict(values) for section, values in DEFAULT_ADMIN_SETTINGS_DICT.items()
+    })
@@ -1,22 +1,39 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
+from app.core.actions import AppContextName
 
 class LandmarkPoint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     x: float
     y: float
     z: float
 
 class Frame(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     timestamp: int
     landmarks: List[LandmarkPoint]
     handedness: Optional[str] = "Right"
     confidence: Optional[float] = 0.0
 
+@lru_cache(maxsize=None)
+def _frames_adapter() -> TypeAdapter:
+    """Build the List[Frame] validator once per process."""
+    return TypeAdapter(List[Frame])
+
+
+def dump_frames(frames: List[Frame]) -> List[Dict[str, Any]]:
+    """Convert Frame models back to plain dicts in a single pass."""
+    return _frames_adapter().dump_python(frames)
+
+
 class GestureCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     action: str = Field(..., min_length=1, max_length=50)
-    app_context: Optional[str] = "GLOBAL"
+    app_context: AppContextName = "GLOBAL"
     frames: List[Frame]
 
 class GestureResponse(BaseModel):
@@ -34,3 +51,26 @@ class GestureResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+    @classmethod
+    def from_orm_fast(cls, obj) -> "GestureResponse":
+        """
+        Build a response from a Gesture row without re-validating it.
+
+        Rows come straight from the database, so every column is already
+        typed; model_construct() skips the per-field validation pass that
+        model_validate() would run on each response.
+        """
+        return cls.model_construct(
+            id=obj.id,
+            user_id=obj.user_id,
+            name=obj.name,
+            action=obj.action,
+            app_context=obj.app_context,
+            accuracy_score=obj.accuracy_score,
+            match_count=obj.match_count if obj.match_count is not None else 0,
+            false_trigger_count=obj.false_trigger_count if obj.false_trigger_count is not None else 0,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+            landmark_data=obj.landmark_data,
+        )
@@ -5,92 +5,89 @@ These schemas define the structure of request/response data for settings endpoin
 Settings control cursor behavior, gesture sensitivity, and click detection.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional
+from typing_extensions import TypedDict
+from functools import lru_cache
 
 
-class CursorSettings(BaseModel):
+class CursorSettings(TypedDict, total=False):
     """
     Cursor control settings.
 
     Controls how hand movements translate to cursor movement.
     """
-    cursor_speed: float = Field(
-        default=1.0,
+    cursor_speed: Annotated[float, Field(
         ge=0.5,
         le=4.0,
         description="Cursor movement multiplier (0.5 = slow, 4.0 = fast). 1.0 = full camera view maps to full screen (optimal)"
-    )
-    smoothing_level: float = Field(
-        default=0.5,
+    )]
+    smoothing_level: Annotated[float, Field(
         ge=0.1,
         le=2.0,
         description="Cursor smoothing (0.1 = smooth/laggy, 2.0 = responsive/jittery)"
-    )
-    dead_zone: float = Field(
-        default=0.0,
+    )]
+    dead_zone: Annotated[float, Field(
         ge=0.0,
         le=0.1,
         description="Dead zone threshold (0.0 = none, 0.1 = large)"
-    )
-    cursor_enabled: bool = Field(
-        default=True,
+    )]
+    cursor_enabled: Annotated[bool, Field(
         description="Enable/disable cursor control"
-    )
+    )]
 
 
-class ClickSettings(BaseModel):
+class ClickSettings(TypedDict, total=False):
     """
     Click detection settings.
 
     Controls how pinch gestures are detected for clicking.
     """
-    click_sensitivity: float = Field(
-        default=0.08,
+    click_sensitivity: Annotated[float, Field(
         ge=0.03,
         le=0.15,
         description="Pinch threshold (0.03 = precise, 0.15 = easy)"
-    )
-    click_enabled: bool = Field(
-        default=True,
+    )]
+    click_enabled: Annotated[bool, Field(
         description="Enable/disable click detection"
-    )
+    )]
 
 
-class GestureSettings(BaseModel):
+class GestureSettings(TypedDict, total=False):
     """
     Gesture recognition settings.
 
     Controls how gestures are detected and matched.
     """
-    gesture_sensitivity: float = Field(
-        default=0.75,
+    gesture_sensitivity: Annotated[float, Field(
         ge=0.5,
         le=0.95,
         description="Matching threshold (0.5 = lenient, 0.95 = strict)"
-    )
-    gesture_hold_time: float = Field(
-        default=2.0,
+    )]
+    gesture_hold_time: Annotated[float, Field(
         ge=0.5,
         le=4.0,
         description="Time hand must be still before gesture starts collecting (seconds). Increased to 2.0 to prevent interference with cursor control"
-    )
+    )]
 
 
-class DisplaySettings(BaseModel):
+class DisplaySettings(TypedDict, total=False):
     """
     Display/visual feedback settings.
 
     Controls visual overlays and feedback.
     """
-    show_skeleton: bool = Field(
-        default=True,
+    show_skeleton: Annotated[bool, Field(
         description="Show hand skeleton overlay"
-    )
-    high_contrast: bool = Field(
-        default=False,
+    )]
+    high_contrast: Annotated[bool, Field(
         description="Enable high contrast mode for accessibility"
-    )
+    )]
+
+
+def _default_category(category: str):
+    """default_factory returning a fresh copy of one default settings category."""
+    return lambda: dict(DEFAULT_USER_SETTINGS_DICT[category])
 
 
 class UserSettings(BaseModel):
@@ -99,11 +96,15 @@ class UserSettings(BaseModel):
 
     Combines all settings categories into one object.
     Stored in user.accessibility_settings JSONB column.
+
+    Categories are TypedDicts (plain dicts at runtime), so validation checks
+    the bounds without building a model per category. Access values by key,
+    e.g. settings.cursor["cursor_speed"].
     """
-    cursor: CursorSettings = Field(default_factory=CursorSettings)
-    click: ClickSettings = Field(default_factory=ClickSettings)
-    gesture: GestureSettings = Field(default_factory=GestureSettings)
-    display: DisplaySettings = Field(default_factory=DisplaySettings)
+    cursor: CursorSettings = Field(default_factory=_default_category("cursor"))
+    click: ClickSettings = Field(default_factory=_default_category("click"))
+    gesture: GestureSettings = Field(default_factory=_default_category("gesture"))
+    display: DisplaySettings = Field(default_factory=_default_category("display"))
 
     class Config:
         from_attributes = True
@@ -115,6 +116,8 @@ class UserSettingsUpdate(BaseModel):
 
     All fields are optional - only provided fields will be updated.
     """
+    model_config = ConfigDict(defer_build=True)
+
     cursor: Optional[CursorSettings] = None
     click: Optional[ClickSettings] = None
     gesture: Optional[GestureSettings] = None
@@ -141,24 +144,39 @@ class UserSettingsUpdateResponse(BaseModel):
     )
 
 
-# Default settings for new users or reset
-DEFAULT_USER_SETTINGS = UserSettings(
-    cursor=CursorSettings(
-        cursor_speed=1.0,
-        smoothing_level=1.0,   # One Euro min_cutoff tuned for cursor stability
-        dead_zone=0.003,       # absorbs micro-tremors (~3px at 1080p)
-        cursor_enabled=True
-    ),
-    click=ClickSettings(
-        click_sensitivity=0.08,
-        click_enabled=True
-    ),
-    gesture=GestureSettings(
-        gesture_sensitivity=0.75,
-        gesture_hold_time=2.0  # Increased from 1.5 to prevent cursor-gesture interference
-    ),
-    display=DisplaySettings(
-        show_skeleton=True,
-        high_contrast=False
-    )
-)
+# Default settings for new users or reset.
+# Kept as a plain dict so importing this module does not run model validation;
+# the stored JSONB layout is exactly this shape.
+DEFAULT_USER_SETTINGS_DICT: dict = {
+    "cursor": {
+        "cursor_speed": 1.0,
+        "smoothing_level": 1.0,   # One Euro min_cutoff tuned for cursor stability
+        "dead_zone": 0.003,       # absorbs micro-tremors (~3px at 1080p)
+        "cursor_enabled": True
+    },
+    "click": {
+        "click_sensitivity": 0.08,
+        "click_enabled": True
+    },
+    "gesture": {
+        "gesture_sensitivity": 0.75,
+        "gesture_hold_time": 2.0  # Increased from 1.5 to prevent cursor-gesture interference
+    },
+    "display": {
+        "show_skeleton": True,
+        "high_contrast": False
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def default_user_settings() -> UserSettings:
+    """
+    Default UserSettings, built on first use without validation.
+
+    The instance is cached and shared - treat it as read-only and call
+    model_copy(deep=True) before changing any field.
+    """
+    return UserSettings.model_construct(**{
+        category: dict(values) for category, values in DEFAULT_USER_SETTINGS_DICT.items()
+    })
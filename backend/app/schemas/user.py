@@ -5,9 +5,24 @@ These schemas define the structure of request/response data for auth endpoints.
 They provide automatic validation, serialization, and documentation.
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, WithJsonSchema
+from typing import Annotated, Literal, Optional
 from datetime import datetime
+from email_validator import validate_email
+
+
+def _normalize_email(value: str) -> str:
+    """Syntax-check and normalize an email address (no DNS deliverability lookup)."""
+    # EmailNotValidError subclasses ValueError, so pydantic reports it as a field error
+    return validate_email(value, check_deliverability=False).normalized
+
+
+# Email address type for request schemas: same checks as EmailStr, bound once here
+Email = Annotated[
+    str,
+    AfterValidator(_normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"})
+]
 
 
 # ============================================
@@ -21,23 +36,16 @@ class UserCreate(BaseModel):
     Validates email format and enforces minimum password length.
     """
     full_name: Optional[str] = Field(None, max_length=255, description="Full name of the user")
-    email: EmailStr  # Automatically validates email format
+    email: Email  # Automatically validates email format
     password: str = Field(..., min_length=6, description="Password (minimum 6 characters)")
-    role: Optional[str] = Field(default="USER", description="User role: USER or ADMIN")
-
-    @validator("role")
-    def validate_role(cls, v):
-        """Ensure role is either USER or ADMIN"""
-        if v not in ["USER", "ADMIN"]:
-            raise ValueError("Role must be USER or ADMIN")
-        return v
+    role: Literal["USER", "ADMIN"] = Field(default="USER", description="User role: USER or ADMIN")
 
 
 class UserLogin(BaseModel):
     """
     Schema for user login with email and password.
     """
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -51,6 +59,8 @@ class GoogleAuthRequest(BaseModel):
 
     The frontend sends the authorization code received from Google's consent screen.
     """
+    model_config = ConfigDict(defer_build=True)
+
     code: str = Field(..., description="Authorization code from Google OAuth")
     state: Optional[str] = Field(None, description="CSRF protection token")
 
@@ -77,7 +87,9 @@ class ForgotPasswordRequest(BaseModel):
 
     User provides email to receive password reset link.
     """
-    email: EmailStr = Field(..., description="Email address to send reset link")
+    model_config = ConfigDict(defer_build=True)
+
+    email: Email = Field(..., description="Email address to send reset link")
 
 
 class ForgotPasswordResponse(BaseModel):
@@ -96,20 +108,11 @@ class ResetPasswordRequest(BaseModel):
 
     User provides the token from email and their new password.
     """
+    model_config = ConfigDict(defer_build=True)
+
     token: str = Field(..., description="Reset token from email link")
     new_password: str = Field(..., min_length=6, description="New password (minimum 6 characters)")
 
-    @validator("new_password")
-    def validate_password_strength(cls, v):
-        """Optional: Add password strength validation"""
-        if len(v) < 6:
-            raise ValueError("Password must be at least 6 characters")
-        # Add more validation rules if needed:
-        # - Must contain uppercase
-        # - Must contain number
-        # - Must contain special character
-        return v
-
 
 class ResetPasswordResponse(BaseModel):
     """
@@ -124,6 +127,8 @@ class VerifyResetTokenRequest(BaseModel):
 
     Frontend can call this before showing reset form to provide better UX.
     """
+    model_config = ConfigDict(defer_build=True)
+
     token: str
 
 
@@ -158,11 +163,32 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True  # Allows creation from SQLAlchemy models
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "UserResponse":
+        """
+        Build a response from a User row without re-validating it.
+
+        Uses model_construct() with an explicit field list, so no validation
+        runs and no columns beyond the public ones are read.
+        """
+        return cls.model_construct(
+            id=obj.id,
+            email=obj.email,
+            role=obj.role,
+            full_name=obj.full_name,
+            profile_picture=getattr(obj, "profile_picture", None),
+            oauth_provider=obj.oauth_provider,
+            email_verified=bool(obj.email_verified),
+            created_at=obj.created_at,
+        )
+
 
 class UserProfileUpdate(BaseModel):
     """
     Schema for updating user profile information.
     """
+    model_config = ConfigDict(defer_build=True)
+
     full_name: Optional[str] = Field(None, max_length=255)
     accessibility_settings: Optional[dict] = None
 
@@ -188,6 +214,8 @@ class TokenData(BaseModel):
 
     Used internally for token generation and validation.
     """
+    model_config = ConfigDict(frozen=True)
+
     user_id: int
     email: str
     role: str
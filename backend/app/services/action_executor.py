@@ -11,10 +11,13 @@ Project: AirClick FYP
 
 import logging
 import time
-from typing import List, Optional, Dict
-from app.core.actions import get_action_details, AppContext
-from app.core.database import get_db
+from functools import partial
+from threading import RLock
+from typing import Callable, List, Optional, Dict, Tuple
+from app.core.actions import ALL_ACTIONS, AppContext, AppContextName
+from app.core.database import SessionLocal
 from app.models.action_mapping import ActionMapping
+from app.services.keyboard_input import build_key_inputs, send_inputs
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,100 @@ except ImportError:
     PYGETWINDOW_AVAILABLE = False
     logger.warning("⚠ pygetwindow not installed. Window switching will be unavailable. Install with: pip install pygetwindow")
 
+# Active action mappings, loaded once and refreshed every ACTION_CACHE_TTL seconds.
+# action_id -> (name, keyboard_keys, compiled shortcut); plain values so nothing
+# is tied to a session.
+ACTION_CACHE_TTL = 60.0
+_action_cache: Dict[str, Tuple[str, List[str], Optional[Callable[[], None]]]] = {}
+_cache_loaded_at: float = 0.0
+_action_cache_lock = RLock()
+
+
+def compile_shortcut(keys: List[str]) -> Optional[Callable[[], None]]:
+    """
+    Bind a keyboard shortcut to the call that sends it.
+
+    Uses a prebuilt SendInput batch when possible (Windows, all keys known),
+    otherwise pyautogui.
+
+    Args:
+        keys: List of keys to press (e.g., ['ctrl', 'c'])
+
+    Returns:
+        Zero-argument callable that presses the shortcut, or None if the
+        shortcut is empty or no input backend is available
+    """
+    inputs = build_key_inputs(keys)
+    if inputs is not None:
+        return partial(send_inputs, inputs)
+
+    if not keys or not PYAUTOGUI_AVAILABLE:
+        return None
+    if len(keys) == 1:
+        return partial(pyautogui.press, keys[0])  # Single key press
+    return partial(pyautogui.hotkey, *keys)  # Multiple keys (hotkey combination)
+
+
+# Hardcoded fallback actions from actions.py, resolved once at import:
+# (context, action_id) -> (name, keyboard_keys, compiled shortcut)
+_FALLBACK_ACTION_TABLE: Dict[Tuple[str, str], Tuple[str, List[str], Optional[Callable[[], None]]]] = {
+    (app_context.value, action_id): (
+        details["name"],
+        details.get("keyboard_shortcut", []),
+        compile_shortcut(details.get("keyboard_shortcut", []))
+    )
+    for app_context, context_actions in ALL_ACTIONS.items()
+    for action_id, details in context_actions.items()
+}
+
+
+def _refresh_action_cache() -> None:
+    """Reload all active action mappings with a single query."""
+    global _action_cache, _cache_loaded_at
+
+    try:
+        with SessionLocal() as db:
+            mappings = ActionMapping.get_all_active(db)
+            _action_cache = {}
+            for m in mappings:
+                keys = list(m.keyboard_keys or [])
+                _action_cache[m.action_id] = (m.name, keys, compile_shortcut(keys))
+        logger.info(f"✓ Loaded {len(_action_cache)} active action mappings")
+    except Exception as e:
+        # Keep serving the previous snapshot; retry after the next TTL
+        logger.error(f"❌ Failed to load action mappings: {e}")
+    finally:
+        _cache_loaded_at = time.monotonic()
+
+
+def get_cached_action(action_id: str) -> Optional[Tuple[str, List[str], Optional[Callable[[], None]]]]:
+    """
+    Look up an active action mapping without touching the database.
+
+    Args:
+        action_id: The action identifier
+
+    Returns:
+        (name, keyboard_keys, compiled shortcut) tuple, or None if no active
+        mapping exists
+    """
+    with _action_cache_lock:
+        if not _cache_loaded_at or time.monotonic() - _cache_loaded_at > ACTION_CACHE_TTL:
+            _refresh_action_cache()
+        return _action_cache.get(action_id)
+
+
+def invalidate_action_cache() -> None:
+    """
+    Force the next action lookup to reload mappings from the database.
+    Call this after creating, updating or (de)activating an action mapping.
+    """
+    global _cache_loaded_at
+
+    with _action_cache_lock:
+        _cache_loaded_at = 0.0
+    logger.info("Action mapping cache invalidated")
+
 
 class ActionExecutor:
     """
@@ -44,27 +141,41 @@ class ActionExecutor:
 
     # Application window title patterns for detection
     # 🔥 CRITICAL FIX: Expanded patterns to catch more window title variations
+    # Stored lowercased so matching only lowercases each window title once
     APP_WINDOW_PATTERNS = {
-        "POWERPOINT": [
-            "PowerPoint",
-            "Microsoft PowerPoint",
+        "POWERPOINT": (
+            "powerpoint",
+            "microsoft powerpoint",
             ".pptx",
             ".ppt",
-            "Presentation",  # Added
-            "POWERPNT",  # Added: shortened version
-            "PPT"  # Added
-        ],
-        "WORD": [
-            "Word",
-            "Microsoft Word",
+            "presentation",  # Added
+            "powerpnt",  # Added: shortened version
+            "ppt"  # Added
+        ),
+        "WORD": (
+            "word",
+            "microsoft word",
             ".docx",
             ".doc",
-            "Document",  # Added
-            "WINWORD"  # Added: process name
-        ],
-        "GLOBAL": []  # Global actions don't need specific windows
+            "document",  # Added
+            "winword"  # Added: process name
+        ),
+        "GLOBAL": ()  # Global actions don't need specific windows
     }
 
+    # Shortest pattern per context - titles shorter than this can't match
+    _MIN_PATTERN_LENGTH = {
+        context: min((len(p) for p in patterns), default=0)
+        for context, patterns in APP_WINDOW_PATTERNS.items()
+    }
+
+    # How long a found window is reused before re-enumerating all windows (seconds)
+    WINDOW_CACHE_TTL = 2.0
+
+    # Focus polling: give up after FOCUS_TIMEOUT seconds, checking every FOCUS_POLL_INTERVAL
+    FOCUS_TIMEOUT = 0.3
+    FOCUS_POLL_INTERVAL = 0.01
+
     def __init__(self, simulation_mode: bool = False):
         """
         Initialize the action executor.
@@ -76,6 +187,9 @@ class ActionExecutor:
         self.simulation_mode = simulation_mode or not PYAUTOGUI_AVAILABLE
         self.window_switching_enabled = PYGETWINDOW_AVAILABLE
 
+        # context -> (found_at, window); avoids a full window enumeration per action
+        self._window_cache: Dict[str, Tuple[float, object]] = {}
+
         if self.simulation_mode:
             logger.warning("⚠️ Action executor in SIMULATION MODE - Actions will be logged but NOT executed")
             if not PYAUTOGUI_AVAILABLE:
@@ -84,7 +198,7 @@ class ActionExecutor:
             logger.info("✅ Action executor in ACTIVE MODE - Actions will be EXECUTED")
             # Configure pyautogui safety features
             pyautogui.FAILSAFE = True  # Move mouse to corner to abort
-            pyautogui.PAUSE = 0.1  # Small pause between actions
+            pyautogui.PAUSE = 0  # No per-call pause; focus is awaited explicitly in switch_to_window
 
         if not self.window_switching_enabled:
             logger.warning("⚠️ Window switching disabled - pygetwindow not available")
@@ -103,28 +217,41 @@ class ActionExecutor:
             return None
 
         try:
-            patterns = self.APP_WINDOW_PATTERNS.get(context, [])
+            patterns = self.APP_WINDOW_PATTERNS.get(context, ())
             if not patterns:
                 return None
+            min_length = self._MIN_PATTERN_LENGTH[context]
+
+            # Reuse the last window found for this context while it is fresh
+            # and its title still matches (the app may have closed the document)
+            cached = self._window_cache.get(context)
+            if cached is not None:
+                found_at, window = cached
+                if time.monotonic() - found_at < self.WINDOW_CACHE_TTL and self._title_matches(window, patterns, min_length):
+                    logger.debug("🔍 Using cached %s window: '%s'", context, window.title)
+                    return window
+                del self._window_cache[context]
 
             # Get all windows
             all_windows = gw.getAllWindows()
 
             # 🔥 CRITICAL FIX: Log all windows to help debug
-            logger.debug(f"🔍 Searching for {context} window...")
-            logger.debug(f"   Patterns to match: {patterns}")
-            window_titles = [w.title for w in all_windows if w.title]
-            logger.debug(f"   Available windows ({len(window_titles)}): {window_titles[:10]}")  # Log first 10
+            # (title list is only built when DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                window_titles = [w.title for w in all_windows if w.title]
+                logger.debug("🔍 Searching for %s window...", context)
+                logger.debug("   Patterns to match: %s", patterns)
+                logger.debug("   Available windows (%d): %s", len(window_titles), window_titles[:10])  # Log first 10
 
             # Search for matching window
             for window in all_windows:
-                if window.title:  # Skip windows without titles
-                    for pattern in patterns:
-                        if pattern.lower() in window.title.lower():
-                            logger.info(f"✅ Found {context} window: '{window.title}'")
-                            return window
+                if self._title_matches(window, patterns, min_length):
+                    logger.info("✅ Found %s window: '%s'", context, window.title)
+                    self._window_cache[context] = (time.monotonic(), window)
+                    return window
 
             # 🔥 CRITICAL FIX: Better error message with available windows
+            window_titles = [w.title for w in all_windows if w.title]
             logger.error(f"❌ No {context} window found!")
             logger.error(f"   Searched for patterns: {patterns}")
             logger.error(f"   Available windows: {window_titles[:5]}")  # Show first 5
@@ -135,6 +262,48 @@ class ActionExecutor:
             logger.error(f"❌ Error finding {context} window: {e}")
             return None
 
+    @staticmethod
+    def _title_matches(window: object, patterns: Tuple[str, ...], min_length: int = 0) -> bool:
+        """Check whether a window's title contains any of the given lowercase patterns."""
+        try:
+            title = window.title
+        except Exception:
+            return False  # Window handle no longer valid
+        if not title or len(title) < min_length:  # Skip untitled/too-short titles
+            return False
+        title_lower = title.lower()
+        return any(pattern in title_lower for pattern in patterns)
+
+    def invalidate_window_cache(self, context: Optional[str] = None):
+        """
+        Drop cached windows so the next lookup re-enumerates.
+
+        Args:
+            context: Context to invalidate, or None to clear all
+        """
+        if context is None:
+            self._window_cache.clear()
+        else:
+            self._window_cache.pop(context, None)
+
+    def _wait_until(self, condition) -> bool:
+        """
+        Poll condition() until it is true or FOCUS_TIMEOUT elapses.
+
+        Returns as soon as the OS reports the state change instead of
+        sleeping for a fixed worst-case delay.
+
+        Returns:
+            True if the condition became true in time
+        """
+        deadline = time.monotonic() + self.FOCUS_TIMEOUT
+        while True:
+            if condition():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.FOCUS_POLL_INTERVAL)
+
     def switch_to_window(self, window: object) -> bool:
         """
         Switch focus to a specific window.
@@ -152,13 +321,15 @@ class ActionExecutor:
             # Restore window if minimized
             if window.isMinimized:
                 window.restore()
-                time.sleep(0.2)  # Wait for restore animation
+                self._wait_until(lambda: not window.isMinimized)  # Wait for restore animation
 
             # Activate (bring to front and focus)
-            window.activate()
-            time.sleep(0.3)  # Wait for window to gain focus
+            if not window.isActive:
+                window.activate()
+                if not self._wait_until(lambda: window.isActive):
+                    logger.warning(f"⚠️ Window '{window.title}' did not report focus within {self.FOCUS_TIMEOUT}s")
 
-            logger.info(f"✅ Switched to window: '{window.title}'")
+            logger.info("✅ Switched to window: '%s'", window.title)
             return True
 
         except Exception as e:
@@ -199,6 +370,9 @@ class ActionExecutor:
 
         # Switch to the window
         success = self.switch_to_window(window)
+        if not success:
+            # Stale handle (window closed/recreated) - look it up fresh next time
+            self.invalidate_window_cache(context)
 
         if success:
             return {
@@ -213,42 +387,81 @@ class ActionExecutor:
                 "error": True
             }
 
-    def execute_keyboard_shortcut(self, keys: List[str]) -> bool:
+    @property
+    def simulation_mode(self) -> bool:
+        """If True, actions are logged but not executed."""
+        return self._simulation_mode
+
+    @simulation_mode.setter
+    def simulation_mode(self, enabled: bool):
+        # Rebind execute_keyboard_shortcut once per mode change so the
+        # per-call path has no simulation check
+        self._simulation_mode = enabled
+        self.execute_keyboard_shortcut = (
+            self._simulate_keyboard_shortcut if enabled else self._execute_keyboard_shortcut
+        )
+
+    def execute_keyboard_shortcut(
+        self,
+        keys: List[str],
+        compiled: Optional[Callable[[], None]] = None
+    ) -> bool:
         """
         Execute a keyboard shortcut.
 
+        Shadowed on each instance by _execute_keyboard_shortcut or
+        _simulate_keyboard_shortcut, whichever matches simulation_mode.
+
         Args:
             keys: List of keys to press (e.g., ['ctrl', 'c'])
+            compiled: Precompiled shortcut from compile_shortcut(keys), if cached
 
         Returns:
             True if execution was successful
         """
+        if self._simulation_mode:
+            return self._simulate_keyboard_shortcut(keys, compiled)
+        return self._execute_keyboard_shortcut(keys, compiled)
+
+    def _simulate_keyboard_shortcut(
+        self,
+        keys: List[str],
+        compiled: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """Log the shortcut instead of pressing it (simulation mode)."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[SIMULATION] Would execute shortcut: %s", " + ".join(keys))
+        return True
+
+    def _execute_keyboard_shortcut(
+        self,
+        keys: List[str],
+        compiled: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """Press the shortcut keys (active mode)."""
         try:
-            if self.simulation_mode:
-                logger.info(f"[SIMULATION] Would execute shortcut: {' + '.join(keys)}")
-                return True
-
-            # REAL EXECUTION - Actually press the keys
-            if len(keys) == 1:
-                # Single key press
-                pyautogui.press(keys[0])
-                logger.info(f"✅ EXECUTED: Pressed key '{keys[0]}'")
-            else:
-                # Multiple keys (hotkey combination)
-                pyautogui.hotkey(*keys)
-                logger.info(f"✅ EXECUTED: Hotkey {' + '.join(keys)}")
+            if compiled is None:
+                compiled = compile_shortcut(keys)
+            compiled()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ EXECUTED: %s", " + ".join(keys))
 
             return True
 
         except Exception as e:
-            logger.error(f"❌ ERROR executing keyboard shortcut {keys}: {e}")
+            logger.error("❌ ERROR executing keyboard shortcut %s: %s", keys, e)
             return False
 
-    def execute_action(self, action_id: str, context: str) -> Dict:
+    def execute_action(self, action_id: str, context: AppContextName) -> Dict:
         """
         Execute an action by its ID and context.
         Automatically switches to the correct application window before executing.
 
+        This call blocks while it waits for window focus and sends keys, so it
+        must run off the event loop: from sync (def) routes, which FastAPI runs
+        in its threadpool, or from the hand tracking thread. An async caller
+        should use asyncio.to_thread(executor.execute_action, ...).
+
         Args:
             action_id: The action identifier
             context: The application context (POWERPOINT, WORD, GLOBAL)
@@ -257,40 +470,33 @@ class ActionExecutor:
             Dictionary with execution result
         """
         try:
-            # Get database session
-            db = next(get_db())
-
-            try:
-                # First, try to get action from database (NEW: Dynamic actions)
-                action_mapping = ActionMapping.get_by_action_id(db, action_id)
-
-                if action_mapping and action_mapping.is_active:
-                    # Use action from database
-                    action_name = action_mapping.name
-                    keyboard_shortcut = action_mapping.keyboard_keys
-                    logger.info(f"✓ Using action from database: {action_id}")
-                else:
-                    # Fallback to hardcoded actions from actions.py (DEPRECATED)
-                    logger.warning(f"⚠ Action '{action_id}' not in database, using fallback from actions.py")
-                    app_context = AppContext(context)
-                    action_details = get_action_details(action_id, app_context)
-
-                    if not action_details:
-                        return {
-                            "success": False,
-                            "error": f"Action '{action_id}' not found in database or fallback"
-                        }
-
-                    action_name = action_details.get("name")
-                    keyboard_shortcut = action_details.get("keyboard_shortcut", [])
-
-                if not keyboard_shortcut:
+            # First, try the action from the database (NEW: Dynamic actions),
+            # served from the in-memory mapping cache
+            cached_action = get_cached_action(action_id)
+
+            compiled_shortcut = None
+            if cached_action:
+                action_name, keyboard_shortcut, compiled_shortcut = cached_action
+                logger.info("✓ Using action from database: %s", action_id)
+            else:
+                # Fallback to hardcoded actions from actions.py (DEPRECATED)
+                logger.warning("⚠ Action '%s' not in database, using fallback from actions.py", action_id)
+                fallback_action = _FALLBACK_ACTION_TABLE.get((context, action_id))
+
+                if not fallback_action:
+                    AppContext(context)  # Raises ValueError for an invalid context
                     return {
                         "success": False,
-                        "error": f"No keyboard shortcut defined for action '{action_id}'"
+                        "error": f"Action '{action_id}' not found in database or fallback"
                     }
-            finally:
-                db.close()
+
+                action_name, keyboard_shortcut, compiled_shortcut = fallback_action
+
+            if not keyboard_shortcut:
+                return {
+                    "success": False,
+                    "error": f"No keyboard shortcut defined for action '{action_id}'"
+                }
 
             # CRITICAL: Ensure correct app is focused before executing
             focus_result = self.ensure_app_focused(context)
@@ -308,12 +514,12 @@ class ActionExecutor:
 
             # Log window switching status
             if focus_result.get("switched"):
-                logger.info(f"✅ Switched to {context}: '{focus_result.get('window_title')}'")
+                logger.info("✅ Switched to %s: '%s'", context, focus_result.get("window_title"))
             else:
-                logger.info(f"ℹ️ {focus_result.get('reason')}")
+                logger.info("ℹ️ %s", focus_result.get("reason"))
 
             # Execute the shortcut
-            success = self.execute_keyboard_shortcut(keyboard_shortcut)
+            success = self.execute_keyboard_shortcut(keyboard_shortcut, compiled_shortcut)
 
             result = {
                 "success": success,
@@ -13,7 +13,7 @@ import json
 import os
 import logging
 
-from app.schemas.admin_settings import AdminSettings, DEFAULT_ADMIN_SETTINGS
+from app.schemas.admin_settings import AdminSettings, DEFAULT_ADMIN_SETTINGS_DICT, default_admin_settings
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,7 @@ def load_admin_settings() -> AdminSettings:
     """
     Load admin settings from file, merged on top of schema defaults.
 
-    Merging means any field added to DEFAULT_ADMIN_SETTINGS after the file
+    Merging means any field added to DEFAULT_ADMIN_SETTINGS_DICT after the file
     was last saved will automatically get its correct default value instead
     of being missing or carrying a stale value from the old file.
     """
@@ -36,7 +36,7 @@ def load_admin_settings() -> AdminSettings:
 
             # Start from schema defaults, then overlay whatever the file has.
             # This ensures new fields introduced in the schema are never missing.
-            merged = DEFAULT_ADMIN_SETTINGS.model_dump()
+            merged = {section: dict(values) for section, values in DEFAULT_ADMIN_SETTINGS_DICT.items()}
             for section, values in data.items():
                 if section in merged and isinstance(values, dict):
                     merged[section].update(values)
@@ -47,7 +47,7 @@ def load_admin_settings() -> AdminSettings:
     except Exception as e:
         logger.warning(f"Error loading admin settings: {e}")
 
-    return DEFAULT_ADMIN_SETTINGS.model_copy()
+    return default_admin_settings().model_copy(deep=True)
 
 
 def save_admin_settings(settings: AdminSettings) -> bool:
@@ -72,48 +72,33 @@ def apply_admin_settings_to_runtime(settings: AdminSettings) -> bool:
         from app.services.gesture_matcher import get_gesture_matcher
         from app.services.hybrid_state_machine import get_hybrid_state_machine
         from app.services.cursor_controller import get_cursor_controller
-        from app.services.temporal_smoothing import OneEuroFilter
 
         # Apply gesture system settings
         gesture_matcher = get_gesture_matcher()
-        gesture_matcher.similarity_threshold = settings.gesture_system.system_gesture_sensitivity
+        gesture_matcher.similarity_threshold = settings.gesture_system["system_gesture_sensitivity"]
 
         state_machine = get_hybrid_state_machine()
-        state_machine.stationary_duration_threshold = settings.gesture_system.gesture_hold_time
-        state_machine.collection_frame_count = settings.gesture_system.gesture_collection_frames
-        state_machine.idle_cooldown_duration = settings.gesture_system.gesture_cooldown_duration
+        state_machine.stationary_duration_threshold = settings.gesture_system["gesture_hold_time"]
+        state_machine.collection_frame_count = settings.gesture_system["gesture_collection_frames"]
+        state_machine.idle_cooldown_duration = settings.gesture_system["gesture_cooldown_duration"]
 
         # Apply admin cursor defaults to the running cursor controller so changes
         # take effect immediately without requiring a user settings save.
         cursor_controller = get_cursor_controller()
-        cursor_controller.movement_scale = settings.defaults.default_cursor_speed
+        cursor_controller.movement_scale = settings.defaults["default_cursor_speed"]
 
-        cursor_controller.dead_zone_threshold = settings.defaults.default_dead_zone
+        cursor_controller.dead_zone_threshold = settings.defaults["default_dead_zone"]
         # Note: _dz_min/_dz_max are internal to the adaptive dead zone system
         # and must not be overwritten from the user-facing dead_zone value.
 
-        if hasattr(cursor_controller, 'filter_x') and cursor_controller.filter_x is not None:
-            cursor_controller.filter_x.min_cutoff = settings.defaults.default_smoothing_level
-            cursor_controller.filter_y.min_cutoff = settings.defaults.default_smoothing_level
-        else:
-            cursor_controller.filter_x = OneEuroFilter(
-                min_cutoff=settings.defaults.default_smoothing_level,
-                beta=0.009,
-                d_cutoff=1.0
-            )
-            cursor_controller.filter_y = OneEuroFilter(
-                min_cutoff=settings.defaults.default_smoothing_level,
-                beta=0.009,
-                d_cutoff=1.0
-            )
-            cursor_controller.smoothing_enabled = True
+        cursor_controller.set_smoothing_level(settings.defaults["default_smoothing_level"])
 
         logger.info(
             f"Applied admin settings to runtime: "
-            f"gesture_threshold={settings.gesture_system.system_gesture_sensitivity}, "
-            f"cursor_speed={settings.defaults.default_cursor_speed}, "
-            f"smoothing={settings.defaults.default_smoothing_level}, "
-            f"dead_zone={settings.defaults.default_dead_zone}"
+            f"gesture_threshold={settings.gesture_system['system_gesture_sensitivity']}, "
+            f"cursor_speed={settings.defaults['default_cursor_speed']}, "
+            f"smoothing={settings.defaults['default_smoothing_level']}, "
+            f"dead_zone={settings.defaults['default_dead_zone']}"
         )
         return True
 
@@ -19,10 +19,31 @@ Project: AirClick FYP
 
 import numpy as np
 import logging
-from typing import Dict, List, Tuple, Optional
-from app.services.temporal_smoothing import OneEuroFilter
+import threading
+from array import array
+from functools import partial
+from typing import Callable, Dict, List, Tuple, Optional, Union
+from app.services.temporal_smoothing import one_euro_step
+from app.services.cursor_kernel import dead_zone_and_map, screen_map
 import time
 
+# Slots in CursorController._stats (counters kept as doubles in a flat array)
+_STAT_TOTAL = 0
+_STAT_OK = 1
+_STAT_FAIL = 2
+_STAT_LATENCY = 3  # Sum of update latencies (ms)
+
+# Shared status-only results for update_cursor's non-verbose frames, one per
+# (success, cursor_enabled, moved) combination, so the common frame allocates
+# nothing for its return value. Plain dicts (they are JSON-serialized
+# downstream) - callers must treat them as read-only.
+_STATUS_RESULTS = {
+    (success, enabled, moved): {'success': success, 'cursor_enabled': enabled, 'moved': moved}
+    for success in (False, True)
+    for enabled in (False, True)
+    for moved in (False, True)
+}
+
 # Platform-specific cursor control
 try:
     import ctypes
@@ -47,6 +68,12 @@ class CursorController:
         Hand Landmarks → Extract Index Tip → Smooth → Map to Screen → Move Cursor
     """
 
+    # Squared pixel distance that counts as intentional cursor movement (30px)
+    MOVE_THRESHOLD_SQ = 30.0 * 30.0
+
+    # Include position/latency/stats in update_cursor's result every N frames
+    VERBOSE_RESULT_INTERVAL = 30
+
     def __init__(
         self,
         screen_width: Optional[int] = None,
@@ -88,21 +115,19 @@ class CursorController:
         self.movement_scale = movement_scale
         self.use_fast_api = use_fast_api and CTYPES_AVAILABLE
 
-        # Initialize One Euro Filters for X and Y coordinates.
+        # One Euro Filter parameters. Filter state is kept as plain scalars and
+        # advanced with the compiled one_euro_step kernel - no filter objects.
         # min_cutoff can be lower now because the Median+EMA pipeline upstream
         # already removed most noise — the One Euro Filter only needs to handle
         # residual velocity-dependent lag, not raw landmark noise.
+        self._oef_min_cutoff = 1.0  # slightly higher than 0.8 = a touch more responsive
+        self._oef_beta = 0.009
+        self._oef_d_cutoff = 1.0
+        # Per-axis (x_prev, dx_prev) and the shared timestamp (None = no sample yet)
+        self._oef_state_x = (0.0, 0.0)
+        self._oef_state_y = (0.0, 0.0)
+        self._oef_t_prev: Optional[float] = None
         if self.smoothing_enabled:
-            self.filter_x = OneEuroFilter(
-                min_cutoff=1.0,  # slightly higher than 0.8 = a touch more responsive
-                beta=0.009,
-                d_cutoff=1.0
-            )
-            self.filter_y = OneEuroFilter(
-                min_cutoff=1.0,
-                beta=0.009,
-                d_cutoff=1.0
-            )
             logger.info("One Euro Filter smoothing enabled (cursor-tuned mode)")
 
         # EMA pre-filter state (runs before One Euro Filter)
@@ -110,11 +135,13 @@ class CursorController:
         self._ema_y: Optional[float] = None
         self._ema_alpha = 0.65  # 65% new / 35% history — slightly more responsive
 
-        # Median pre-filter: ring buffer of last 3 raw samples per axis
+        # Median pre-filter: ring buffers of the last 3 raw samples per axis
         # Window of 3 removes landmark flicker with only 1-frame lag instead of 2
-        self._median_buf_x: List[float] = []
-        self._median_buf_y: List[float] = []
         self._median_window = 3
+        self._median_buf_x = [0.0] * self._median_window
+        self._median_buf_y = [0.0] * self._median_window
+        self._median_count = 0
+        self._median_index = 0
 
         # Velocity-based adaptive dead zone state
         self._prev_smoothed_x: Optional[float] = None
@@ -128,14 +155,20 @@ class CursorController:
         # State tracking
         self.last_position = None
         self.last_screen_position = None
+
+        # Coalesced cursor writes: move_cursor only records the latest target and
+        # a background thread applies it at most once per flush interval, so
+        # bursts of frames cost one OS cursor call per tick instead of one each.
+        self._flush_interval = 1.0 / 120  # ~8ms, faster than a 60Hz display refresh
+        self._pending_position: Optional[Tuple[int, int]] = None
+        self._flushed_position: Optional[Tuple[int, int]] = None
+        self._flush_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
         self.cursor_enabled = True  # Enable by default (will be controlled by hybrid mode)
-        self.performance_stats = {
-            'total_updates': 0,
-            'successful_updates': 0,
-            'failed_updates': 0,
-            'avg_latency_ms': 0.0,
-            'total_latency': 0.0
-        }
+        self._frame_counter = 0
+        # Per-frame counters indexed by the _STAT_* slots; the stats dict
+        # (including avg_latency_ms) is built from them on demand
+        self._stats = array('d', [0.0, 0.0, 0.0, 0.0])
 
         # Cursor control method
         if PYAUTOGUI_AVAILABLE:
@@ -144,6 +177,36 @@ class CursorController:
             pyautogui.PAUSE = 0  # No pause between actions
             logger.info("PyAutoGUI configured for cursor control")
 
+        # Bind the cursor backend once so each write is a single call with no
+        # attribute chain or backend check (None = no backend available)
+        self._write_cursor_position: Optional[Callable[[int, int], object]] = None
+        # GetCursorPos readback (ctypes path only) for the "moved" check, so it
+        # sees the real cursor even if the physical mouse moved it
+        self._get_cursor_pos = None
+        self._cursor_point = None
+        self._cursor_point_ref = None
+        if self.use_fast_api:
+            try:
+                from ctypes import wintypes
+
+                user32 = ctypes.windll.user32
+                set_cursor_pos = user32.SetCursorPos
+                set_cursor_pos.argtypes = (ctypes.c_int, ctypes.c_int)
+                set_cursor_pos.restype = ctypes.c_int
+                self._write_cursor_position = set_cursor_pos
+
+                get_cursor_pos = user32.GetCursorPos
+                get_cursor_pos.argtypes = (ctypes.POINTER(wintypes.POINT),)
+                get_cursor_pos.restype = wintypes.BOOL
+                self._get_cursor_pos = get_cursor_pos
+                self._cursor_point = wintypes.POINT()
+                self._cursor_point_ref = ctypes.byref(self._cursor_point)
+            except AttributeError:
+                # ctypes.windll only exists on Windows
+                self.use_fast_api = False
+        if self._write_cursor_position is None and PYAUTOGUI_AVAILABLE:
+            self._write_cursor_position = partial(pyautogui.moveTo, duration=0, _pause=False)
+
         if self.use_fast_api:
             logger.info("Using ctypes (fast) for cursor control")
         elif PYAUTOGUI_AVAILABLE:
@@ -151,22 +214,36 @@ class CursorController:
         else:
             logger.warning("No cursor control library available - cursor will not move!")
 
-    def extract_index_finger_tip(self, hand_landmarks: List[Dict]) -> Optional[Tuple[float, float, float]]:
+    def extract_index_finger_tip(
+        self,
+        hand_landmarks: Union[np.ndarray, List[Dict]]
+    ) -> Optional[Tuple[float, float, float]]:
         """
         Extract the index finger tip position from hand landmarks.
 
         Args:
-            hand_landmarks: List of 21 hand landmarks from MediaPipe
+            hand_landmarks: (21, 3) landmark array, or list of 21 hand landmark
+                dicts from MediaPipe
 
         Returns:
             Tuple of (x, y, z) coordinates in normalized space (0-1), or None if invalid
         """
-        if not hand_landmarks or len(hand_landmarks) < 9:
+        if hand_landmarks is None or len(hand_landmarks) < 9:
             return None
 
         # Fix 5: Blend index tip (#8) with its middle joint (#7) — the joint is
         # mechanically more stable than the tip, so weighting it 20% reduces
         # high-frequency tip jitter without shifting the tracking point noticeably.
+        if isinstance(hand_landmarks, np.ndarray):
+            # Packed array: two contiguous rows, no per-coordinate dict lookups
+            tip_x, tip_y, tip_z = hand_landmarks[8].tolist()
+            joint_x, joint_y, joint_z = hand_landmarks[7].tolist()
+            return (
+                tip_x * 0.8 + joint_x * 0.2,
+                tip_y * 0.8 + joint_y * 0.2,
+                tip_z * 0.8 + joint_z * 0.2
+            )
+
         tip = hand_landmarks[8]
         joint = hand_landmarks[7]
         x = tip['x'] * 0.8 + joint['x'] * 0.2
@@ -182,6 +259,9 @@ class CursorController:
         Stage 1 (Median): eliminates landmark flicker/impulse spikes from MediaPipe.
         Stage 2 (EMA): smooths the median output before the adaptive filter sees it.
         Stage 3 (One Euro): speed-adaptive filter — jitter-free at rest, responsive when moving.
+
+        Every stage works on plain floats per axis; at two values per frame,
+        NumPy arrays would only add allocations.
         """
         if not self.smoothing_enabled:
             return (x, y)
@@ -189,35 +269,62 @@ class CursorController:
         try:
             # Stage 1: Median filter over last N raw samples — best technique
             # for eliminating MediaPipe's occasional landmark position jumps.
-            self._median_buf_x.append(x)
-            self._median_buf_y.append(y)
-            if len(self._median_buf_x) > self._median_window:
-                self._median_buf_x.pop(0)
-                self._median_buf_y.pop(0)
-
-            buf_x = sorted(self._median_buf_x)
-            buf_y = sorted(self._median_buf_y)
-            mid = len(buf_x) // 2
-            med_x = buf_x[mid]
-            med_y = buf_y[mid]
+            index = self._median_index
+            self._median_buf_x[index] = x
+            self._median_buf_y[index] = y
+            self._median_index = (index + 1) % self._median_window
+            if self._median_count < self._median_window:
+                self._median_count += 1
+            count = self._median_count
+            med_x = sorted(self._median_buf_x[:count])[count // 2]
+            med_y = sorted(self._median_buf_y[:count])[count // 2]
 
             # Stage 2: EMA on median output — smooths the median's own staircase
             # artifact (median output is piecewise-constant; EMA softens transitions).
             if self._ema_x is None:
-                self._ema_x = med_x
-                self._ema_y = med_y
+                self._ema_x, self._ema_y = med_x, med_y
             else:
-                self._ema_x = self._ema_alpha * med_x + (1.0 - self._ema_alpha) * self._ema_x
-                self._ema_y = self._ema_alpha * med_y + (1.0 - self._ema_alpha) * self._ema_y
+                alpha = self._ema_alpha
+                self._ema_x = alpha * med_x + (1.0 - alpha) * self._ema_x
+                self._ema_y = alpha * med_y + (1.0 - alpha) * self._ema_y
 
             # Stage 3: One Euro Filter — adaptive cutoff based on velocity.
-            smoothed_x = self.filter_x(self._ema_x, timestamp)
-            smoothed_y = self.filter_y(self._ema_y, timestamp)
-            return (smoothed_x, smoothed_y)
+            ema_x, ema_y = self._ema_x, self._ema_y
+            if self._oef_t_prev is None:
+                self._oef_state_x = (ema_x, 0.0)
+                self._oef_state_y = (ema_y, 0.0)
+                self._oef_t_prev = timestamp
+                return (ema_x, ema_y)
+
+            dt = timestamp - self._oef_t_prev
+            if dt > 0:
+                self._oef_state_x = one_euro_step(
+                    ema_x, self._oef_state_x[0], self._oef_state_x[1], dt,
+                    self._oef_min_cutoff, self._oef_beta, self._oef_d_cutoff
+                )
+                self._oef_state_y = one_euro_step(
+                    ema_y, self._oef_state_y[0], self._oef_state_y[1], dt,
+                    self._oef_min_cutoff, self._oef_beta, self._oef_d_cutoff
+                )
+                self._oef_t_prev = timestamp
+            # dt <= 0: no time passed, previous filtered value is returned
+            return (self._oef_state_x[0], self._oef_state_y[0])
         except Exception as e:
-            logger.error(f"Smoothing error: {e}")
+            logger.error("Smoothing error: %s", e)
             return (x, y)
 
+    def set_smoothing_level(self, min_cutoff: float):
+        """
+        Set the One Euro Filter min_cutoff, enabling smoothing if it was off.
+
+        Args:
+            min_cutoff: Minimum cutoff frequency (Hz); lower = smoother at rest
+        """
+        self._oef_min_cutoff = min_cutoff
+        if not self.smoothing_enabled:
+            self.smoothing_enabled = True
+            logger.info("Initialized cursor smoothing filter")
+
     def apply_dead_zone(self, new_x: float, new_y: float, timestamp: Optional[float] = None) -> Tuple[float, float]:
         """
         Velocity-adaptive dead zone: expands when hand is still, shrinks when moving.
@@ -227,40 +334,52 @@ class CursorController:
         velocity after smoothing and scales the dead zone inversely, giving maximum
         stability at rest and full precision during fast movement.
         """
+        filtered_x, filtered_y, _, _ = self._dead_zone_and_map(new_x, new_y, timestamp)
+        return (filtered_x, filtered_y)
+
+    def _dead_zone_and_map(self, new_x: float, new_y: float,
+                           timestamp: Optional[float]) -> Tuple[float, float, int, int]:
+        """
+        Apply the adaptive dead zone and map the result to screen pixels.
+
+        Keeps the dead zone state here and runs the arithmetic as one compiled
+        kernel call (see cursor_kernel.dead_zone_and_map).
+
+        Returns:
+            (filtered_x, filtered_y, screen_x, screen_y)
+        """
         if self.last_position is None:
             self.last_position = (new_x, new_y)
             self._prev_smoothed_x = new_x
             self._prev_smoothed_y = new_y
             self._prev_smooth_time = timestamp
-            return (new_x, new_y)
+            screen_x, screen_y = self.map_to_screen(new_x, new_y)
+            return (new_x, new_y, screen_x, screen_y)
 
         last_x, last_y = self.last_position
 
-        # Compute current velocity (normalized units/sec) to pick dead zone size.
-        velocity = 0.0
+        # Velocity needs a previous sample and timestamp; dt <= 0 means "unknown"
+        dt = -1.0
+        prev_x, prev_y = new_x, new_y
         if (timestamp is not None and self._prev_smooth_time is not None
                 and self._prev_smoothed_x is not None):
             dt = timestamp - self._prev_smooth_time
-            if dt > 0:
-                dx = new_x - self._prev_smoothed_x
-                dy = new_y - self._prev_smoothed_y
-                velocity = (dx * dx + dy * dy) ** 0.5 / dt
+            prev_x, prev_y = self._prev_smoothed_x, self._prev_smoothed_y
 
-        # Dead zone shrinks as velocity rises — fast movement gets near-zero dead zone.
-        adaptive_dz = max(self._dz_min, self._dz_max - velocity * self._velocity_scale)
+        filtered_x, filtered_y, screen_x, screen_y = dead_zone_and_map(
+            float(new_x), float(new_y), float(last_x), float(last_y),
+            float(prev_x), float(prev_y), float(dt),
+            self._dz_min, self._dz_max, self._velocity_scale,
+            float(self.movement_scale), int(self.screen_width), int(self.screen_height)
+        )
 
         # Update velocity tracking state.
         self._prev_smoothed_x = new_x
         self._prev_smoothed_y = new_y
         self._prev_smooth_time = timestamp
+        self.last_position = (filtered_x, filtered_y)
 
-        # Squared comparison avoids sqrt — same result, cheaper.
-        dx = new_x - last_x
-        dy = new_y - last_y
-        if dx * dx + dy * dy > adaptive_dz * adaptive_dz:
-            self.last_position = (new_x, new_y)
-            return (new_x, new_y)
-        return (last_x, last_y)
+        return (filtered_x, filtered_y, screen_x, screen_y)
 
     def map_to_screen(self, hand_x: float, hand_y: float) -> Tuple[int, int]:
         """
@@ -279,26 +398,17 @@ class CursorController:
 
         # Apply movement scaling for better control
         # User moves hand 50% → cursor moves 100% (scale=2.0)
-        center_x = (hand_x - 0.5) * self.movement_scale + 0.5
-        center_y = (hand_y - 0.5) * self.movement_scale + 0.5
-
-        # Clamp to valid range [0, 1]
-        center_x = max(0.0, min(1.0, center_x))
-        center_y = max(0.0, min(1.0, center_y))
-
-        # Convert to screen pixels
-        screen_x = int(center_x * self.screen_width)
-        screen_y = int(center_y * self.screen_height)
-
-        # Ensure within screen bounds
-        screen_x = max(0, min(self.screen_width - 1, screen_x))
-        screen_y = max(0, min(self.screen_height - 1, screen_y))
-
-        return (screen_x, screen_y)
+        return screen_map(
+            float(hand_x), float(hand_y), float(self.movement_scale),
+            int(self.screen_width), int(self.screen_height)
+        )
 
     def move_cursor(self, screen_x: int, screen_y: int) -> bool:
         """
-        Move the system cursor to the specified screen position.
+        Queue a move of the system cursor to the specified screen position.
+
+        The position is applied by the flush thread within one flush interval;
+        call flush() when the cursor must be in place immediately (e.g. clicks).
 
         Args:
             screen_x: Target X coordinate in pixels
@@ -307,48 +417,91 @@ class CursorController:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Fix 4: Pixel-level dead zone — skip the syscall entirely if the cursor
-            # hasn't moved more than 2px. Eliminates sub-pixel jitter that survives
-            # smoothing and causes the cursor to vibrate in place.
-            if self.last_screen_position is not None:
-                dx = screen_x - self.last_screen_position[0]
-                dy = screen_y - self.last_screen_position[1]
-                if dx * dx + dy * dy < 4:  # 2² = 4, avoids sqrt()
-                    return True  # Consider it a success — position unchanged intentionally
-
-            if self.use_fast_api and CTYPES_AVAILABLE:
-                ctypes.windll.user32.SetCursorPos(screen_x, screen_y)
-            elif PYAUTOGUI_AVAILABLE:
-                pyautogui.moveTo(screen_x, screen_y, duration=0, _pause=False)
-            else:
-                return False
+        if self._write_cursor_position is None:
+            return False
 
-            self.last_screen_position = (screen_x, screen_y)
-            return True
+        # Fix 4: Pixel-level dead zone — skip the syscall entirely if the cursor
+        # hasn't moved more than 2px. Eliminates sub-pixel jitter that survives
+        # smoothing and causes the cursor to vibrate in place.
+        if self.last_screen_position is not None:
+            dx = screen_x - self.last_screen_position[0]
+            dy = screen_y - self.last_screen_position[1]
+            if dx * dx + dy * dy < 4:  # 2² = 4, avoids sqrt()
+                return True  # Consider it a success — position unchanged intentionally
 
-        except Exception as e:
-            logger.error(f"Error moving cursor: {e}")
-            return False
+        self._pending_position = (screen_x, screen_y)
+        self.last_screen_position = (screen_x, screen_y)
+
+        if self._flush_thread is None:
+            self._start_flush_thread()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Apply the latest queued cursor position now, if it hasn't been applied yet.
+
+        Returns:
+            True if the cursor is at the latest queued position, False on error
+        """
+        with self._flush_lock:
+            position = self._pending_position
+            if position is None or position == self._flushed_position:
+                return True
+            try:
+                self._write_cursor_position(position[0], position[1])
+                return True
+            except Exception as e:
+                logger.error("Error moving cursor: %s", e)
+                return False
+            finally:
+                # Don't retry a failed position every tick; the next frame queues a new one
+                self._flushed_position = position
+
+    def _start_flush_thread(self):
+        """Start the daemon thread that applies queued cursor positions."""
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            name="cursor-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+        logger.info(f"Cursor flush thread started ({1.0 / self._flush_interval:.0f} Hz)")
+
+    def _flush_loop(self):
+        """Apply the most recent queued position once per flush interval."""
+        while True:
+            time.sleep(self._flush_interval)
+            self.flush()
 
-    def update_cursor(self, hand_landmarks: List[Dict]) -> Dict:
+    def update_cursor(self, hand_landmarks: Union[np.ndarray, List[Dict]],
+                      verbose: bool = False) -> Dict:
         """
         Main update loop: extract hand position, smooth, map, and move cursor.
 
         Args:
-            hand_landmarks: List of 21 hand landmarks from MediaPipe
+            hand_landmarks: (21, 3) landmark array, or list of 21 hand landmark
+                dicts from MediaPipe
+            verbose: Always include hand_position, latency_ms and stats in the
+                result (otherwise only every VERBOSE_RESULT_INTERVAL frames)
 
         Returns:
-            Dictionary with update status and performance metrics
+            Dictionary with update status (success, cursor_enabled, moved).
+            Non-verbose frames return a shared dict that must not be
+            modified; verbose frames return a new dict that also carries
+            screen_position, hand_position, latency_ms and stats.
         """
-        start_time = time.time()
-        self.performance_stats['total_updates'] += 1
+        # One monotonic clock sample per frame: drives the smoothing timestamp
+        # (seconds) and the latency measurement, immune to wall-clock jumps
+        start_ns = time.perf_counter_ns()
+        timestamp = start_ns * 1e-9
+        stats = self._stats
+        stats[_STAT_TOTAL] += 1
 
         # Extract index finger tip
         tip_coords = self.extract_index_finger_tip(hand_landmarks)
 
         if tip_coords is None:
-            self.performance_stats['failed_updates'] += 1
+            stats[_STAT_FAIL] += 1
             return {
                 'success': False,
                 'error': 'Invalid hand landmarks',
@@ -358,27 +511,35 @@ class CursorController:
         hand_x, hand_y, hand_z = tip_coords
 
         # Apply smoothing
-        timestamp = time.time()
         smoothed_x, smoothed_y = self.apply_smoothing(hand_x, hand_y, timestamp)
 
-        # Apply velocity-adaptive dead zone filtering
-        filtered_x, filtered_y = self.apply_dead_zone(smoothed_x, smoothed_y, timestamp)
-
-        # Map to screen coordinates
-        screen_x, screen_y = self.map_to_screen(filtered_x, filtered_y)
+        # Apply velocity-adaptive dead zone filtering and map to screen coordinates
+        # (one fused kernel call)
+        filtered_x, filtered_y, screen_x, screen_y = self._dead_zone_and_map(
+            smoothed_x, smoothed_y, timestamp
+        )
 
         # PHASE 4 FIX: Detect if cursor actually moved (for gesture collection guard)
         # Check if cursor moved more than a minimum threshold
         # IMPORTANT: High threshold (30px) to ignore hand jitter and only count intentional cursor movements
         cursor_moved = False
         if self.last_screen_position is not None:
-            movement_distance = np.sqrt(
-                (screen_x - self.last_screen_position[0])**2 +
-                (screen_y - self.last_screen_position[1])**2
-            )
+            # Compare against the latest target we queued. The OS cursor trails
+            # it by up to one flush tick (plus move_cursor's 2px skip), so it
+            # is only used when it isn't where the flush thread last put it,
+            # i.e. something else (the physical mouse) moved it
+            ref_x, ref_y = self.last_screen_position
+            if self._get_cursor_pos is not None:
+                with self._flush_lock:
+                    if (self._get_cursor_pos(self._cursor_point_ref)
+                            and (self._cursor_point.x, self._cursor_point.y) != self._flushed_position):
+                        ref_x, ref_y = self._cursor_point.x, self._cursor_point.y
+            dx = screen_x - ref_x
+            dy = screen_y - ref_y
             # Consider movement if cursor moved more than 30 pixels (significant intentional movement)
             # This ignores small jitter/tremor that happens during gestures
-            cursor_moved = movement_distance > 30.0
+            # Squared comparison on plain ints - no sqrt or NumPy scalar per frame
+            cursor_moved = dx * dx + dy * dy > self.MOVE_THRESHOLD_SQ
         else:
             # First cursor position - don't count as movement to allow gestures on startup
             cursor_moved = False
@@ -387,40 +548,39 @@ class CursorController:
         success = False
         if self.cursor_enabled:
             success = self.move_cursor(screen_x, screen_y)
-            if success:
-                logger.debug(f"✓ Cursor moved to ({screen_x}, {screen_y})")
         else:
             logger.warning("⚠ Cursor movement skipped - cursor_enabled=False")
 
         # Update statistics
-        latency = (time.time() - start_time) * 1000  # Convert to ms
-        self.performance_stats['total_latency'] += latency
-
+        latency = (time.perf_counter_ns() - start_ns) * 1e-6  # Convert to ms
+        stats[_STAT_LATENCY] += latency
         if success:
-            self.performance_stats['successful_updates'] += 1
+            stats[_STAT_OK] += 1
         else:
-            self.performance_stats['failed_updates'] += 1
+            stats[_STAT_FAIL] += 1
 
-        # Calculate average latency
-        if self.performance_stats['total_updates'] > 0:
-            self.performance_stats['avg_latency_ms'] = (
-                self.performance_stats['total_latency'] /
-                self.performance_stats['total_updates']
-            )
+        success = bool(success)
+        cursor_enabled = bool(self.cursor_enabled)
+        moved = cursor_moved and success  # PHASE 4 FIX: Report if cursor actually moved
+
+        # Detailed position/stats payload is only built when asked for or
+        # periodically - most frames get a shared status-only result
+        self._frame_counter += 1
+        if not verbose and self._frame_counter % self.VERBOSE_RESULT_INTERVAL:
+            return _STATUS_RESULTS[(success, cursor_enabled, moved)]
 
         return {
-            'success': bool(success),
-            'cursor_enabled': bool(self.cursor_enabled),
-            'moved': bool(cursor_moved and success),  # PHASE 4 FIX: Report if cursor actually moved
+            'success': success,
+            'cursor_enabled': cursor_enabled,
+            'moved': moved,
+            'screen_position': {'x': int(screen_x), 'y': int(screen_y)},
             'hand_position': {
                 'raw': {'x': float(hand_x), 'y': float(hand_y), 'z': float(hand_z)},
                 'smoothed': {'x': float(smoothed_x), 'y': float(smoothed_y)},
                 'filtered': {'x': float(filtered_x), 'y': float(filtered_y)}
             },
-            'screen_position': {'x': int(screen_x), 'y': int(screen_y)},
             'latency_ms': float(latency),
-            'stats': {k: int(v) if isinstance(v, (int, np.integer)) else float(v)
-                     for k, v in self.performance_stats.items()}
+            'stats': self._performance_stats_snapshot()
         }
 
     def enable_cursor(self):
@@ -434,36 +594,56 @@ class CursorController:
         logger.info("Cursor control DISABLED")
 
     def reset(self):
-        """Reset internal state and filters."""
-        if self.smoothing_enabled:
-            self.filter_x = OneEuroFilter(min_cutoff=1.0, beta=0.009, d_cutoff=1.0)
-            self.filter_y = OneEuroFilter(min_cutoff=1.0, beta=0.009, d_cutoff=1.0)
+        """
+        Reset internal state and filters.
+
+        Filter state is cleared in place; tuning (e.g. the smoothing level set
+        via set_smoothing_level) is kept.
+        """
+        self._oef_state_x = (0.0, 0.0)
+        self._oef_state_y = (0.0, 0.0)
+        self._oef_t_prev = None
 
         self._ema_x = None
         self._ema_y = None
-        self._median_buf_x = []
-        self._median_buf_y = []
+        self._median_count = 0
+        self._median_index = 0
         self._prev_smoothed_x = None
         self._prev_smoothed_y = None
         self._prev_smooth_time = None
         self.last_position = None
         self.last_screen_position = None
+        with self._flush_lock:
+            self._pending_position = None
+            self._flushed_position = None
 
         # Reset stats
-        self.performance_stats = {
-            'total_updates': 0,
-            'successful_updates': 0,
-            'failed_updates': 0,
-            'avg_latency_ms': 0.0,
-            'total_latency': 0.0
-        }
+        # Per-frame counters indexed by the _STAT_* slots; the stats dict
+        # (including avg_latency_ms) is built from them on demand
+        self._stats = array('d', [0.0, 0.0, 0.0, 0.0])
 
         logger.info("Cursor controller reset")
 
+    @property
+    def performance_stats(self) -> Dict:
+        """Update counters and latency as a plain dict (built on access)."""
+        return self._performance_stats_snapshot()
+
+    def _performance_stats_snapshot(self) -> Dict:
+        """Build the stats dict from the counter array."""
+        total, ok, fail, total_latency = self._stats
+        return {
+            'total_updates': int(total),
+            'successful_updates': int(ok),
+            'failed_updates': int(fail),
+            'avg_latency_ms': total_latency / total if total > 0 else 0.0,
+            'total_latency': total_latency
+        }
+
     def get_stats(self) -> Dict:
         """Get performance statistics."""
         return {
-            **self.performance_stats,
+            **self._performance_stats_snapshot(),
             'cursor_enabled': self.cursor_enabled,
             'screen_size': {
                 'width': self.screen_width,
@@ -0,0 +1,88 @@
+"""
+AirClick - Cursor Pipeline Kernels
+==================================
+
+Scalar arithmetic for the per-frame cursor path, compiled with Numba when
+available (see app.core.jit). CursorController keeps all state; these
+functions take and return plain floats/ints so a frame's dead-zone and
+screen-mapping work is a single compiled call with no Python objects created
+in between.
+
+Author: Muhammad Shawaiz
+Project: AirClick FYP
+"""
+
+from app.core.jit import njit
+
+
+@njit(cache=True)
+def dead_zone_step(new_x, new_y, last_x, last_y, prev_x, prev_y, dt,
+                   dz_min, dz_max, velocity_scale):
+    """
+    Velocity-adaptive dead zone for one sample.
+
+    Args:
+        new_x, new_y: Smoothed position for this frame (normalized)
+        last_x, last_y: Last accepted position
+        prev_x, prev_y: Previous smoothed sample (for velocity)
+        dt: Seconds since the previous sample, or <= 0 if unknown
+        dz_min, dz_max: Dead zone bounds (normalized units)
+        velocity_scale: How aggressively velocity shrinks the dead zone
+
+    Returns:
+        (x, y) accepted position - the new sample if it left the dead zone,
+        otherwise the last accepted position
+    """
+    velocity = 0.0
+    if dt > 0.0:
+        vx = new_x - prev_x
+        vy = new_y - prev_y
+        velocity = (vx * vx + vy * vy) ** 0.5 / dt
+
+    # Dead zone shrinks as velocity rises — fast movement gets near-zero dead zone.
+    adaptive_dz = max(dz_min, dz_max - velocity * velocity_scale)
+
+    # Squared comparison avoids sqrt — same result, cheaper.
+    dx = new_x - last_x
+    dy = new_y - last_y
+    if dx * dx + dy * dy > adaptive_dz * adaptive_dz:
+        return new_x, new_y
+    return last_x, last_y
+
+
+@njit(cache=True)
+def screen_map(hand_x, hand_y, movement_scale, screen_width, screen_height):
+    """
+    Scale around the frame centre and convert to pixels inside the screen.
+
+    Returns:
+        (screen_x, screen_y) integer pixel coordinates inside the screen
+    """
+    # One clamp per axis in pixel space: clamping the scaled position to
+    # [0, size - 1] before truncating gives the same pixel as clamping to
+    # [0, 1], truncating, then clamping to size - 1 again
+    px = ((hand_x - 0.5) * movement_scale + 0.5) * screen_width
+    py = ((hand_y - 0.5) * movement_scale + 0.5) * screen_height
+    screen_x = int(min(max(px, 0.0), screen_width - 1.0))
+    screen_y = int(min(max(py, 0.0), screen_height - 1.0))
+    return screen_x, screen_y
+
+
+@njit(cache=True)
+def dead_zone_and_map(new_x, new_y, last_x, last_y, prev_x, prev_y, dt,
+                      dz_min, dz_max, velocity_scale,
+                      movement_scale, screen_width, screen_height):
+    """
+    Fused dead_zone_step + screen_map for the per-frame cursor update.
+
+    Returns:
+        (filtered_x, filtered_y, screen_x, screen_y)
+    """
+    filtered_x, filtered_y = dead_zone_step(
+        new_x, new_y, last_x, last_y, prev_x, prev_y, dt,
+        dz_min, dz_max, velocity_scale
+    )
+    screen_x, screen_y = screen_map(
+        filtered_x, filtered_y, movement_scale, screen_width, screen_height
+    )
+    return filtered_x, filtered_y, screen_x, screen_y
@@ -0,0 +1,667 @@
+"""
+AirClick - DTW Kernels
+======================
+
+Matrix-fill loops for the DTW variants in enhanced_dtw.py and the basic
+fallback in gesture_matcher.py, compiled with Numba when available (see
+app.core.jit). The frame-to-frame Euclidean costs are computed up front as one
+(n, m) matrix by pairwise_cost() with a single BLAS product (direction DTW
+adds direction_cost()); the DP kernel then only reads that matrix, so a
+whole DTW comparison is a few array-level calls instead of O(n*m)
+interpreted iterations with a NumPy call per cell.
+
+Only the final distance is needed (no warping path), so the recurrence keeps
+two rolling rows of m+1 cells instead of the full (n+1, m+1) matrix; with a
+Sakoe-Chiba band narrower than a row, the rows shrink to the 2*radius+1
+in-band cells. The common case, two resampled 60-frame gestures with no
+band, gets its own fixed-shape fill.
+
+Everything runs in float32: landmark features carry ~3 significant decimals
+after Procrustes normalization, and half-width elements double the SIMD lanes
+and halve the memory traffic. The kernels are compiled eagerly for the
+float32, C-contiguous signatures as_dtw_array() produces.
+
+Author: Muhammad Shawaiz
+Project: AirClick FYP
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+
+from app.core.jit import njit, prange, NUMBA_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+
+DTW_DTYPE = np.float32
+
+# Every gesture is resampled to this many frames before matching
+# (preprocess_for_matching / preprocess_for_recording target_frames)
+RESAMPLED_FRAMES = 60
+
+
+def as_dtw_array(sequence: np.ndarray) -> np.ndarray:
+    """Contiguous float32 view/copy of a sequence, the layout the kernels expect."""
+    return np.ascontiguousarray(sequence, dtype=DTW_DTYPE)
+
+
+def half_sq_norms(sequence: np.ndarray) -> np.ndarray:
+    """
+    Half squared norm of every row, ||x||^2 / 2.
+
+    Depends on one sequence only, so it can be computed once for a stored
+    template and passed to pairwise_cost() on every comparison.
+
+    Args:
+        sequence: (n, features) float32 array
+
+    Returns:
+        (n,) float32 array
+    """
+    return 0.5 * np.einsum('ij,ij->i', sequence, sequence)
+
+
+def pairwise_cost(
+    seq1: np.ndarray,
+    seq2: np.ndarray,
+    half_sq_norms1: Optional[np.ndarray] = None,
+    half_sq_norms2: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Euclidean cost between every frame pair.
+
+    Uses ||a - b||^2 = 2 * (||a||^2/2 + ||b||^2/2 - a.b): one BLAS matrix
+    product plus two norm vectors, with no (n, m, features) temporary.
+
+    Args:
+        seq1: First sequence (n, features), float32
+        seq2: Second sequence (m, features), float32
+        half_sq_norms1: half_sq_norms(seq1), computed here if None
+        half_sq_norms2: half_sq_norms(seq2), computed here if None
+
+    Returns:
+        (n, m) float32 matrix with cost[i, j] = ||seq1[i] - seq2[j]||
+    """
+    if half_sq_norms1 is None:
+        half_sq_norms1 = half_sq_norms(seq1)
+    if half_sq_norms2 is None:
+        half_sq_norms2 = half_sq_norms(seq2)
+
+    cost = seq1 @ seq2.T
+    cost *= -1.0
+    cost += half_sq_norms1[:, None]
+    cost += half_sq_norms2[None, :]
+    # Rounding can push near-identical frames slightly below zero
+    np.maximum(cost, 0.0, out=cost)
+    cost *= 2.0
+    return np.sqrt(cost, out=cost)
+
+
+@njit(cache=True)
+def _dtw_fill_band(cost, m, radius):
+    """
+    Banded DP fill: each row only stores its 2*radius+1 in-band cells.
+
+    Cell (i, j) lives at offset d = j - i + radius of row i, so its
+    neighbours are (i-1, j) -> d+1 and (i-1, j-1) -> d of the previous row
+    and (i, j-1) -> d-1 of the current one. Both rows carry one inf sentinel
+    at each end (array index = d + 1), so out-of-band reads need no checks.
+    """
+    n = cost.shape[0]
+    width = 2 * radius + 1
+
+    prev = np.full(width + 2, np.inf, dtype=cost.dtype)
+    curr = np.full(width + 2, np.inf, dtype=cost.dtype)
+    prev[radius + 1] = 0.0  # cell (0, 0)
+
+    for i in range(1, n + 1):
+        curr[:] = np.inf
+        j_start = max(1, i - radius)
+        j_end = min(m, i + radius)
+        for j in range(j_start, j_end + 1):
+            idx = j - i + radius + 1
+            # DTW recurrence: min of insertion, deletion, match
+            best = prev[idx + 1]
+            if curr[idx - 1] < best:
+                best = curr[idx - 1]
+            if prev[idx] < best:
+                best = prev[idx]
+            curr[idx] = cost[i - 1, j - 1] + best
+        prev, curr = curr, prev
+
+    # (n, m) is only in band if |m - n| <= radius
+    final = m - n + radius
+    if final < 0 or final >= width:
+        return np.inf
+    return prev[final + 1]
+
+
+@njit(cache=True, boundscheck=False)
+def _dtw_fill_fixed(cost):
+    """
+    Unconstrained DP fill specialized to the resampled 60 x 60 case.
+
+    Constant trip counts let LLVM drop the band arithmetic and bound
+    checks, and every cell of a full grid is reachable, so one row with
+    the diagonal/left neighbours carried in registers replaces the two
+    inf-initialized rolling rows. Same additions in the same order as the
+    generic fill, so results are identical.
+    """
+    row = np.empty(RESAMPLED_FRAMES, dtype=cost.dtype)
+
+    # Row 0 and column 0 only have one predecessor each
+    acc = cost[0, 0]
+    row[0] = acc
+    for j in range(1, RESAMPLED_FRAMES):
+        acc += cost[0, j]
+        row[j] = acc
+
+    for i in range(1, RESAMPLED_FRAMES):
+        diag = row[0]
+        left = diag + cost[i, 0]
+        row[0] = left
+        for j in range(1, RESAMPLED_FRAMES):
+            up = row[j]
+            best = up
+            if left < best:
+                best = left
+            if diag < best:
+                best = diag
+            left = cost[i, j] + best
+            diag = up
+            row[j] = left
+
+    return row[RESAMPLED_FRAMES - 1]
+
+
+@njit(cache=True)
+def _dtw_fill_cols(cost, m, radius):
+    """DP fill over the first m columns of cost (shared by the two entry points)."""
+    n = cost.shape[0]
+
+    # Resampled gestures without a band: fixed-shape kernel
+    if n == RESAMPLED_FRAMES and m == RESAMPLED_FRAMES and radius >= RESAMPLED_FRAMES - 1:
+        return _dtw_fill_fixed(cost)
+
+    # A real band is narrower than a full row: store only the band
+    if 2 * radius + 1 < m:
+        return _dtw_fill_band(cost, m, radius)
+
+    # Rolling rows: prev = row i-1, curr = row i
+    prev = np.full(m + 1, np.inf, dtype=cost.dtype)
+    curr = np.full(m + 1, np.inf, dtype=cost.dtype)
+    prev[0] = 0.0
+
+    for i in range(1, n + 1):
+        # Cells outside this row's band stay unreachable
+        curr[:] = np.inf
+        j_start = max(1, i - radius)
+        j_end = min(m, i + radius)
+        for j in range(j_start, j_end + 1):
+            # DTW recurrence: min of insertion, deletion, match
+            best = prev[j]
+            if curr[j - 1] < best:
+                best = curr[j - 1]
+            if prev[j - 1] < best:
+                best = prev[j - 1]
+            curr[j] = cost[i - 1, j - 1] + best
+        prev, curr = curr, prev
+
+    return prev[m]
+
+
+@njit('f4(f4[:, ::1], i8)', cache=True)
+def dtw_fill(cost, radius):
+    """
+    DTW distance over a precomputed cost matrix, with an optional band constraint.
+
+    Args:
+        cost: (n, m) float32 frame-to-frame cost matrix from pairwise_cost()
+        radius: Sakoe-Chiba radius; max(n, m) means unconstrained
+
+    Returns:
+        Accumulated DTW distance (inf if no path exists)
+    """
+    return _dtw_fill_cols(cost, cost.shape[1], radius)
+
+
+@njit('f4[::1](f4[:, :, ::1], i8[::1], i8[::1])', parallel=True, cache=True)
+def batch_dtw_fill(costs, lengths, radii):
+    """
+    dtw_fill for a whole gallery, one template per thread.
+
+    Args:
+        costs: (K, n, M) float32 cost matrices; template k uses columns
+               [0, lengths[k]) (the rest is padding)
+        lengths: (K,) template lengths
+        radii: (K,) band radius per template
+
+    Returns:
+        (K,) float32 DTW distances
+    """
+    num_templates = costs.shape[0]
+    out = np.empty(num_templates, dtype=np.float32)
+    for k in prange(num_templates):
+        out[k] = _dtw_fill_cols(costs[k], lengths[k], radii[k])
+    return out
+
+
+@njit('f4[::1](f4[:, ::1], f4[:, ::1], f4[:, ::1])', cache=True)
+def dtw_fill_multi(cost_pos, cost_vel, cost_acc):
+    """
+    Unconstrained DTW for position, velocity and acceleration in one loop nest.
+
+    The three DPs are independent (each channel keeps its own rolling rows
+    and its own path) but share the row/column iteration, so one pass over
+    the grid replaces three separate fills. The derivative matrices are 1
+    and 2 frames shorter; a (0, 0) matrix skips that channel.
+
+    Args:
+        cost_pos: (n, m) float32 position cost matrix
+        cost_vel: (n-1, m-1) float32 velocity cost matrix, or (0, 0)
+        cost_acc: (n-2, m-2) float32 acceleration cost matrix, or (0, 0)
+
+    Returns:
+        (3,) float32 distances [pos, vel, acc] (0 for a skipped channel)
+    """
+    n_pos, m_pos = cost_pos.shape
+    n_vel, m_vel = cost_vel.shape
+    n_acc, m_acc = cost_acc.shape
+    n = max(n_pos, n_vel, n_acc)
+    m = max(m_pos, m_vel, m_acc)
+
+    prev_pos = np.full(m + 1, np.inf, dtype=np.float32)
+    curr_pos = np.full(m + 1, np.inf, dtype=np.float32)
+    prev_vel = np.full(m + 1, np.inf, dtype=np.float32)
+    curr_vel = np.full(m + 1, np.inf, dtype=np.float32)
+    prev_acc = np.full(m + 1, np.inf, dtype=np.float32)
+    curr_acc = np.full(m + 1, np.inf, dtype=np.float32)
+    prev_pos[0] = 0.0
+    prev_vel[0] = 0.0
+    prev_acc[0] = 0.0
+
+    for i in range(1, n + 1):
+        do_pos = i <= n_pos
+        do_vel = i <= n_vel
+        do_acc = i <= n_acc
+        # Column 0 is unreachable after row 0 (every other cell is rewritten)
+        curr_pos[0] = np.inf
+        curr_vel[0] = np.inf
+        curr_acc[0] = np.inf
+        for j in range(1, m + 1):
+            # DTW recurrence per channel: min of insertion, deletion, match
+            if do_pos and j <= m_pos:
+                best = prev_pos[j]
+                if curr_pos[j - 1] < best:
+                    best = curr_pos[j - 1]
+                if prev_pos[j - 1] < best:
+                    best = prev_pos[j - 1]
+                curr_pos[j] = cost_pos[i - 1, j - 1] + best
+
+            if do_vel and j <= m_vel:
+                best = prev_vel[j]
+                if curr_vel[j - 1] < best:
+                    best = curr_vel[j - 1]
+                if prev_vel[j - 1] < best:
+                    best = prev_vel[j - 1]
+                curr_vel[j] = cost_vel[i - 1, j - 1] + best
+
+            if do_acc and j <= m_acc:
+                best = prev_acc[j]
+                if curr_acc[j - 1] < best:
+                    best = curr_acc[j - 1]
+                if prev_acc[j - 1] < best:
+                    best = prev_acc[j - 1]
+                curr_acc[j] = cost_acc[i - 1, j - 1] + best
+
+        if do_pos:
+            prev_pos, curr_pos = curr_pos, prev_pos
+        if do_vel:
+            prev_vel, curr_vel = curr_vel, prev_vel
+        if do_acc:
+            prev_acc, curr_acc = curr_acc, prev_acc
+
+    out = np.zeros(3, dtype=np.float32)
+    if n_pos > 0:
+        out[0] = prev_pos[m_pos]
+    if n_vel > 0:
+        out[1] = prev_vel[m_vel]
+    if n_acc > 0:
+        out[2] = prev_acc[m_acc]
+    return out
+
+
+def direction_cost(
+    vel1: np.ndarray,
+    vel2: np.ndarray,
+    half_sq_norms1: Optional[np.ndarray] = None,
+    half_sq_norms2: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Cosine distance between every pair of velocity vectors.
+
+    Built from one matrix product plus the row norms, so no per-cell norm or
+    dot call is needed in the DP loop.
+
+    Args:
+        vel1: Velocities of the first sequence (n-1, features), float32
+        vel2: Velocities of the second sequence (m-1, features), float32
+        half_sq_norms1: half_sq_norms(vel1), computed here if None
+        half_sq_norms2: half_sq_norms(vel2), computed here if None
+
+    Returns:
+        (n-1, m-1) matrix: 1 - cos(vel1[i], vel2[j]) (0 = same direction,
+        2 = opposite), or 0 where either velocity is ~zero
+    """
+    if half_sq_norms1 is None:
+        half_sq_norms1 = half_sq_norms(vel1)
+    if half_sq_norms2 is None:
+        half_sq_norms2 = half_sq_norms(vel2)
+    norm1 = np.sqrt(2.0 * half_sq_norms1)
+    norm2 = np.sqrt(2.0 * half_sq_norms2)
+    moving1 = norm1 > 1e-6
+    moving2 = norm2 > 1e-6
+
+    dots = vel1 @ vel2.T
+    denom = np.outer(np.where(moving1, norm1, 1.0), np.where(moving2, norm2, 1.0))
+    dist = 1.0 - dots / denom
+    dist[~moving1, :] = 0.0
+    dist[:, ~moving2] = 0.0
+    return dist
+
+
+def batch_pairwise_cost(
+    seq1: np.ndarray,
+    seqs2: np.ndarray,
+    half_sq_norms1: np.ndarray,
+    half_sq_norms2: np.ndarray
+) -> np.ndarray:
+    """
+    pairwise_cost() of one sequence against a stack of padded templates.
+
+    The cross terms for the whole gallery come from a single matrix product.
+
+    Args:
+        seq1: Query sequence (n, features), float32
+        seqs2: Templates (K, M, features), float32, zero-padded to M rows
+        half_sq_norms1: half_sq_norms(seq1), (n,)
+        half_sq_norms2: Row half norms of seqs2, (K, M)
+
+    Returns:
+        (K, n, M) float32 cost matrices, C-contiguous
+    """
+    num_templates, max_len, num_features = seqs2.shape
+
+    # (n, K * M) in the matmul's own layout; one transpose copy at the end
+    cost = seq1 @ seqs2.reshape(-1, num_features).T
+    cost *= -1.0
+    cost += half_sq_norms1[:, None]
+    cost += half_sq_norms2.reshape(1, -1)
+    np.maximum(cost, 0.0, out=cost)
+    cost *= 2.0
+    np.sqrt(cost, out=cost)
+    cost = cost.reshape(len(seq1), num_templates, max_len).transpose(1, 0, 2)
+    return np.ascontiguousarray(cost)
+
+
+def batch_direction_cost(
+    vel1: np.ndarray,
+    vels2: np.ndarray,
+    half_sq_norms1: np.ndarray,
+    half_sq_norms2: np.ndarray
+) -> np.ndarray:
+    """
+    direction_cost() of one velocity sequence against a stack of templates.
+
+    Args:
+        vel1: Query velocities (n-1, features), float32
+        vels2: Template velocities (K, M-1, features), float32, zero-padded
+        half_sq_norms1: half_sq_norms(vel1), (n-1,)
+        half_sq_norms2: Row half norms of vels2, (K, M-1)
+
+    Returns:
+        (K, n-1, M-1) float32 cosine distances (0 where either velocity is ~zero)
+    """
+    num_templates, max_len, num_features = vels2.shape
+    norm1 = np.sqrt(2.0 * half_sq_norms1)
+    norm2 = np.sqrt(2.0 * half_sq_norms2)
+    moving1 = norm1 > 1e-6
+    moving2 = norm2 > 1e-6
+
+    # (n-1, K * (M-1)) in the matmul's own layout; one transpose copy at the end
+    dist = vel1 @ vels2.reshape(-1, num_features).T
+    dist /= np.where(moving1, norm1, 1.0)[:, None]
+    dist /= np.where(moving2, norm2, 1.0).reshape(1, -1)
+    np.subtract(1.0, dist, out=dist)
+    dist *= moving1[:, None]
+    dist *= moving2.reshape(1, -1)
+    dist = dist.reshape(len(vel1), num_templates, max_len).transpose(1, 0, 2)
+    return np.ascontiguousarray(dist)
+
+
+def keogh_envelope(template: np.ndarray, radius: int, length: int) -> tuple:
+    """
+    Per-feature upper/lower envelope of a template for LB_Keogh.
+
+    Row i holds the max/min of template rows [i - radius, i + radius], using
+    streaming O(n) min/max filters (cost independent of radius).
+
+    Args:
+        template: Template sequence (m, features), float32
+        radius: Warping band radius
+        length: Query length n (rows of the envelope)
+
+    Returns:
+        (upper, lower) arrays of shape (length, features), or None if some
+        query row has no template row within the band (DTW is inf then)
+    """
+    m = len(template)
+    if m == 0 or length - m > radius:
+        return None
+    if length > m:
+        # Repeat the last row so windows past the end clip to [i - radius, m - 1]
+        template = np.vstack([template, np.repeat(template[-1:], length - m, axis=0)])
+
+    size = 2 * radius + 1
+    upper = maximum_filter1d(template, size=size, axis=0, mode='nearest')[:length]
+    lower = minimum_filter1d(template, size=size, axis=0, mode='nearest')[:length]
+    return np.ascontiguousarray(upper), np.ascontiguousarray(lower)
+
+
+@njit('f8(f4[:, ::1], f4[:, ::1], f4[:, ::1])', cache=True)
+def lb_keogh(query, upper, lower):
+    """
+    LB_Keogh lower bound for DTW with Euclidean frame cost.
+
+    Every query row is matched to at least one template row inside its band,
+    and that cell costs at least the distance from the query row to the
+    envelope box, so the sum of those distances never exceeds the DTW distance.
+
+    Args:
+        query: Query sequence (n, features), float32
+        upper: Envelope upper bound (n, features)
+        lower: Envelope lower bound (n, features)
+
+    Returns:
+        Lower bound on the DTW distance
+    """
+    n = query.shape[0]
+    num_features = query.shape[1]
+    total = 0.0
+    for i in range(n):
+        d = 0.0
+        for k in range(num_features):
+            q = query[i, k]
+            if q > upper[i, k]:
+                gap = q - upper[i, k]
+                d += gap * gap
+            elif q < lower[i, k]:
+                gap = lower[i, k] - q
+                d += gap * gap
+        total += np.sqrt(d)
+    return total
+
+
+@njit(cache=True)
+def dtw_window_path(seq1, seq2, lo, hi):
+    """
+    DTW restricted to a per-row column window, with the warping path.
+
+    Row i may only use columns lo[i]..hi[i]; cell costs are computed inside
+    the loop, so work and memory are proportional to the window size rather
+    than n * m.
+
+    Args:
+        seq1: First sequence (n, features), float32
+        seq2: Second sequence (m, features), float32
+        lo, hi: (n,) int64 inclusive column bounds per row
+
+    Returns:
+        (distance, path_i, path_j) - path from (0, 0) to (n-1, m-1)
+    """
+    n = seq1.shape[0]
+    m = seq2.shape[0]
+    num_features = seq1.shape[1]
+    width = 0
+    for i in range(n):
+        if hi[i] - lo[i] + 1 > width:
+            width = hi[i] - lo[i] + 1
+
+    # acc[i, j - lo[i]] = accumulated cost of cell (i, j)
+    acc = np.full((n, width), np.inf, dtype=np.float32)
+    for i in range(n):
+        for j in range(lo[i], hi[i] + 1):
+            d = 0.0
+            for k in range(num_features):
+                diff = seq1[i, k] - seq2[j, k]
+                d += diff * diff
+            if i == 0 and j == 0:
+                best = 0.0
+            else:
+                best = np.inf
+                if j > lo[i]:
+                    best = min(best, acc[i, j - 1 - lo[i]])
+                if i > 0:
+                    if lo[i - 1] <= j <= hi[i - 1]:
+                        best = min(best, acc[i - 1, j - lo[i - 1]])
+                    if lo[i - 1] <= j - 1 <= hi[i - 1]:
+                        best = min(best, acc[i - 1, j - 1 - lo[i - 1]])
+            acc[i, j - lo[i]] = np.sqrt(d) + best
+
+    # Backtrack from the end cell, preferring the diagonal on ties
+    path_i = np.empty(n + m, dtype=np.int64)
+    path_j = np.empty(n + m, dtype=np.int64)
+    i = n - 1
+    j = m - 1
+    length = 0
+    while True:
+        path_i[length] = i
+        path_j[length] = j
+        length += 1
+        if i == 0 and j == 0:
+            break
+        best = np.inf
+        next_i = i
+        next_j = j
+        if i > 0 and lo[i - 1] <= j - 1 <= hi[i - 1]:
+            best = acc[i - 1, j - 1 - lo[i - 1]]
+            next_i = i - 1
+            next_j = j - 1
+        if i > 0 and lo[i - 1] <= j <= hi[i - 1] and acc[i - 1, j - lo[i - 1]] < best:
+            best = acc[i - 1, j - lo[i - 1]]
+            next_i = i - 1
+            next_j = j
+        if j > lo[i] and acc[i, j - 1 - lo[i]] < best:
+            next_i = i
+            next_j = j - 1
+        i = next_i
+        j = next_j
+
+    return acc[n - 1, m - 1 - lo[n - 1]], path_i[:length][::-1], path_j[:length][::-1]
+
+
+def _coarsen(sequence: np.ndarray) -> np.ndarray:
+    """Halve the resolution by averaging frame pairs (a trailing odd frame is dropped)."""
+    pairs = len(sequence) // 2
+    return sequence[:pairs * 2].reshape(pairs, 2, -1).mean(axis=1)
+
+
+def _project_window(path_i, path_j, n, m, radius):
+    """
+    Per-row column window on the finer grid around a coarse warping path.
+
+    Each coarse cell within radius of the path covers a 2x2 block of fine
+    cells; rows/columns left over by an odd length reuse the last block.
+    """
+    coarse_n = n // 2
+    coarse_lo = np.full(coarse_n, np.iinfo(np.int64).max, dtype=np.int64)
+    coarse_hi = np.full(coarse_n, -1, dtype=np.int64)
+    for offset in range(-radius, radius + 1):
+        rows = path_i + offset
+        valid = (rows >= 0) & (rows < coarse_n)
+        np.minimum.at(coarse_lo, rows[valid], path_j[valid] - radius)
+        np.maximum.at(coarse_hi, rows[valid], path_j[valid] + radius)
+
+    lo = np.repeat(np.maximum(coarse_lo, 0) * 2, 2)
+    hi = np.repeat(coarse_hi * 2 + 1, 2)
+    if n % 2:
+        lo = np.append(lo, lo[-1])
+        hi = np.append(hi, hi[-1])
+
+    # Last fine column of the coarse grid also covers an odd trailing column
+    hi = np.minimum(hi, m - 1)
+    hi[hi >= (m // 2) * 2 - 1] = m - 1
+    lo[0] = 0
+    hi[-1] = m - 1
+    return lo, hi
+
+
+def fastdtw(seq1: np.ndarray, seq2: np.ndarray, radius: int = 2):
+    """
+    FastDTW (Salvador & Chan): approximate DTW in O(n) time and memory.
+
+    Solves DTW on half-resolution copies recursively, projects the coarse
+    warping path back to the finer grid and only searches within radius of
+    it. Exact DTW is run once the sequences are shorter than radius + 2.
+
+    Args:
+        seq1: First sequence (n, features), float32
+        seq2: Second sequence (m, features), float32
+        radius: Search radius around the projected path (coarse frames)
+
+    Returns:
+        (distance, path_i, path_j) - distance is >= the exact DTW distance
+    """
+    n = len(seq1)
+    m = len(seq2)
+    min_size = radius + 2
+    if n < min_size or m < min_size or n < 2 or m < 2:
+        lo = np.zeros(n, dtype=np.int64)
+        hi = np.full(n, m - 1, dtype=np.int64)
+        return dtw_window_path(seq1, seq2, lo, hi)
+
+    _, coarse_i, coarse_j = fastdtw(_coarsen(seq1), _coarsen(seq2), radius)
+    lo, hi = _project_window(coarse_i, coarse_j, n, m, radius)
+    return dtw_window_path(seq1, seq2, lo, hi)
+
+
+def _warm_up():
+    """Compile (or load from the on-disk cache) each kernel on tiny inputs."""
+    seq = np.zeros((2, 2), dtype=DTW_DTYPE)
+    dtw_fill(pairwise_cost(seq, seq), 2)
+    radii = np.array([2], dtype=np.int64)
+    batch_dtw_fill(pairwise_cost(seq, seq)[None], radii, radii)
+    dtw_fill_multi(pairwise_cost(seq, seq), pairwise_cost(seq, seq), pairwise_cost(seq, seq))
+    lb_keogh(seq, seq, seq)
+    fastdtw(seq, seq)
+
+
+# Pay the JIT cost at import instead of on the first gesture match
+if NUMBA_AVAILABLE:
+    try:
+        _warm_up()
+    except Exception as e:
+        logger.warning(f"⚠ DTW kernel warm-up failed, compiling on first use: {e}")
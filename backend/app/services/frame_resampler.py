@@ -9,12 +9,35 @@ Author: Muhammad Shawaiz (Enhanced by Claude)
 Project: AirClick FYP
 """
 
+import sys
 import numpy as np
+from operator import itemgetter
 from typing import List, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+_landmark_xyz = itemgetter('x', 'y', 'z')
+
+
+def _interpolation_weights(original_count: int, target_frames: int):
+    """
+    Source frame pair and blend weight for every target frame.
+
+    Args:
+        original_count: Number of input frames
+        target_frames: Number of output frames
+
+    Returns:
+        (i, j, weight) arrays of length target_frames: target frame t is
+        (1 - weight[t]) * frame i[t] + weight[t] * frame j[t]
+    """
+    # Map target frame indices to original frame positions
+    target_indices = np.linspace(0, original_count - 1, target_frames)
+    i = np.floor(target_indices).astype(np.intp)
+    j = np.minimum(i + 1, original_count - 1)
+    return i, j, target_indices - i
+
 
 def resample_frames_linear(frames: List[Dict], target_frames: int = 60) -> List[Dict]:
     """
@@ -53,75 +76,77 @@ def resample_frames_linear(frames: List[Dict], target_frames: int = 60) -> List[
 
     logger.info(f"Resampling frames: {original_count} → {target_frames}")
 
-    # Create interpolation indices
-    # Map target frame indices to original frame positions
-    original_indices = np.linspace(0, original_count - 1, original_count)
-    target_indices = np.linspace(0, original_count - 1, target_frames)
+    i_idx, j_idx, weights = _interpolation_weights(original_count, target_frames)
 
-    resampled_frames = []
+    # Stack every frame's landmarks into one (n_frames, 21, 3) array so all the
+    # interpolation below is a handful of array operations
+    coords = []
+    valid = np.zeros(original_count, dtype=bool)
+    timestamps = np.zeros(original_count)
+    timestamp_ok = np.ones(original_count, dtype=bool)
+    confidences = np.ones(original_count)
+    confidence_ok = np.ones(original_count, dtype=bool)
 
-    for target_idx in target_indices:
-        # Find surrounding frames for interpolation
-        i = int(np.floor(target_idx))
-        j = min(i + 1, original_count - 1)
+    for k, frame in enumerate(frames):
+        landmarks = frame.get('landmarks', [])
+        if len(landmarks) == 21:
+            # Handle both dict format {'x': ..., 'y': ..., 'z': ...} and list format [x, y, z]
+            for lm in landmarks:
+                coords.extend(_landmark_xyz(lm) if isinstance(lm, dict) else lm[:3])
+            valid[k] = True
 
-        # Calculate interpolation weight (0 = frame i, 1 = frame j)
-        weight = target_idx - i
+        # Handle both numeric and string timestamps
+        try:
+            timestamps[k] = int(frame.get('timestamp', 0)) if frame.get('timestamp') else 0
+        except (TypeError, ValueError):
+            timestamp_ok[k] = False
 
-        # Get surrounding frames
-        frame_i = frames[i]
-        frame_j = frames[j]
+        try:
+            confidences[k] = float(frame.get('confidence', 1.0))
+        except (TypeError, ValueError):
+            confidence_ok[k] = False
+
+    landmark_rows = np.zeros((original_count, 21, 3))
+    landmark_rows[valid] = np.array(coords, dtype=np.float64).reshape(-1, 21, 3)
+
+    # Linear interpolation: value = (1 - weight) * value_i + weight * value_j
+    w = weights[:, None, None]
+    interpolated = ((1 - w) * landmark_rows[i_idx] + w * landmark_rows[j_idx]).tolist()
 
-        # Interpolate landmarks
-        interpolated_landmarks = []
-        landmarks_i = frame_i.get('landmarks', [])
-        landmarks_j = frame_j.get('landmarks', [])
+    interpolated_timestamps = (
+        (1 - weights) * timestamps[i_idx] + weights * timestamps[j_idx]
+    ).astype(np.int64).tolist()
+    interpolated_confidences = (
+        (1 - weights) * confidences[i_idx] + weights * confidences[j_idx]
+    ).tolist()
+    timestamp_ok = (timestamp_ok[i_idx] & timestamp_ok[j_idx]).tolist()
+    confidence_ok = (confidence_ok[i_idx] & confidence_ok[j_idx]).tolist()
+    valid = valid.tolist()
 
-        if len(landmarks_i) != 21 or len(landmarks_j) != 21:
-            logger.error(f"Invalid landmark count: {len(landmarks_i)}, {len(landmarks_j)}")
+    resampled_frames = []
+
+    # Only the dict rebuild is left per target frame
+    for t, (i, j) in enumerate(zip(i_idx.tolist(), j_idx.tolist())):
+        if not (valid[i] and valid[j]):
+            logger.error(
+                f"Invalid landmark count: {len(frames[i].get('landmarks', []))}, "
+                f"{len(frames[j].get('landmarks', []))}"
+            )
             continue
 
-        for idx, (lm_i, lm_j) in enumerate(zip(landmarks_i, landmarks_j)):
-            # Linear interpolation: value = (1 - weight) * value_i + weight * value_j
-            # Handle both dict format {'x': ..., 'y': ..., 'z': ...} and list format [x, y, z]
-            if isinstance(lm_i, dict):
-                x_i, y_i, z_i = float(lm_i['x']), float(lm_i['y']), float(lm_i['z'])
-            else:
-                x_i, y_i, z_i = float(lm_i[0]), float(lm_i[1]), float(lm_i[2])
-            if isinstance(lm_j, dict):
-                x_j, y_j, z_j = float(lm_j['x']), float(lm_j['y']), float(lm_j['z'])
-            else:
-                x_j, y_j, z_j = float(lm_j[0]), float(lm_j[1]), float(lm_j[2])
-
-            interpolated_landmarks.append({
-                'x': float((1 - weight) * x_i + weight * x_j),
-                'y': float((1 - weight) * y_i + weight * y_j),
-                'z': float((1 - weight) * z_i + weight * z_j)
-            })
-
-        # Interpolate other fields - handle both numeric and string timestamps
-        try:
-            timestamp_i = int(frame_i.get('timestamp', 0)) if frame_i.get('timestamp') else 0
-            timestamp_j = int(frame_j.get('timestamp', 0)) if frame_j.get('timestamp') else 0
-            interpolated_timestamp = int((1 - weight) * timestamp_i + weight * timestamp_j)
-        except (TypeError, ValueError) as e:
+        if timestamp_ok[t]:
+            interpolated_timestamp = interpolated_timestamps[t]
+        else:
             # If timestamp conversion fails, use current time
             import time
             interpolated_timestamp = int(time.time() * 1000)
 
-        try:
-            confidence_i = float(frame_i.get('confidence', 1.0))
-            confidence_j = float(frame_j.get('confidence', 1.0))
-            interpolated_confidence = float((1 - weight) * confidence_i + weight * confidence_j)
-        except (TypeError, ValueError):
-            interpolated_confidence = 1.0
-
         # Create interpolated frame
         resampled_frame = {
             'timestamp': interpolated_timestamp,
-            'landmarks': interpolated_landmarks,
-            'handedness': frame_i.get('handedness', 'Right'),  # Use first frame's handedness
-            'confidence': interpolated_confidence
+            'landmarks': [{'x': x, 'y': y, 'z': z} for x, y, z in interpolated[t]],
+            'handedness': frames[i].get('handedness', 'Right'),  # Use first frame's handedness
+            'confidence': interpolated_confidences[t] if confidence_ok[t] else 1.0
         }
 
         resampled_frames.append(resampled_frame)
@@ -159,15 +184,11 @@ def resample_landmarks_array(landmarks: np.ndarray, target_frames: int = 60) ->
         landmarks_2d = landmarks
         reshape_needed = False
 
-    # Create interpolation indices
-    original_indices = np.arange(original_frames)
-    target_indices = np.linspace(0, original_frames - 1, target_frames)
-
-    # Interpolate each feature dimension
-    resampled = np.zeros((target_frames, landmarks_2d.shape[1]))
-
-    for dim in range(landmarks_2d.shape[1]):
-        resampled[:, dim] = np.interp(target_indices, original_indices, landmarks_2d[:, dim])
+    # Source frames are evenly spaced, so each target frame is a blend of two
+    # neighbouring rows: one broadcast over all 63 features, no per-column interp
+    i_idx, j_idx, weights = _interpolation_weights(original_frames, target_frames)
+    w = weights[:, None]
+    resampled = (1 - w) * landmarks_2d[i_idx] + w * landmarks_2d[j_idx]
 
     # Reshape back if needed
     if reshape_needed:
@@ -249,26 +270,22 @@ def get_frame_statistics(frames: List[Dict]) -> Dict:
     }
 
 
-# Global instance for singleton pattern
-_frame_resampler_instance = None
+# Short names matching the keys of the old get_frame_resampler() dict
+resample_linear = resample_frames_linear
+resample_array = resample_landmarks_array
+validate_count = validate_frame_count
+get_stats = get_frame_statistics
 
 
 def get_frame_resampler():
     """
-    Get the global frame resampler instance (singleton pattern).
+    Get the frame resampler utility.
+
+    A module is already a singleton, so this returns the module itself:
+    callers use plain attribute access (rs.resample_array(...)) instead of a
+    dict lookup per call. Importing the functions directly works as well.
 
     Returns:
         Frame resampler utility (this module)
     """
-    global _frame_resampler_instance
-
-    if _frame_resampler_instance is None:
-        _frame_resampler_instance = {
-            'resample_linear': resample_frames_linear,
-            'resample_array': resample_landmarks_array,
-            'validate_count': validate_frame_count,
-            'get_stats': get_frame_statistics
-        }
-        logger.info("Frame resampler utility initialized")
-
-    return _frame_resampler_instance
+    return sys.modules[__name__]
@@ -20,36 +20,179 @@ Project: AirClick FYP - Phase 3 Caching
 """
 
 import numpy as np
-from typing import Dict, Optional, Tuple, Any
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple, Any
 import logging
 import hashlib
-import json
-from collections import OrderedDict
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import random
+import time
+from operator import itemgetter
+from threading import Lock, RLock
+
+from app.core.jit import njit, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# BLAKE3 is the fastest digest for the small key buffers hashed here; blake2b
+# (stdlib) is the fallback
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    logger.debug("blake3 not installed, gesture cache keys use hashlib.blake2b")
+
+# Landmarks sampled for the hash: wrist and fingertips (not all 21, to reduce
+# sensitivity)
+_KEY_IDX = (0, 4, 8, 12, 16, 20)
+_KEY_IDX_NP = np.array(_KEY_IDX, dtype=np.intp)
+_key_landmarks = itemgetter(*_KEY_IDX)
+_landmark_xyz = itemgetter('x', 'y', 'z')
+
+# Most gesture pairs are computed once, so a first-seen DTW distance is only
+# stored with this probability; a pair seen a second time is always stored
+DTW_CACHE_SAMPLE_RATE = 0.4
+
+# Shorter gestures skip the cache: their DTW is under a millisecond, less
+# than hashing the key costs
+MIN_CACHE_FRAMES = 6
+
+# Match results of a hand held still (total variance of all 21 landmarks,
+# in normalized coordinates, below this) aren't stored: resting-palm noise
+# collapses onto a few digests and would fill the match cache with useless
+# entries. Finger-only gestures (pinch, click) move enough to clear it.
+REST_HAND_VARIANCE = 1e-4
+
+# The DTW cache is split into this many independently locked LRUs, picked by
+# the low bits of the pair digest's first byte (a power of two <= 256)
+DTW_CACHE_SHARDS = 16
+
+
+@njit(cache=True)
+def _quantize_key_landmarks(landmarks, scale):
+    """
+    Gather the _KEY_IDX landmarks of every frame and round them to int32 steps.
+
+    One pass over the (n, 21, 3) array instead of a fancy-index copy, a
+    float32 round, a float64 cast, a multiply, np.rint and an int cast,
+    each allocating.
+
+    Args:
+        landmarks: (n_frames, 21, 3) float32/float64 array
+        scale: 10 ** precision
+
+    Returns:
+        (n_frames, 6, 3) int32 array, equal to _hash_points()'s quantization
+    """
+    n = landmarks.shape[0]
+    out = np.empty((n, 6, 3), dtype=np.int32)
+    for i in range(n):
+        for k in range(6):
+            idx = 4 * k  # wrist, then the fingertips 4, 8, 12, 16, 20
+            for c in range(3):
+                out[i, k, c] = np.int32(np.rint(np.float64(np.float32(landmarks[i, idx, c])) * scale))
+    return out
+
+
+def _hash_points(points: np.ndarray, precision: int) -> bytes:
+    """
+    Digest of key landmark coordinates quantized to steps of 10**-precision.
+
+    Coordinates are rounded to float32 first: a gesture packed into a float32
+    GestureTensor would otherwise quantize differently from its float64 frame
+    dicts wherever a value sits near a rounding boundary.
+    """
+    points = np.asarray(points, dtype=np.float32).astype(np.float64)
+    # int32: precision 3 would overflow int16 past |x| = 32.767
+    quantized = np.rint(points * 10 ** precision).astype(np.int32)
+    return _digest(quantized.tobytes())
+
+
+def _too_short(frames) -> bool:
+    """True if a gesture is below MIN_CACHE_FRAMES (not worth a cache key)."""
+    return frames is None or len(frames) < MIN_CACHE_FRAMES
+
+
+def _hand_at_rest(frames: list) -> bool:
+    """True if the whole hand barely moves over the gesture (see REST_HAND_VARIANCE)."""
+    hands = [
+        [_landmark_xyz(lm) if isinstance(lm, dict) else lm[:3] for lm in frame["landmarks"]]
+        for frame in frames
+        if len(frame.get("landmarks", [])) == 21
+    ]
+    if len(hands) < 2:
+        return True
+    variance = np.asarray(hands, dtype=np.float64).reshape(len(hands), -1).var(axis=0).sum()
+    return float(variance) < REST_HAND_VARIANCE
+
+
+def _digest(data: bytes) -> bytes:
+    """16-byte digest of data (BLAKE3 if installed, else blake2b)."""
+    if BLAKE3_AVAILABLE:
+        return blake3(data).digest(16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class _CacheEntry(NamedTuple):
+    """An LRUCache value with its time.monotonic() deadline."""
+    value: Any
+    expiry: float
+
 
 class LRUCache:
     """
     Least Recently Used (LRU) cache implementation.
 
-    Automatically evicts oldest entries when cache is full.
+    Automatically evicts oldest entries when cache is full. Recency is the
+    insertion order of a plain dict (an entry is moved to the end by popping
+    and re-inserting it), which is about half the memory of an OrderedDict.
+
+    Each entry is stored as a _CacheEntry(value, expiry) with a
+    time.monotonic() deadline, so expired entries are dropped on lookup without any side
+    table. Entries nobody asks for again are reaped by put() from a min-heap
+    of expiries, so they don't hold on to their values until LRU eviction.
     """
 
-    def __init__(self, max_size: int = 100):
+    def __init__(
+        self,
+        max_size: int = 100,
+        ttl_seconds: Optional[float] = None,
+        on_evict: Optional[Callable[[Hashable], None]] = None,
+        refresh_on_access: bool = False
+    ):
         """
         Initialize LRU cache.
 
         Args:
             max_size: Maximum number of entries to cache
+            ttl_seconds: Default time-to-live for entries (None = never expire)
+            on_evict: Called with the key of every entry the cache drops by
+                      itself (LRU eviction or expiry), e.g. to keep a
+                      secondary index in sync
+            refresh_on_access: Restart an entry's TTL (ttl_seconds) on every
+                               hit, so entries in active use don't expire
         """
         self.max_size = max_size
-        self.cache: OrderedDict = OrderedDict()
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self.refresh_on_access = refresh_on_access
+        self.cache: Dict[Hashable, _CacheEntry] = {}
         self.hits = 0
         self.misses = 0
 
-    def get(self, key: str) -> Optional[Any]:
+        # (expiry, sequence, key); the sequence number breaks ties so keys
+        # are never compared. Items go stale when their key is re-put or
+        # evicted and are skipped when popped.
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._expiry_seq = itertools.count()
+
+        # The matcher's thread pool reads and writes concurrently; dict
+        # reordering and the heap are not safe to interleave. Re-entrant so
+        # on_evict may call back into the cache.
+        self._lock = RLock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get value from cache.
 
@@ -57,41 +200,119 @@ class LRUCache:
             key: Cache key
 
         Returns:
-            Cached value or None if not found
+            Cached value or None if not found or expired
         """
-        if key in self.cache:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            now = time.monotonic()
+            if entry.expiry < now:
+                self._evict(key)
+                self.misses += 1
+                return None
+
             # Move to end (most recently used)
-            self.cache.move_to_end(key)
+            del self.cache[key]
+            if self.refresh_on_access and self.ttl_seconds is not None:
+                entry = _CacheEntry(entry.value, now + self.ttl_seconds)
+                heapq.heappush(self._expiry_heap, (entry.expiry, next(self._expiry_seq), key))
+            self.cache[key] = entry
+            if len(self._expiry_heap) > 2 * self.max_size:
+                self._rebuild_expiry_heap()
             self.hits += 1
-            return self.cache[key]
-        else:
-            self.misses += 1
-            return None
+            return entry.value
 
-    def put(self, key: str, value: Any) -> None:
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        on_insert: Optional[Callable[[Hashable], None]] = None
+    ) -> None:
         """
         Put value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
-        """
-        if key in self.cache:
-            # Update existing entry
-            self.cache.move_to_end(key)
-        else:
-            # Add new entry
-            if len(self.cache) >= self.max_size:
-                # Remove oldest entry (LRU)
-                self.cache.popitem(last=False)
+            ttl_seconds: Time-to-live for this entry (defaults to the cache's)
+            on_insert: Called with the key once the entry is stored, still
+                       under the cache lock, so bookkeeping that on_evict
+                       undoes can't race with an eviction of this entry
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+
+        with self._lock:
+            now = time.monotonic()
+            expiry = now + ttl_seconds if ttl_seconds is not None else float('inf')
+            self._reap_expired(now)
+
+            if key in self.cache:
+                # Update existing entry (re-inserted at the end below)
+                del self.cache[key]
+            else:
+                # Add new entry
+                if len(self.cache) >= self.max_size:
+                    # Remove oldest entry (LRU): the first key in insertion order
+                    self._evict(next(iter(self.cache)))
+
+            self.cache[key] = _CacheEntry(value, expiry)
+            if on_insert is not None:
+                on_insert(key)
+
+            if ttl_seconds is not None:
+                heapq.heappush(self._expiry_heap, (expiry, next(self._expiry_seq), key))
+                # Stale items pile up when hot keys are re-put; rebuild from the
+                # live entries before the heap outgrows the cache
+                if len(self._expiry_heap) > 2 * self.max_size:
+                    self._rebuild_expiry_heap()
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry if present (explicit invalidation; on_evict is not called).
 
-        self.cache[key] = value
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self.cache.pop(key, None)
+
+    def _reap_expired(self, now: float) -> None:
+        """Drop every entry whose deadline has passed (oldest deadlines first)."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expiry, _, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Only if the entry is still the one this item was pushed for
+            if entry is not None and entry.expiry == expiry:
+                self._evict(key)
+
+    def _evict(self, key: Hashable) -> None:
+        """Drop an entry the cache removes on its own and notify on_evict."""
+        del self.cache[key]
+        if self.on_evict is not None:
+            self.on_evict(key)
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from the live entries only."""
+        self._expiry_heap = [
+            (entry.expiry, next(self._expiry_seq), key)
+            for key, entry in self.cache.items()
+            if entry.expiry != float('inf')
+        ]
+        heapq.heapify(self._expiry_heap)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
+        with self._lock:
+            self.cache.clear()
+            self._expiry_heap.clear()
+            self.hits = 0
+            self.misses = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -113,60 +334,146 @@ class LRUCache:
         }
 
 
+class FrameBuffer(list):
+    """
+    Frame list that remembers its own hash_frames() digests.
+
+    A plain list can't be a cache key (unhashable, no weakrefs), so a
+    gesture whose frames are hashed over and over - stored templates, or a
+    poll loop re-querying the same input - is re-quantized every time. The
+    digests live on the buffer itself, so they are freed with it, and every
+    list mutator drops them. The frame dicts themselves must not be edited
+    in place once the buffer has been hashed.
+    """
+
+    __slots__ = ("_digests",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._digests: Dict[int, bytes] = {}
+
+    def __reduce__(self):
+        # Default list pickling refills the items through extend() before
+        # slot state is restored, which the wrapped mutators can't survive;
+        # rebuild from a plain list instead (digests are not carried over)
+        return (FrameBuffer, (list(self),))
+
+    def _mutator(name):
+        method = getattr(list, name)
+
+        def wrapper(self, *args, **kwargs):
+            self._digests.clear()
+            return method(self, *args, **kwargs)
+
+        wrapper.__name__ = name
+        return wrapper
+
+    for _name in (
+        "append", "extend", "insert", "pop", "remove", "clear", "sort",
+        "reverse", "__setitem__", "__delitem__", "__iadd__", "__imul__"
+    ):
+        locals()[_name] = _mutator(_name)
+    del _name, _mutator
+
+
 class GestureHasher:
     """
     Creates fast hashes for gesture frames to use as cache keys.
 
     Uses perceptual hashing - similar gestures get similar hashes.
+
+    Hashes are raw 16-byte digests: short bytes keys hash and compare
+    faster than hex strings and take a third of the memory. Match results
+    are keyed by (user_id, app_context, digest), DTW distances and features
+    by the digest alone.
     """
 
     @staticmethod
     def hash_frames(
         frames: list,
         precision: int = 2
-    ) -> str:
+    ) -> bytes:
         """
         Create hash from gesture frames.
 
+        The key landmarks of every frame are gathered into one array,
+        quantized to integer steps of 10**-precision (the rounding that
+        makes near-identical gestures collide) and the array bytes hashed
+        directly.
+
         Args:
-            frames: List of frame dictionaries
+            frames: List of frame dictionaries (a FrameBuffer reuses its
+                    earlier digests), or an already packed landmark array
+                    (see hash_landmarks_array)
             precision: Decimal precision for rounding (higher = more sensitive)
 
         Returns:
-            Hash string (32 characters)
+            16-byte digest
         """
-        if not frames:
-            return hashlib.md5(b"empty").hexdigest()
+        if isinstance(frames, np.ndarray):
+            return GestureHasher.hash_landmarks_array(frames, precision)
+        if isinstance(frames, FrameBuffer):
+            digest = frames._digests.get(precision)
+            if digest is None:
+                digest = frames._digests[precision] = GestureHasher._hash_frame_list(frames, precision)
+            return digest
+        return GestureHasher._hash_frame_list(frames, precision)
 
-        # Extract key features for hashing
-        features = []
+    @staticmethod
+    def _hash_frame_list(frames: list, precision: int) -> bytes:
+        """hash_frames() for a list of frame dicts, without the FrameBuffer memo."""
+        if not len(frames):
+            return _digest(b"empty")
+
+        # Full hands (the norm) take all key landmarks in one itemgetter
+        # call; only partial frames need the per-index bounds check
+        points = [
+            _landmark_xyz(lm) if isinstance(lm, dict) else lm[:3]
+            for frame in frames
+            for landmarks in (frame.get("landmarks", []),)
+            for lm in (
+                _key_landmarks(landmarks) if len(landmarks) >= 21
+                else [landmarks[idx] for idx in _KEY_IDX if idx < len(landmarks)]
+            )
+        ]
+        return _hash_points(np.array(points, dtype=np.float32), precision)
 
-        for frame in frames:
-            landmarks = frame.get("landmarks", [])
+    @staticmethod
+    def hash_landmarks_array(
+        landmarks: np.ndarray,
+        precision: int = 2
+    ) -> bytes:
+        """
+        hash_frames() for landmarks already packed as an array.
+
+        The key landmarks are one fancy-index. Coordinates are compared at
+        float32 precision (see _hash_points), so a gesture gives the same
+        digest here, float32 or float64, as through hash_frames() on its
+        frame dicts.
 
-            # Sample key landmarks (not all 21 to reduce sensitivity)
-            key_indices = [0, 4, 8, 12, 16, 20]  # Wrist and fingertips
+        Args:
+            landmarks: (n_frames, 21, 3) or (n_frames, 63) array
+            precision: Decimal precision for rounding (higher = more sensitive)
 
-            for idx in key_indices:
-                if idx < len(landmarks):
-                    lm = landmarks[idx]
-                    # Round to reduce sensitivity to minor variations
-                    features.extend([
-                        round(lm["x"], precision),
-                        round(lm["y"], precision),
-                        round(lm["z"], precision)
-                    ])
+        Returns:
+            16-byte digest
+        """
+        if not len(landmarks):
+            return _digest(b"empty")
 
-        # Create hash from features
-        features_str = json.dumps(features, sort_keys=True)
-        return hashlib.md5(features_str.encode()).hexdigest()
+        landmarks = landmarks.reshape(len(landmarks), 21, 3)
+        if NUMBA_AVAILABLE:
+            return _digest(_quantize_key_landmarks(landmarks, float(10 ** precision)).tobytes())
+
+        points = landmarks[:, _KEY_IDX_NP, :]
+        return _hash_points(points, precision)
 
     @staticmethod
     def hash_gesture_pair(
         frames1: list,
         frames2: list,
         precision: int = 2
-    ) -> str:
+    ) -> bytes:
         """
         Create hash for a pair of gestures (for DTW result caching).
 
@@ -176,16 +483,59 @@ class GestureHasher:
             precision: Decimal precision for rounding
 
         Returns:
-            Combined hash string
+            Combined 16-byte digest
         """
-        hash1 = GestureHasher.hash_frames(frames1, precision)
-        hash2 = GestureHasher.hash_frames(frames2, precision)
+        return GestureHasher.combine_pair(
+            GestureHasher.hash_frames(frames1, precision),
+            GestureHasher.hash_frames(frames2, precision)
+        )
 
-        # Sort to ensure consistent key regardless of order
-        hashes = sorted([hash1, hash2])
-        combined = f"{hashes[0]}:{hashes[1]}"
+    @staticmethod
+    def fingerprint(frames: list, precision: int = 2) -> Tuple:
+        """
+        Cheap second check stored next to a cached match result.
+
+        A digest collision would hand back another gesture's match (and fire
+        its action), so a hit is only trusted if the frame count and the
+        first/last wrist positions agree too. The wrists are rounded like
+        hash_frames(), so gestures that legitimately share a digest also
+        share the fingerprint.
+
+        Args:
+            frames: List of frame dictionaries
+            precision: Decimal precision used for the digest
+
+        Returns:
+            (frame_count, first_wrist, last_wrist) tuple
+        """
+        def wrist(frame):
+            landmarks = frame.get("landmarks", [])
+            if not len(landmarks):
+                return None
+            lm = landmarks[0]
+            xyz = np.array(_landmark_xyz(lm) if isinstance(lm, dict) else lm[:3], dtype=np.float32)
+            # Same float32 rounding as _hash_points, so boundary values land
+            # on the same step as in the digest
+            return tuple(np.rint(xyz.astype(np.float64) * 10 ** precision).astype(np.int32).tolist())
+
+        if not frames:
+            return (0, None, None)
+        return (len(frames), wrist(frames[0]), wrist(frames[-1]))
+
+    @staticmethod
+    def combine_pair(digest1: bytes, digest2: bytes) -> bytes:
+        """
+        Order-independent digest of two hash_frames() digests.
 
-        return hashlib.md5(combined.encode()).hexdigest()
+        Args:
+            digest1: First gesture digest
+            digest2: Second gesture digest
+
+        Returns:
+            Combined 16-byte digest
+        """
+        # Sort to ensure consistent key regardless of order
+        return _digest(min(digest1, digest2) + max(digest1, digest2))
 
 
 class GestureMatchCache:
@@ -196,6 +546,12 @@ class GestureMatchCache:
     1. Full match results (input gesture → best match)
     2. DTW distances (gesture pair → distance)
     3. Preprocessed features (gesture → features)
+
+    Match results refresh their TTL on every hit: a user repeating the
+    same gesture keeps hitting instead of missing once per TTL, and edits
+    still clear them through invalidate_user_cache(). DTW distances and
+    features are content-addressed (never stale), so they simply expire
+    after the TTL.
     """
 
     def __init__(
@@ -214,30 +570,86 @@ class GestureMatchCache:
             feature_cache_size: Max cached preprocessed features
             cache_ttl_minutes: Time-to-live for cache entries (minutes)
         """
-        self.match_cache = LRUCache(max_size=match_cache_size)
-        self.dtw_cache = LRUCache(max_size=dtw_cache_size)
-        self.feature_cache = LRUCache(max_size=feature_cache_size)
-        self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
+        # Entries carry their own expiry (see LRUCache)
+        self.cache_ttl_seconds = cache_ttl_minutes * 60.0
+        self.match_cache = LRUCache(
+            max_size=match_cache_size,
+            ttl_seconds=self.cache_ttl_seconds,
+            on_evict=self._forget_match_key,
+            refresh_on_access=True
+        )
+        # Sharded so concurrent DTW lookups don't all queue on one lock; the
+        # digest is uniform, so the shards fill evenly
+        shard_size = max(1, -(-dtw_cache_size // DTW_CACHE_SHARDS))
+        self.dtw_shards = [
+            LRUCache(max_size=shard_size, ttl_seconds=self.cache_ttl_seconds)
+            for _ in range(DTW_CACHE_SHARDS)
+        ]
+        self.feature_cache = LRUCache(max_size=feature_cache_size, ttl_seconds=self.cache_ttl_seconds)
         self.hasher = GestureHasher()
 
-        # Track cache entry timestamps for TTL
-        self.timestamps: Dict[str, datetime] = {}
-
-    def _is_expired(self, key: str) -> bool:
-        """
-        Check if cache entry has expired.
-
-        Args:
-            key: Cache key
-
-        Returns:
-            True if expired
-        """
-        if key not in self.timestamps:
-            return True
-
-        age = datetime.now() - self.timestamps[key]
-        return age > self.cache_ttl
+        # DTW pair keys seen once but not stored (insertion-ordered dict used
+        # as a FIFO set, see put_dtw_distance)
+        self._dtw_seen_once: Dict[bytes, bool] = {}
+        self._dtw_seen_once_size = 4 * dtw_cache_size
+
+        # Guards _user_keys and _dtw_seen_once. Never held while calling into
+        # an LRUCache (whose on_evict takes this lock), so lock order is
+        # always LRUCache -> this one
+        self._lock = RLock()
+
+        # user_id -> match cache keys owned by that user, so invalidating a
+        # user touches only their entries
+        self._user_keys: Dict[int, set] = {}
+
+        # (id(frames), precision) -> (frames, digest) for the current match
+        # request, so the input and every stored gesture are hashed once per
+        # request instead of once per cache lookup
+        self._frame_hashes: Dict[Tuple[int, int], Tuple[list, bytes]] = {}
+
+    def reset_frame_hashes(self) -> None:
+        """
+        Forget the per-request frame digests.
+
+        Call at the start of every match request: the memo is keyed on the
+        frame list's identity, so it must not outlive a request in which
+        the lists are known not to change.
+        """
+        self._frame_hashes.clear()
+
+    def _frame_hash(self, frames: list, precision: int = 2) -> bytes:
+        """hash_frames() memoized on the frame list object (see reset_frame_hashes)."""
+        key = (id(frames), precision)
+        entry = self._frame_hashes.get(key)
+        # Identity check: a recycled id() belongs to a different list
+        if entry is not None and entry[0] is frames:
+            return entry[1]
+
+        digest = self.hasher.hash_frames(frames, precision)
+        self._frame_hashes[key] = (frames, digest)
+        return digest
+
+    def _remember_match_key(self, key: Hashable) -> None:
+        """Add a newly stored match cache key to the per-user index."""
+        with self._lock:
+            self._user_keys.setdefault(key[0], set()).add(key)
+
+    def _forget_match_key(self, key: Hashable) -> None:
+        """Remove an evicted/expired match cache key from the per-user index."""
+        with self._lock:
+            user_keys = self._user_keys.get(key[0])
+            if user_keys is not None:
+                user_keys.discard(key)
+                if not user_keys:
+                    del self._user_keys[key[0]]
+
+    def _dtw_shard(self, cache_key: bytes) -> LRUCache:
+        """DTW cache shard owning a pair digest."""
+        return self.dtw_shards[cache_key[0] & (DTW_CACHE_SHARDS - 1)]
+
+    def _pair_hash(self, frames1: list, frames2: list) -> bytes:
+        """hash_gesture_pair() built from the memoized frame digests."""
+        return self.hasher.combine_pair(self._frame_hash(frames1), self._frame_hash(frames2))
 
     def get_match_result(
         self,
@@ -256,22 +668,27 @@ class GestureMatchCache:
         Returns:
             Cached (gesture, similarity) tuple or None
         """
-        # Create cache key
-        frame_hash = self.hasher.hash_frames(input_frames)
-        cache_key = f"match:{user_id}:{app_context}:{frame_hash}"
-
-        # Check if expired
-        if self._is_expired(cache_key):
+        if _too_short(input_frames):
             return None
 
+        # Create cache key
+        frame_hash = self._frame_hash(input_frames)
+        cache_key = (user_id, app_context, frame_hash)
+
         # Get from cache
-        result = self.match_cache.get(cache_key)
+        entry = self.match_cache.get(cache_key)
 
-        if result:
-            logger.debug(f"Match cache HIT: {cache_key[:16]}...")
-        else:
-            logger.debug(f"Match cache MISS: {cache_key[:16]}...")
+        if not entry:
+            logger.debug(f"Match cache MISS: {frame_hash.hex()[:16]}...")
+            return None
+
+        # A digest collision must not return (and trigger) another gesture
+        result, fingerprint = entry
+        if fingerprint != self.hasher.fingerprint(input_frames):
+            logger.warning(f"⚠ Match cache key collision on {frame_hash.hex()[:16]}..., ignoring cached result")
+            return None
 
+        logger.debug(f"Match cache HIT: {frame_hash.hex()[:16]}...")
         return result
 
     def put_match_result(
@@ -290,15 +707,23 @@ class GestureMatchCache:
             app_context: Application context
             result: (gesture, similarity) tuple to cache
         """
-        # Create cache key
-        frame_hash = self.hasher.hash_frames(input_frames)
-        cache_key = f"match:{user_id}:{app_context}:{frame_hash}"
+        if _too_short(input_frames) or _hand_at_rest(input_frames):
+            return
 
-        # Store in cache
-        self.match_cache.put(cache_key, result)
-        self.timestamps[cache_key] = datetime.now()
+        # Create cache key
+        frame_hash = self._frame_hash(input_frames)
+        cache_key = (user_id, app_context, frame_hash)
+
+        # Store in cache, with the fingerprint get_match_result() verifies.
+        # The key is registered for its user inside put(), so no other put
+        # can evict it (and run _forget_match_key) before it is registered.
+        self.match_cache.put(
+            cache_key,
+            (result, self.hasher.fingerprint(input_frames)),
+            on_insert=self._remember_match_key
+        )
 
-        logger.debug(f"Cached match result: {cache_key[:16]}...")
+        logger.debug(f"Cached match result: {frame_hash.hex()[:16]}...")
 
     def get_dtw_distance(
         self,
@@ -315,21 +740,19 @@ class GestureMatchCache:
         Returns:
             Cached DTW distance or None
         """
-        # Create cache key (order-independent)
-        pair_hash = self.hasher.hash_gesture_pair(frames1, frames2)
-        cache_key = f"dtw:{pair_hash}"
-
-        # Check if expired
-        if self._is_expired(cache_key):
+        if _too_short(frames1) or _too_short(frames2):
             return None
 
+        # Create cache key (order-independent)
+        cache_key = self._pair_hash(frames1, frames2)
+
         # Get from cache
-        distance = self.dtw_cache.get(cache_key)
+        distance = self._dtw_shard(cache_key).get(cache_key)
 
         if distance is not None:
-            logger.debug(f"DTW cache HIT: {cache_key[:16]}...")
+            logger.debug(f"DTW cache HIT: {cache_key.hex()[:16]}...")
         else:
-            logger.debug(f"DTW cache MISS: {cache_key[:16]}...")
+            logger.debug(f"DTW cache MISS: {cache_key.hex()[:16]}...")
 
         return distance
 
@@ -342,20 +765,35 @@ class GestureMatchCache:
         """
         Cache DTW distance computation.
 
+        Only a sample of first-seen pairs is stored (DTW_CACHE_SAMPLE_RATE);
+        the rest are remembered in a small FIFO so that a pair coming back
+        is stored on its second sighting. One-off pairs then stop churning
+        the LRU and pushing out the pairs that do repeat.
+
         Args:
             frames1: First gesture frames
             frames2: Second gesture frames
             distance: Computed DTW distance
         """
+        if _too_short(frames1) or _too_short(frames2):
+            return
+
         # Create cache key
-        pair_hash = self.hasher.hash_gesture_pair(frames1, frames2)
-        cache_key = f"dtw:{pair_hash}"
+        cache_key = self._pair_hash(frames1, frames2)
+
+        # Two-strike rule: second sighting always stored, first one sampled
+        with self._lock:
+            seen_before = self._dtw_seen_once.pop(cache_key, False)
+            if not seen_before and random.random() >= DTW_CACHE_SAMPLE_RATE:
+                self._dtw_seen_once[cache_key] = True
+                if len(self._dtw_seen_once) > self._dtw_seen_once_size:
+                    del self._dtw_seen_once[next(iter(self._dtw_seen_once))]
+                return
 
         # Store in cache
-        self.dtw_cache.put(cache_key, distance)
-        self.timestamps[cache_key] = datetime.now()
+        self._dtw_shard(cache_key).put(cache_key, distance)
 
-        logger.debug(f"Cached DTW distance: {cache_key[:16]}... = {distance:.2f}")
+        logger.debug(f"Cached DTW distance: {cache_key.hex()[:16]}... = {distance:.2f}")
 
     def get_preprocessed_features(
         self,
@@ -368,24 +806,25 @@ class GestureMatchCache:
             frames: Gesture frames
 
         Returns:
-            Cached feature array or None
+            Cached feature array (float32, see put_preprocessed_features) or None
         """
-        # Create cache key
-        frame_hash = self.hasher.hash_frames(frames, precision=3)  # Higher precision
-        cache_key = f"features:{frame_hash}"
-
-        # Check if expired
-        if self._is_expired(cache_key):
+        if _too_short(frames):
             return None
 
+        # Create cache key
+        cache_key = self._frame_hash(frames, precision=3)  # Higher precision
+
         # Get from cache
-        features = self.feature_cache.get(cache_key)
+        entry = self.feature_cache.get(cache_key)
 
-        if features is not None:
-            logger.debug(f"Feature cache HIT: {cache_key[:16]}...")
-        else:
-            logger.debug(f"Feature cache MISS: {cache_key[:16]}...")
+        if entry is None:
+            logger.debug(f"Feature cache MISS: {cache_key.hex()[:16]}...")
+            return None
 
+        logger.debug(f"Feature cache HIT: {cache_key.hex()[:16]}...")
+        scaled, scale = entry
+        features = scaled.astype(np.float32)
+        features *= scale
         return features
 
     def put_preprocessed_features(
@@ -396,26 +835,41 @@ class GestureMatchCache:
         """
         Cache preprocessed features.
 
+        Stored as float16 scaled by the array's max magnitude, at half the
+        memory of float32. The round trip is accurate to ~2.5e-4 of that
+        magnitude, well below landmark jitter.
+
         Args:
             frames: Gesture frames
             features: Preprocessed feature array
         """
+        if _too_short(frames):
+            return
+
         # Create cache key
-        frame_hash = self.hasher.hash_frames(frames, precision=3)
-        cache_key = f"features:{frame_hash}"
+        cache_key = self._frame_hash(frames, precision=3)
 
-        # Store in cache (convert to list for JSON serialization)
-        self.feature_cache.put(cache_key, features)
-        self.timestamps[cache_key] = datetime.now()
+        # Per-array scale keeps values in [-1, 1], where float16 is densest
+        # and can't overflow
+        features = np.asarray(features, dtype=np.float32)
+        scale = float(np.abs(features).max()) if features.size else 0.0
+        if not np.isfinite(scale) or scale == 0.0:
+            scale = 1.0
+        scaled = np.ascontiguousarray(features / scale, dtype=np.float16)
+        self.feature_cache.put(cache_key, (scaled, scale))
 
-        logger.debug(f"Cached features: {cache_key[:16]}... shape={features.shape}")
+        logger.debug(f"Cached features: {cache_key.hex()[:16]}... shape={features.shape}")
 
     def clear_all(self) -> None:
         """Clear all caches."""
         self.match_cache.clear()
-        self.dtw_cache.clear()
+        for shard in self.dtw_shards:
+            shard.clear()
         self.feature_cache.clear()
-        self.timestamps.clear()
+        with self._lock:
+            self._user_keys.clear()
+            self._dtw_seen_once.clear()
+        self._frame_hashes.clear()
         logger.info("All caches cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -427,14 +881,31 @@ class GestureMatchCache:
         """
         return {
             'match_cache': self.match_cache.get_stats(),
-            'dtw_cache': self.dtw_cache.get_stats(),
+            'dtw_cache': self._dtw_stats(),
             'feature_cache': self.feature_cache.get_stats(),
             'total_cached_entries': (
                 len(self.match_cache.cache) +
-                len(self.dtw_cache.cache) +
+                sum(len(shard.cache) for shard in self.dtw_shards) +
                 len(self.feature_cache.cache)
             ),
-            'cache_ttl_minutes': self.cache_ttl.total_seconds() / 60
+            'cache_ttl_minutes': self.cache_ttl_seconds / 60
+        }
+
+    def _dtw_stats(self) -> Dict[str, Any]:
+        """LRUCache.get_stats() summed over the DTW shards."""
+        shard_stats = [shard.get_stats() for shard in self.dtw_shards]
+        hits = sum(stats['hits'] for stats in shard_stats)
+        misses = sum(stats['misses'] for stats in shard_stats)
+        total_requests = hits + misses
+
+        return {
+            'size': sum(stats['size'] for stats in shard_stats),
+            'max_size': sum(stats['max_size'] for stats in shard_stats),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total_requests if total_requests > 0 else 0.0,
+            'total_requests': total_requests,
+            'shards': len(shard_stats)
         }
 
     def invalidate_user_cache(self, user_id: int) -> None:
@@ -446,22 +917,19 @@ class GestureMatchCache:
         Args:
             user_id: User ID
         """
-        # Remove match cache entries for this user
-        keys_to_remove = [
-            key for key in self.match_cache.cache.keys()
-            if key.startswith(f"match:{user_id}:")
-        ]
+        # Remove match cache entries for this user (per-user index, no scan)
+        with self._lock:
+            keys_to_remove = self._user_keys.pop(user_id, ())
 
         for key in keys_to_remove:
-            del self.match_cache.cache[key]
-            if key in self.timestamps:
-                del self.timestamps[key]
+            self.match_cache.discard(key)
 
         logger.info(f"Invalidated {len(keys_to_remove)} cache entries for user {user_id}")
 
 
 # Global cache instance
 _gesture_cache_instance: Optional[GestureMatchCache] = None
+_gesture_cache_lock = Lock()
 
 
 def get_gesture_cache(
@@ -484,13 +952,17 @@ def get_gesture_cache(
     """
     global _gesture_cache_instance
 
+    # Double-checked: the lock is only taken until the instance exists, and
+    # two threads racing on first use can't each build (and lose) a cache
     if _gesture_cache_instance is None:
-        _gesture_cache_instance = GestureMatchCache(
-            match_cache_size=match_cache_size,
-            dtw_cache_size=dtw_cache_size,
-            feature_cache_size=feature_cache_size,
-            cache_ttl_minutes=cache_ttl_minutes
-        )
+        with _gesture_cache_lock:
+            if _gesture_cache_instance is None:
+                _gesture_cache_instance = GestureMatchCache(
+                    match_cache_size=match_cache_size,
+                    dtw_cache_size=dtw_cache_size,
+                    feature_cache_size=feature_cache_size,
+                    cache_ttl_minutes=cache_ttl_minutes
+                )
 
     return _gesture_cache_instance
 
@@ -19,22 +19,118 @@ Project: AirClick FYP - Phase 3 Scalability Enhancement
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Union
 import logging
 from dataclasses import dataclass
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import hashlib
+from collections import OrderedDict
+from itertools import chain
+from operator import itemgetter
+from threading import Lock
+import os
+
+from app.core.jit import njit
+
+# joblib ships with scikit-learn; large index builds fan signature
+# extraction out over worker processes when it is present
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_landmark_xyz = itemgetter("x", "y", "z")
+
+# Early rejection filters in evaluation order; bit i of a rejection mask is
+# set when filter i fails
+_REJECTION_FILTERS = ("frame_count", "centroid", "trajectory", "velocity")
+# Rejection mask -> index of the first failed filter (the one a rejection is
+# attributed to), or len(_REJECTION_FILTERS) for "passed"
+_FIRST_FAILED_FILTER = np.array(
+    [(mask & -mask).bit_length() - 1 if mask else len(_REJECTION_FILTERS)
+     for mask in range(1 << len(_REJECTION_FILTERS))],
+    dtype=np.intp
+)
+
+# Faiss trains K-means in a single run and answers nearest-center queries
+# with one BLAS call; sklearn KMeans is the fallback
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+    logger.debug("faiss not installed, gesture clustering uses sklearn KMeans")
+
+
+@njit(cache=True)
+def _signature_kernel(landmarks, dt):
+    """
+    Signature statistics of a (F, 21, 3) landmark array in one pass.
 
-@dataclass
+    Args:
+        landmarks: (F, 21, 3) float64 array
+        dt: Seconds between frames
+
+    Returns:
+        (x_min, y_min, x_max, y_max, cx, cy, cz,
+         trajectory_length, velocity_mean, velocity_std)
+    """
+    n_frames = landmarks.shape[0]
+    n_landmarks = landmarks.shape[1]
+    lo = np.full(3, np.inf)
+    hi = np.full(3, -np.inf)
+    total = np.zeros(3)
+    for i in range(n_frames):
+        for j in range(n_landmarks):
+            for c in range(3):
+                v = landmarks[i, j, c]
+                if v < lo[c]:
+                    lo[c] = v
+                if v > hi[c]:
+                    hi[c] = v
+                total[c] += v
+    count = n_frames * n_landmarks
+
+    # Wrist (landmark 0) step lengths; velocities are the same steps / dt
+    trajectory_length = 0.0
+    velocity_mean = 0.0
+    velocity_std = 0.0
+    if n_frames > 1:
+        steps = np.empty(n_frames - 1)
+        for i in range(n_frames - 1):
+            dx = landmarks[i + 1, 0, 0] - landmarks[i, 0, 0]
+            dy = landmarks[i + 1, 0, 1] - landmarks[i, 0, 1]
+            dz = landmarks[i + 1, 0, 2] - landmarks[i, 0, 2]
+            steps[i] = np.sqrt(dx * dx + dy * dy + dz * dz)
+            trajectory_length += steps[i]
+        velocity_mean = trajectory_length / dt / (n_frames - 1)
+        sq = 0.0
+        for i in range(n_frames - 1):
+            dev = steps[i] / dt - velocity_mean
+            sq += dev * dev
+        velocity_std = np.sqrt(sq / (n_frames - 1))
+
+    return (
+        lo[0], lo[1], hi[0], hi[1],
+        total[0] / count, total[1] / count, total[2] / count,
+        trajectory_length, velocity_mean, velocity_std
+    )
+
+
+@dataclass(slots=True)
 class GestureSignature:
     """
     Quick signature for fast gesture filtering.
 
     These features are computed in <1ms and used for early rejection
     before expensive DTW computation (10-16ms per comparison).
+
+    Slotted: the index keeps one per stored gesture, and without a
+    per-instance __dict__ each is about a third of the size. The filters
+    themselves read the packed copy in SignatureArrays.
     """
     gesture_id: int
     frame_count: int
@@ -47,6 +143,48 @@ class GestureSignature:
     cluster_id: Optional[int] = None  # Assigned cluster
 
 
+@dataclass
+class SignatureArrays:
+    """
+    Structure-of-arrays view of many GestureSignatures, one row per gesture,
+    so the early rejection filters run as a few NumPy operations instead of
+    one Python call per candidate.
+    """
+    gesture_ids: np.ndarray  # (N,) gesture IDs, row order
+    rows: Dict[int, int]  # gesture_id -> row
+    frame_counts: np.ndarray  # (N,) float64
+    centroids: np.ndarray  # (N, 3) float64
+    trajectory_lengths: np.ndarray  # (N,) float64
+    velocity_means: np.ndarray  # (N,) float64
+    cluster_ids: np.ndarray  # (N + 1,) int32, -1 = unclustered; the extra
+                             # last row is -1 so row -1 (unknown gesture)
+                             # reads as unclustered
+
+    @classmethod
+    def from_signatures(cls, signatures: List[GestureSignature]) -> "SignatureArrays":
+        """
+        Pack signatures into arrays.
+
+        Args:
+            signatures: Gesture signatures (row i is signatures[i])
+
+        Returns:
+            SignatureArrays instance
+        """
+        return cls(
+            gesture_ids=np.array([sig.gesture_id for sig in signatures]),
+            rows={sig.gesture_id: row for row, sig in enumerate(signatures)},
+            frame_counts=np.array([sig.frame_count for sig in signatures], dtype=np.float64),
+            centroids=np.array([sig.centroid for sig in signatures], dtype=np.float64).reshape(-1, 3),
+            trajectory_lengths=np.array([sig.trajectory_length for sig in signatures], dtype=np.float64),
+            velocity_means=np.array([sig.velocity_mean for sig in signatures], dtype=np.float64),
+            cluster_ids=np.array(
+                [-1 if sig.cluster_id is None else sig.cluster_id for sig in signatures] + [-1],
+                dtype=np.int32
+            )
+        )
+
+
 class EarlyRejectionFilter:
     """
     Fast filters to reject obviously dissimilar gestures before DTW.
@@ -95,11 +233,39 @@ class EarlyRejectionFilter:
         logger.info(f"  - Trajectory tolerance: ±{trajectory_tolerance*100:.0f}%")
         logger.info(f"  - Velocity tolerance: ±{velocity_tolerance*100:.0f}%")
 
+    def effective_thresholds(
+        self,
+        strict: bool = False,
+        multiplier: float = 1.0
+    ) -> Tuple[float, float, float, float]:
+        """
+        Tolerances actually applied for one query.
+
+        Computed once per query and passed to should_reject()/reject_batch(),
+        so the filter's own settings are never modified while filtering.
+
+        Args:
+            strict: Use stricter thresholds (for large databases)
+            multiplier: Database-size factor applied to every tolerance
+
+        Returns:
+            (frame_tol, centroid_tol, traj_tol, vel_tol)
+        """
+        # Adjust tolerances for strict mode
+        # FIXED: Even in strict mode, don't be TOO strict
+        return (
+            self.frame_count_tolerance * multiplier * (0.7 if strict else 1.0),
+            self.centroid_distance_threshold * multiplier * (0.7 if strict else 1.0),
+            self.trajectory_tolerance * multiplier * (0.8 if strict else 1.0),
+            self.velocity_tolerance * multiplier * (0.8 if strict else 1.0)
+        )
+
     def should_reject(
         self,
         input_sig: GestureSignature,
         stored_sig: GestureSignature,
-        strict: bool = False
+        strict: bool = False,
+        thresholds: Optional[Tuple[float, float, float, float]] = None
     ) -> Tuple[bool, str]:
         """
         Check if stored gesture should be rejected without DTW computation.
@@ -110,16 +276,14 @@ class EarlyRejectionFilter:
             input_sig: Input gesture signature
             stored_sig: Stored gesture signature
             strict: Use stricter thresholds (for large databases)
+            thresholds: Precomputed effective_thresholds() (overrides strict)
 
         Returns:
             Tuple of (should_reject, reason)
         """
-        # Adjust tolerances for strict mode
-        # FIXED: Even in strict mode, don't be TOO strict
-        frame_tol = self.frame_count_tolerance * (0.7 if strict else 1.0)
-        centroid_tol = self.centroid_distance_threshold * (0.7 if strict else 1.0)
-        traj_tol = self.trajectory_tolerance * (0.8 if strict else 1.0)
-        vel_tol = self.velocity_tolerance * (0.8 if strict else 1.0)
+        if thresholds is None:
+            thresholds = self.effective_thresholds(strict)
+        frame_tol, centroid_tol, traj_tol, vel_tol = thresholds
 
         # Filter 1: Frame count difference
         frame_diff = abs(input_sig.frame_count - stored_sig.frame_count)
@@ -161,6 +325,85 @@ class EarlyRejectionFilter:
         # Passed all filters
         return False, "passed"
 
+    def reject_batch(
+        self,
+        input_sig: GestureSignature,
+        stored: SignatureArrays,
+        thresholds: Tuple[float, float, float, float],
+        rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        should_reject() for every row of a SignatureArrays at once.
+
+        Applies the same filters, in the same order and with the same
+        thresholds, as vectorized masks; a row is attributed to the first
+        filter it fails.
+
+        Args:
+            input_sig: Input gesture signature
+            stored: Stored gesture signatures
+            thresholds: effective_thresholds() for this query
+            rows: Rows to test (None = all)
+
+        Returns:
+            Tuple of (keep mask over the tested rows, rejected count per filter)
+        """
+        frame_counts = stored.frame_counts
+        centroids = stored.centroids
+        trajectory_lengths = stored.trajectory_lengths
+        velocity_means = stored.velocity_means
+        if rows is not None:
+            frame_counts = frame_counts[rows]
+            centroids = centroids[rows]
+            trajectory_lengths = trajectory_lengths[rows]
+            velocity_means = velocity_means[rows]
+
+        frame_tol, centroid_tol, traj_tol, vel_tol = thresholds
+
+        # Filter 1: Frame count difference
+        frame_ratio = (
+            np.abs(frame_counts - input_sig.frame_count)
+            / np.maximum(frame_counts, input_sig.frame_count)
+        )
+
+        # Filter 3: Centroid distance (Filter 2, handedness, is removed; see should_reject)
+        centroid_dist = np.linalg.norm(
+            centroids - np.asarray(input_sig.centroid, dtype=np.float64),
+            axis=1
+        )
+
+        # Filter 4: Trajectory length difference
+        max_traj = np.maximum(trajectory_lengths, input_sig.trajectory_length)
+        traj_ratio = np.where(
+            max_traj > 1e-6,
+            np.abs(trajectory_lengths - input_sig.trajectory_length) / np.maximum(max_traj, 1e-6),
+            0.0
+        )
+
+        # Filter 5: Velocity difference
+        max_vel = np.maximum(np.maximum(velocity_means, input_sig.velocity_mean), 1e-6)
+        vel_ratio = np.abs(velocity_means - input_sig.velocity_mean) / max_vel
+
+        # One bit per failed filter (see _REJECTION_FILTERS); the first set
+        # bit is the reason a row is counted under
+        mask = (
+            (frame_ratio > frame_tol)
+            + 2 * (centroid_dist > centroid_tol)
+            + 4 * (traj_ratio > traj_tol)
+            + 8 * (vel_ratio > vel_tol)
+        )
+        counts = np.bincount(
+            _FIRST_FAILED_FILTER[mask],
+            minlength=len(_REJECTION_FILTERS) + 1
+        )
+        rejected = {
+            name: int(count)
+            for name, count in zip(_REJECTION_FILTERS, counts)
+            if count
+        }
+
+        return mask == 0, rejected
+
 
 class GestureClusterer:
     """
@@ -187,8 +430,12 @@ class GestureClusterer:
         """
         self.n_clusters = n_clusters
         self.auto_clusters = auto_clusters
-        self.kmeans: Optional[KMeans] = None
+        self.kmeans: Optional[Union[KMeans, MiniBatchKMeans]] = None
         self.cluster_centers: Optional[np.ndarray] = None
+        self.index = None  # faiss.IndexFlatL2 over cluster_centers
+        # Training normalization, applied to query features too
+        self.features_mean: Optional[np.ndarray] = None
+        self.features_inv_std: Optional[np.ndarray] = None
         self.is_fitted = False
 
     def compute_optimal_clusters(self, n_gestures: int) -> int:
@@ -230,7 +477,12 @@ class GestureClusterer:
         Returns:
             Feature vector for clustering (7 features)
         """
-        features = [
+        return np.array(self._cluster_feature_values(signature), dtype=np.float32)
+
+    @staticmethod
+    def _cluster_feature_values(signature: GestureSignature) -> Tuple[float, ...]:
+        """The 7 extract_cluster_features() values as a plain tuple."""
+        return (
             signature.frame_count / 100.0,  # Normalize
             signature.centroid[0],
             signature.centroid[1],
@@ -238,9 +490,7 @@ class GestureClusterer:
             signature.trajectory_length,
             signature.velocity_mean,
             signature.velocity_std
-        ]
-
-        return np.array(features, dtype=np.float32)
+        )
 
     def fit(
         self,
@@ -266,27 +516,68 @@ class GestureClusterer:
 
         logger.info(f"Clustering {len(signatures)} gestures into {self.n_clusters} clusters")
 
-        # Extract features for clustering
-        features = np.array([
-            self.extract_cluster_features(sig) for sig in signatures
-        ])
+        # Extract features for clustering, straight into one (N, 7) matrix
+        # (no per-signature arrays)
+        features = np.array(
+            [self._cluster_feature_values(sig) for sig in signatures],
+            dtype=np.float32
+        )
 
         # Normalize features for clustering
         features_mean = np.mean(features, axis=0)
         features_std = np.std(features, axis=0)
         features_std[features_std == 0] = 1.0
-        features_normalized = (features - features_mean) / features_std
-
-        # Fit K-means
-        self.kmeans = KMeans(
-            n_clusters=self.n_clusters,
-            random_state=42,
-            n_init=10,
-            max_iter=300
+        features_normalized = np.ascontiguousarray(
+            (features - features_mean) / features_std, dtype=np.float32
         )
+        self.features_mean = features_mean.astype(np.float32)
+        self.features_inv_std = (1.0 / features_std).astype(np.float32)
+
+        if FAISS_AVAILABLE:
+            # One K-means run: on 7-D features the 10 restarts sklearn does
+            # (n_init=10) cost 10x for no visible gain
+            kmeans = faiss.Kmeans(
+                features_normalized.shape[1],
+                self.n_clusters,
+                niter=20,
+                nredo=1,
+                seed=42
+            )
+            kmeans.train(features_normalized)
+            self.kmeans = None
+            self.cluster_centers = np.ascontiguousarray(kmeans.centroids, dtype=np.float32)
+            self.index = faiss.IndexFlatL2(features_normalized.shape[1])
+            self.index.add(self.cluster_centers)
+            cluster_labels = self.index.search(features_normalized, 1)[1][:, 0]
+        else:
+            # Fit K-means: one k-means++ init with a short iteration budget.
+            # On 7-D features restarts and long runs change the inertia by a
+            # few percent at ~10x the time; mini-batches take over for
+            # databases large enough that full Lloyd passes add up
+            if len(signatures) < 2000:
+                self.kmeans = KMeans(
+                    n_clusters=self.n_clusters,
+                    random_state=42,
+                    n_init=1,
+                    init='k-means++',
+                    max_iter=50,
+                    tol=1e-3,
+                    # Elkan's triangle-inequality pruning pays off with few centers
+                    algorithm='elkan' if self.n_clusters <= 8 else 'lloyd'
+                )
+            else:
+                self.kmeans = MiniBatchKMeans(
+                    n_clusters=self.n_clusters,
+                    random_state=42,
+                    n_init=1,
+                    batch_size=min(256, len(signatures)),
+                    max_iter=50
+                )
+
+            cluster_labels = self.kmeans.fit_predict(features_normalized)
+            self.cluster_centers = np.ascontiguousarray(self.kmeans.cluster_centers_, dtype=np.float32)
+            self.index = None
 
-        cluster_labels = self.kmeans.fit_predict(features_normalized)
-        self.cluster_centers = self.kmeans.cluster_centers_
         self.is_fitted = True
 
         # Assign cluster IDs to signatures
@@ -316,11 +607,19 @@ class GestureClusterer:
         Returns:
             List of cluster IDs (sorted by distance)
         """
-        if not self.is_fitted or self.kmeans is None:
+        if not self.is_fitted or self.cluster_centers is None:
             return []
 
-        # Extract and normalize features
+        # Extract and normalize features (the centers live in the normalized
+        # space fit() trained in)
         features = self.extract_cluster_features(signature).reshape(1, -1)
+        features = (features - self.features_mean) * self.features_inv_std
+
+        top_k = min(top_k, self.n_clusters)
+
+        if self.index is not None:
+            _, closest_clusters = self.index.search(features, top_k)
+            return closest_clusters[0].tolist()
 
         # Calculate distances to all cluster centers
         distances = np.linalg.norm(
@@ -329,12 +628,36 @@ class GestureClusterer:
         )
 
         # Get top K closest clusters
-        top_k = min(top_k, self.n_clusters)
         closest_clusters = np.argsort(distances)[:top_k]
 
         return closest_clusters.tolist()
 
 
+# Index builds with at least this many gestures extract signatures in a
+# process pool (see GestureIndexer.build_index)
+PARALLEL_SIGNATURE_MIN_GESTURES = 500
+
+
+def _extract_signature_safe(
+    gesture_id: int,
+    frames: List[Dict]
+) -> Tuple[Optional[GestureSignature], Optional[str]]:
+    """
+    Extract one signature without raising, so it can run in a worker process.
+
+    Args:
+        gesture_id: Gesture ID
+        frames: List of frame dictionaries
+
+    Returns:
+        (signature, None) on success, (None, error message) on failure
+    """
+    try:
+        return GestureIndexer.extract_signature(gesture_id, frames), None
+    except Exception as e:
+        return None, str(e)
+
+
 class GestureIndexer:
     """
     Main indexing system combining all Phase 3 optimizations.
@@ -378,10 +701,18 @@ class GestureIndexer:
         # Cache for gesture signatures (gesture_id -> signature)
         self.signature_cache: Dict[int, GestureSignature] = {}
 
+        # signature_cache packed into arrays (see _get_signature_arrays)
+        self._signature_arrays: Optional[SignatureArrays] = None
+
+        # Recent input signatures (see _get_input_signature), LRU order
+        self._input_signatures: OrderedDict = OrderedDict()  # frame ids -> (frames, signature)
+        self._input_signatures_size = 8
+        self._input_signatures_lock = Lock()
+
         logger.info("✅ FIXED: Gesture indexer initialized with dynamic filtering")
 
+    @staticmethod
     def extract_signature(
-        self,
         gesture_id: int,
         frames: List[Dict]
     ) -> GestureSignature:
@@ -400,6 +731,32 @@ class GestureIndexer:
         if not frames:
             raise ValueError("Cannot extract signature from empty frames")
 
+        # Get handedness from first frame (assuming consistent)
+        handedness = frames[0].get("handedness", "Right")
+
+        # Full-hand frames (the norm): pack once, one compiled pass for all stats
+        if all(len(frame.get("landmarks", [])) == 21 for frame in frames):
+            landmarks = np.fromiter(
+                chain.from_iterable(map(_landmark_xyz, chain.from_iterable(
+                    frame["landmarks"] for frame in frames
+                ))),
+                dtype=np.float64,
+                count=len(frames) * 63
+            ).reshape(len(frames), 21, 3)
+            (x_min, y_min, x_max, y_max, cx, cy, cz,
+             trajectory_length, velocity_mean, velocity_std) = _signature_kernel(landmarks, 1 / 30)
+
+            return GestureSignature(
+                gesture_id=gesture_id,
+                frame_count=len(frames),
+                handedness=handedness,
+                bounding_box=(x_min, y_min, x_max, y_max),
+                centroid=(cx, cy, cz),
+                trajectory_length=trajectory_length,
+                velocity_mean=velocity_mean,
+                velocity_std=velocity_std
+            )
+
         # Extract landmarks from all frames
         all_landmarks = []
         for frame in frames:
@@ -442,9 +799,6 @@ class GestureIndexer:
         velocity_mean = np.mean(velocities) if len(velocities) > 0 else 0.0
         velocity_std = np.std(velocities) if len(velocities) > 0 else 0.0
 
-        # Get handedness from first frame (assuming consistent)
-        handedness = frames[0].get("handedness", "Right")
-
         return GestureSignature(
             gesture_id=gesture_id,
             frame_count=len(frames),
@@ -476,26 +830,47 @@ class GestureIndexer:
         # Extract signatures for all gestures
         signatures = []
 
+        jobs = []
         for gesture in gestures:
-            try:
-                gesture_id = gesture.get("id")
-                landmark_data = gesture.get("landmark_data", {})
-                frames = landmark_data.get("frames", [])
+            gesture_id = gesture.get("id")
+            frames = (gesture.get("landmark_data") or {}).get("frames", [])
 
-                if not frames:
-                    logger.warning(f"Gesture {gesture_id}: No frames, skipping")
-                    continue
+            if not frames:
+                logger.warning(f"Gesture {gesture_id}: No frames, skipping")
+                continue
 
-                signature = self.extract_signature(gesture_id, frames)
-                signatures.append(signature)
+            jobs.append((gesture_id, frames))
+
+        # Signatures are not memoized across rebuilds (e.g. joblib.Memory):
+        # keying a gesture on its landmark bytes walks every landmark dict,
+        # which costs as much as extracting the signature itself
+        results = None
+        if (JOBLIB_AVAILABLE and len(jobs) >= PARALLEL_SIGNATURE_MIN_GESTURES
+                and (os.cpu_count() or 1) > 1):
+            # Shipping frames to a worker costs about as much as extracting
+            # them, so only large builds on multi-core machines gain anything.
+            # Workers get plain lists: gesture_store hands out FrameBuffers.
+            try:
+                results = Parallel(n_jobs=-1, backend="loky", batch_size=64)(
+                    delayed(_extract_signature_safe)(gesture_id, list(frames))
+                    for gesture_id, frames in jobs
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Parallel signature extraction failed ({e}), extracting serially")
 
-                # Cache signature
-                self.signature_cache[gesture_id] = signature
+        if results is None:
+            results = [_extract_signature_safe(gesture_id, frames) for gesture_id, frames in jobs]
 
-            except Exception as e:
-                logger.error(f"Error extracting signature for gesture {gesture.get('id')}: {e}")
+        for (gesture_id, _), (signature, error) in zip(jobs, results):
+            if signature is None:
+                logger.error(f"Error extracting signature for gesture {gesture_id}: {error}")
                 continue
 
+            signatures.append(signature)
+
+            # Cache signature
+            self.signature_cache[gesture_id] = signature
+
         logger.info(f"Extracted {len(signatures)} signatures")
 
         # Build clustering index
@@ -507,8 +882,55 @@ class GestureIndexer:
                 if sig.gesture_id in self.signature_cache:
                     self.signature_cache[sig.gesture_id].cluster_id = sig.cluster_id
 
+        self._signature_arrays = SignatureArrays.from_signatures(list(self.signature_cache.values()))
+
         logger.info(f"Index building complete!")
 
+    def _get_input_signature(self, input_frames: List[Dict]) -> GestureSignature:
+        """
+        extract_signature() for query input, memoized over the last few inputs.
+
+        Debouncing and retries re-run candidate selection on the same frame
+        dicts, often in a new list (e.g. a re-sliced window). The key is the
+        identity of every frame dict: it is exact as long as frames are not
+        edited in place, and the entry holds the frames so their ids can't
+        be reused by other objects while it lives.
+
+        Args:
+            input_frames: Input gesture frames
+
+        Returns:
+            GestureSignature of the input
+        """
+        key = tuple(map(id, input_frames))
+        with self._input_signatures_lock:
+            entry = self._input_signatures.get(key)
+            if entry is not None:
+                self._input_signatures.move_to_end(key)
+                return entry[1]
+
+        signature = self.extract_signature(-1, input_frames)
+
+        with self._input_signatures_lock:
+            self._input_signatures[key] = (tuple(input_frames), signature)
+            if len(self._input_signatures) > self._input_signatures_size:
+                self._input_signatures.popitem(last=False)
+        return signature
+
+    def _get_signature_arrays(self) -> SignatureArrays:
+        """
+        signature_cache as SignatureArrays, repacked when signatures were
+        added since the last pack (the cache only ever grows).
+
+        Returns:
+            SignatureArrays over every cached signature
+        """
+        arrays = self._signature_arrays
+        if arrays is None or len(arrays.rows) != len(self.signature_cache):
+            arrays = SignatureArrays.from_signatures(list(self.signature_cache.values()))
+            self._signature_arrays = arrays
+        return arrays
+
     def get_candidate_gestures(
         self,
         input_frames: List[Dict],
@@ -542,36 +964,34 @@ class GestureIndexer:
 
         # Extract input signature
         try:
-            input_sig = self.extract_signature(-1, input_frames)
+            input_sig = self._get_input_signature(input_frames)
         except Exception as e:
             logger.error(f"Error extracting input signature: {e}")
             return all_gestures, stats
 
-        candidates = all_gestures
+        # Clustering and early rejection both work on signature rows; each
+        # gesture is looked up once, and only the survivors are mapped back
+        arrays = self._get_signature_arrays()
+        rows = np.array([arrays.rows.get(g.get("id"), -1) for g in all_gestures], dtype=np.intp)
+        selected = np.arange(len(all_gestures))  # positions in all_gestures
 
         # Step 1: Clustering-based candidate selection
         if self.enable_clustering and self.clusterer and self.clusterer.is_fitted:
             # Find closest clusters
             closest_clusters = self.clusterer.predict_clusters(input_sig, top_k=3)
 
-            # Filter gestures to only those in closest clusters
-            candidates = [
-                g for g in candidates
-                if g.get("id") in self.signature_cache
-                and self.signature_cache[g["id"]].cluster_id in closest_clusters
-            ]
+            # Filter gestures to only those in closest clusters (unindexed
+            # and unclustered gestures have cluster -1)
+            selected = np.flatnonzero(np.isin(arrays.cluster_ids[rows], closest_clusters))
 
-            stats['candidates_after_clustering'] = len(candidates)
-            logger.debug(f"Clustering: {len(all_gestures)} → {len(candidates)} gestures "
+            stats['candidates_after_clustering'] = len(selected)
+            logger.debug(f"Clustering: {len(all_gestures)} → {len(selected)} gestures "
                         f"(clusters: {closest_clusters})")
         else:
-            stats['candidates_after_clustering'] = len(candidates)
+            stats['candidates_after_clustering'] = len(selected)
 
         # Step 2: Early rejection filtering with DYNAMIC THRESHOLDS
         if self.enable_early_rejection and self.filter:
-            filtered_candidates = []
-            rejection_reasons = {}
-
             # FIXED: Adjust filter strictness based on database size
             n_gestures = len(all_gestures)
 
@@ -598,65 +1018,49 @@ class GestureIndexer:
 
             stats['strictness_multiplier'] = strict_multiplier
 
-            # Temporarily adjust filter thresholds
-            original_frame_tol = self.filter.frame_count_tolerance
-            original_centroid_tol = self.filter.centroid_distance_threshold
-            original_traj_tol = self.filter.trajectory_tolerance
-            original_vel_tol = self.filter.velocity_tolerance
-
-            self.filter.frame_count_tolerance *= strict_multiplier
-            self.filter.centroid_distance_threshold *= strict_multiplier
-            self.filter.trajectory_tolerance *= strict_multiplier
-            self.filter.velocity_tolerance *= strict_multiplier
-
-            # Apply filtering
-            for gesture in candidates:
+            # Signatures of gestures added since the last build_index()
+            missing = selected[rows[selected] < 0]
+            for position in missing:
+                gesture = all_gestures[position]
                 gesture_id = gesture.get("id")
+                if gesture_id in self.signature_cache:
+                    continue
+                try:
+                    landmark_data = gesture.get("landmark_data", {})
+                    frames = landmark_data.get("frames", [])
+                    self.signature_cache[gesture_id] = self.extract_signature(gesture_id, frames)
+                except Exception as e:
+                    # Included anyway below (conservative approach)
+                    logger.warning(f"Failed to extract signature for {gesture_id}: {e}")
+            if len(missing) and len(arrays.rows) != len(self.signature_cache):
+                arrays = self._get_signature_arrays()
+                rows[missing] = [arrays.rows.get(all_gestures[p].get("id"), -1) for p in missing]
+
+            # All filters for all candidates in one vectorized pass; gestures
+            # without a signature are kept
+            candidate_rows = rows[selected]
+            indexed = candidate_rows >= 0
+            keep = np.ones(len(selected), dtype=bool)
+            thresholds = self.filter.effective_thresholds(self.strict_filtering, strict_multiplier)
+            keep[indexed], rejection_reasons = self.filter.reject_batch(
+                input_sig,
+                arrays,
+                thresholds,
+                rows=candidate_rows[indexed]
+            )
+            selected = selected[keep]
 
-                # Get cached signature
-                if gesture_id not in self.signature_cache:
-                    # Signature not cached, extract it
-                    try:
-                        landmark_data = gesture.get("landmark_data", {})
-                        frames = landmark_data.get("frames", [])
-                        stored_sig = self.extract_signature(gesture_id, frames)
-                        self.signature_cache[gesture_id] = stored_sig
-                    except Exception as e:
-                        logger.warning(f"Failed to extract signature for {gesture_id}: {e}")
-                        # Include gesture anyway (conservative approach)
-                        filtered_candidates.append(gesture)
-                        continue
-                else:
-                    stored_sig = self.signature_cache[gesture_id]
-
-                # Apply early rejection filter
-                should_reject, reason = self.filter.should_reject(
-                    input_sig,
-                    stored_sig,
-                    strict=self.strict_filtering
-                )
-
-                if should_reject:
-                    rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-                else:
-                    filtered_candidates.append(gesture)
-
-            # Restore original thresholds
-            self.filter.frame_count_tolerance = original_frame_tol
-            self.filter.centroid_distance_threshold = original_centroid_tol
-            self.filter.trajectory_tolerance = original_traj_tol
-            self.filter.velocity_tolerance = original_vel_tol
-
-            candidates = filtered_candidates
-            stats['candidates_after_filtering'] = len(candidates)
+            stats['candidates_after_filtering'] = len(selected)
             stats['rejected_by_filter'] = rejection_reasons
 
-            rejection_pct = 100 * (1 - len(candidates) / max(stats['candidates_after_clustering'], 1))
-            logger.debug(f"Early rejection: {stats['candidates_after_clustering']} → {len(candidates)} gestures ({rejection_pct:.0f}% rejected)")
+            rejection_pct = 100 * (1 - len(selected) / max(stats['candidates_after_clustering'], 1))
+            logger.debug(f"Early rejection: {stats['candidates_after_clustering']} → {len(selected)} gestures ({rejection_pct:.0f}% rejected)")
             if rejection_reasons:
                 logger.debug(f"Rejection reasons: {rejection_reasons}")
         else:
-            stats['candidates_after_filtering'] = len(candidates)
+            stats['candidates_after_filtering'] = len(selected)
+
+        candidates = [all_gestures[position] for position in selected]
 
         # Step 3: Limit to max candidates (safety)
         if len(candidates) > self.max_candidates:
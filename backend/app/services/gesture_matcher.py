@@ -23,16 +23,18 @@ Version: v2_direction_aware
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional, Union
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
 # Import Phase 1 enhancements
 from app.services.gesture_preprocessing import get_gesture_preprocessor
+from app.services.gesture_tensor import GestureTensor
 
 # Import Phase 2 enhancements
 from app.services.enhanced_dtw import get_dtw_ensemble, get_enhanced_dtw
+from app.services.dtw_kernel import as_dtw_array, pairwise_cost, dtw_fill
 
 # Import Phase 3 enhancements
 from app.services.gesture_indexing import get_gesture_indexer
@@ -104,6 +106,10 @@ class GestureMatcher:
             self.enhanced_dtw = get_enhanced_dtw()
             logger.info(f"Phase 2 enhanced DTW enabled: method={dtw_method}")
 
+        # Ensemble templates prepared from precomputed features, per gesture ID:
+        # {gesture_id: (precomputed_list, prepared_template)}
+        self._prepared_templates: Dict[Any, Tuple[list, Dict]] = {}
+
         # Get Phase 3 instances
         if self.enable_indexing:
             self.indexer = get_gesture_indexer(
@@ -172,7 +178,11 @@ class GestureMatcher:
 
         return max_dist
 
-    def extract_features(self, frames: List[Dict], for_matching: bool = True) -> np.ndarray:
+    def extract_features(
+        self,
+        frames: Union[List[Dict], GestureTensor],
+        for_matching: bool = True
+    ) -> np.ndarray:
         """
         Extract feature vectors from gesture frames with Phase 1 & 2 preprocessing.
 
@@ -185,7 +195,7 @@ class GestureMatcher:
         4. Flatten to feature vectors (21 × 3 = 63 features)
 
         Args:
-            frames: List of frame dictionaries with landmarks
+            frames: List of frame dictionaries with landmarks, or a GestureTensor
             for_matching: If True, use stateful preprocessing (matching mode)
                          If False, use stateless preprocessing (recording mode)
 
@@ -221,6 +231,8 @@ class GestureMatcher:
         except Exception as e:
             logger.error(f"❌ New preprocessing failed: {e}, falling back to basic extraction")
             # Fallback to old method
+            if isinstance(frames, GestureTensor):
+                frames = frames.to_frames()
             return self._extract_features_basic_with_resampling(frames)
 
     def _extract_features_basic(self, frames: List[Dict]) -> np.ndarray:
@@ -300,15 +312,24 @@ class GestureMatcher:
         """
         return np.sqrt(np.sum((point1 - point2) ** 2))
 
-    def dtw_distance(self, seq1: np.ndarray, seq2: np.ndarray) -> Tuple[float, bool]:
+    def dtw_distance(
+        self,
+        seq1: np.ndarray,
+        seq2: np.ndarray,
+        reject_below: Optional[float] = None
+    ) -> Tuple[float, bool]:
         """
         Calculate DTW distance or similarity between two sequences.
 
         CRITICAL FIX: Ensemble returns SIMILARITY directly, don't convert!
 
         Args:
-            seq1: First sequence (n_frames, n_features)
-            seq2: Second sequence (m_frames, n_features)
+            seq1: First sequence (n_frames, n_features); for the ensemble
+                  method also a DTWEnsemble.prepare_template() result
+            seq2: Second sequence (m_frames, n_features), same as seq1
+            reject_below: Ensemble only - if the similarity cannot exceed this
+                          (LB_Keogh bound), return the bound without running
+                          the full DTW passes
 
         Returns:
             Tuple of (value, is_similarity_flag)
@@ -317,8 +338,8 @@ class GestureMatcher:
         """
         # ✅ CRITICAL FIX #4: Add debugging logs
         logger.debug(f"DTW Calculation:")
-        logger.debug(f"  Input shape: {seq1.shape}")
-        logger.debug(f"  Stored shape: {seq2.shape}")
+        logger.debug(f"  Input shape: {np.shape(seq1['position'] if isinstance(seq1, dict) else seq1)}")
+        logger.debug(f"  Stored shape: {np.shape(seq2['position'] if isinstance(seq2, dict) else seq2)}")
         logger.debug(f"  Method: {self.dtw_method}")
 
         # Use Phase 2 enhanced DTW if enabled
@@ -326,7 +347,7 @@ class GestureMatcher:
             if self.dtw_method == 'ensemble':
                 # FIXED: Ensemble returns SIMILARITY directly (0-1)
                 # DO NOT convert to distance!
-                similarity = self.dtw_ensemble.match(seq1, seq2)
+                similarity = self.dtw_ensemble.match(seq1, seq2, reject_below=reject_below)
 
                 # ✅ CRITICAL FIX #4: Log max_distance being used
                 max_dist = self.dtw_ensemble.dtw.max_distance
@@ -369,25 +390,9 @@ class GestureMatcher:
         Returns:
             DTW distance
         """
-        n, m = len(seq1), len(seq2)
-
-        # Initialize DTW matrix with infinity
-        dtw_matrix = np.full((n + 1, m + 1), np.inf)
-        dtw_matrix[0, 0] = 0
-
-        # Fill the DTW matrix
-        for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                cost = self.euclidean_distance(seq1[i - 1], seq2[j - 1])
-
-                # Take minimum of three possible paths
-                dtw_matrix[i, j] = cost + min(
-                    dtw_matrix[i - 1, j],      # Insertion
-                    dtw_matrix[i, j - 1],      # Deletion
-                    dtw_matrix[i - 1, j - 1]   # Match
-                )
-
-        return dtw_matrix[n, m]
+        # Unconstrained DTW (radius covers every column), compiled kernel
+        cost = pairwise_cost(as_dtw_array(seq1), as_dtw_array(seq2))
+        return float(dtw_fill(cost, max(len(seq1), len(seq2))))
 
     def calculate_similarity(self, distance: float) -> float:
         """
@@ -473,7 +478,9 @@ class GestureMatcher:
             logger.warning("Input gesture too short (minimum 5 frames required)")
             return None
 
-        # Phase 3: Check cache first
+        # Phase 3: Check cache first (frames are hashed once per request)
+        if self.enable_caching:
+            self.cache.reset_frame_hashes()
         if self.enable_caching and user_id is not None:
             cached_result = self.cache.get_match_result(input_frames, user_id, app_context)
             if cached_result is not None:
@@ -1010,6 +1017,31 @@ class GestureMatcher:
             logger.warning(traceback.format_exc())
             return 0.0
 
+    def _get_prepared_template(self, gesture: Dict, precomputed: list) -> Dict:
+        """
+        Ensemble-ready template for a gesture, cached by gesture ID.
+
+        The cached entry is reused only while the gesture still carries the
+        same precomputed_features list, so reloaded or edited gestures are
+        prepared again.
+
+        Args:
+            gesture: Gesture dictionary
+            precomputed: Its precomputed_features list
+
+        Returns:
+            DTWEnsemble.prepare_template() result
+        """
+        gesture_id = gesture.get('id')
+        cached = self._prepared_templates.get(gesture_id)
+        if cached is not None and cached[0] is precomputed:
+            return cached[1]
+
+        prepared = self.dtw_ensemble.prepare_template(np.array(precomputed), with_envelopes=True)
+        if gesture_id is not None:
+            self._prepared_templates[gesture_id] = (precomputed, prepared)
+        return prepared
+
     def _match_sequential(
         self,
         input_normalized: np.ndarray,
@@ -1039,6 +1071,13 @@ class GestureMatcher:
         best_match = None
         best_similarity = 0.0
 
+        # Ensemble: extract the input's velocity/acceleration once for all candidates
+        use_prepared = self.enable_enhanced_dtw and self.dtw_method == 'ensemble'
+        input_seq = (
+            self.dtw_ensemble.prepare_template(input_normalized)
+            if use_prepared else input_normalized
+        )
+
         for idx, gesture in enumerate(candidates, 1):
             try:
                 # Extract stored gesture frames
@@ -1066,7 +1105,10 @@ class GestureMatcher:
                     precomputed = gesture.get('precomputed_features')
                     if precomputed and isinstance(precomputed, list):
                         try:
-                            stored_normalized = np.array(precomputed)
+                            if use_prepared:
+                                stored_normalized = self._get_prepared_template(gesture, precomputed)
+                            else:
+                                stored_normalized = np.array(precomputed)
                             logger.debug(f"✅ Using precomputed features for '{gesture.get('name')}' (instant)")
                         except Exception as e:
                             logger.debug(f"⚠️ Failed to load precomputed features: {e}, falling back")
@@ -1081,7 +1123,12 @@ class GestureMatcher:
 
                     # Calculate DTW distance or similarity
                     # FIXED: dtw_distance now returns (value, is_similarity_flag)
-                    value, is_similarity = self.dtw_distance(input_normalized, stored_normalized)
+                    # Penalties below only lower the score, so a candidate whose
+                    # similarity bound can't beat the current best is cut short
+                    value, is_similarity = self.dtw_distance(
+                        input_seq, stored_normalized,
+                        reject_below=best_similarity if best_match is not None else None
+                    )
 
                     # Cache the raw distance value (not similarity)
                     if self.enable_caching and not is_similarity:
@@ -1137,6 +1184,58 @@ class GestureMatcher:
 
         return best_match, best_similarity
 
+    def _batch_ensemble_similarities(
+        self,
+        input_normalized: np.ndarray,
+        candidates: List[Dict],
+        input_frames: List[Dict]
+    ) -> Dict[int, float]:
+        """
+        Ensemble similarity for every candidate without a cached DTW value,
+        computed with one DTWEnsemble.batch_match() call.
+
+        Args:
+            input_normalized: Normalized input features
+            candidates: Candidate gestures
+            input_frames: Original input frames (for the cache lookup)
+
+        Returns:
+            Dict mapping id(gesture) -> ensemble similarity (0-1); candidates
+            left out are handled one by one by the caller
+        """
+        gestures = []
+        templates = []
+
+        for gesture in candidates:
+            try:
+                stored_frames = gesture.get("landmark_data", {}).get("frames", [])
+                if not stored_frames:
+                    continue
+                if self.enable_caching and self.cache.get_dtw_distance(input_frames, stored_frames) is not None:
+                    continue
+
+                precomputed = gesture.get('precomputed_features')
+                if precomputed and isinstance(precomputed, list):
+                    template = self._get_prepared_template(gesture, precomputed)
+                else:
+                    template = self.extract_features(stored_frames)
+
+                gestures.append(gesture)
+                templates.append(template)
+            except Exception as e:
+                logger.error(f"Error preparing gesture {gesture.get('name')} for batch DTW: {e}")
+
+        if not templates:
+            return {}
+
+        try:
+            similarities = self.dtw_ensemble.batch_match(input_normalized, templates)
+        except Exception as e:
+            logger.error(f"Batch DTW failed, falling back to per-gesture DTW: {e}")
+            return {}
+
+        return {id(g): float(sim) for g, sim in zip(gestures, similarities)}
+
     def _match_parallel(
         self,
         input_normalized: np.ndarray,
@@ -1167,6 +1266,12 @@ class GestureMatcher:
         best_match = None
         best_similarity = 0.0
 
+        # Ensemble: score the whole gallery in one batch (DP fills run on all
+        # cores); the thread pool below then only applies the penalties
+        batched = {}
+        if self.enable_enhanced_dtw and self.dtw_method == 'ensemble':
+            batched = self._batch_ensemble_similarities(input_normalized, candidates, input_frames)
+
         def process_gesture(gesture: Dict) -> Tuple[Dict, float]:
             """Process single gesture (for parallel execution)."""
             try:
@@ -1184,6 +1289,9 @@ class GestureMatcher:
                 if cached_value is not None:
                     value = cached_value
                     is_similarity = False
+                elif id(gesture) in batched:
+                    value = batched[id(gesture)]
+                    is_similarity = True
                 else:
                     # Extract stored features (already normalized by Procrustes + bone-length)
                     stored_features = self.extract_features(stored_frames)
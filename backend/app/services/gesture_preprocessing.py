@@ -41,9 +41,11 @@ Version: v4_direction_aware
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 import logging
 
+from app.services.gesture_tensor import GestureTensor
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,8 +101,43 @@ class GesturePreprocessor:
         # Step 1: Convert to numpy arrays
         landmarks_array, confidences = self._frames_to_numpy(frames)
 
+        return self.preprocess_landmarks(
+            landmarks_array,
+            confidences,
+            apply_procrustes=apply_procrustes,
+            apply_bone_normalization=apply_bone_normalization,
+            remove_outliers=remove_outliers,
+            original_frames=len(frames)
+        )
+
+    def preprocess_landmarks(
+        self,
+        landmarks_array: np.ndarray,
+        confidences: np.ndarray,
+        apply_procrustes: bool = True,
+        apply_bone_normalization: bool = True,
+        remove_outliers: bool = True,
+        original_frames: Optional[int] = None
+    ) -> Tuple[np.ndarray, Dict]:
+        """
+        Preprocessing pipeline (steps 2-4 of preprocess_frames) on arrays.
+
+        The minimum frame count is checked by the callers.
+
+        Args:
+            landmarks_array: (num_frames, 21, 3) array
+            confidences: (num_frames,) detection confidences
+            apply_procrustes: Enable Procrustes normalization
+            apply_bone_normalization: Enable bone-length normalization
+            remove_outliers: Enable outlier detection/removal
+            original_frames: Frame count before invalid frames were dropped
+                             (for metadata; defaults to len(landmarks_array))
+
+        Returns:
+            Tuple of (normalized_landmarks, metadata) as preprocess_frames
+        """
         metadata = {
-            'original_frames': len(frames),
+            'original_frames': len(landmarks_array) if original_frames is None else original_frames,
             'valid_frames': len(landmarks_array),
             'outliers_removed': 0,
             'avg_confidence': float(np.mean(confidences)),
@@ -161,8 +198,12 @@ class GesturePreprocessor:
             # Extract x, y, z coordinates
             # Convert to float to avoid numpy string type issues
             try:
-                # Handle both dict format {'x': ..., 'y': ..., 'z': ...} and list/tuple format [x, y, z]
-                if landmarks and isinstance(landmarks[0], dict):
+                # Handle packed (21, 3) arrays, dict format {'x': ..., 'y': ..., 'z': ...}
+                # and list/tuple format [x, y, z]
+                if isinstance(landmarks, np.ndarray):
+                    # Already packed - no per-landmark Python iteration
+                    frame_landmarks = landmarks.astype(np.float64, copy=False).reshape(21, 3)
+                elif landmarks and isinstance(landmarks[0], dict):
                     # Dictionary format from MediaPipe
                     frame_landmarks = np.array([
                         [float(lm['x']), float(lm['y']), float(lm['z'])] for lm in landmarks
@@ -593,7 +634,7 @@ def get_gesture_preprocessor() -> GesturePreprocessor:
 
 
 def preprocess_for_recording(
-    frames: List[Dict],
+    frames: Union[List[Dict], GestureTensor],
     target_frames: int = 60,
     apply_smoothing: bool = True,
     apply_procrustes: bool = True,
@@ -613,7 +654,8 @@ def preprocess_for_recording(
     - Any operation that will SAVE gesture to database
 
     Args:
-        frames: List of frame dictionaries from MediaPipe
+        frames: List of frame dictionaries from MediaPipe, or a GestureTensor
+                (converted once here otherwise; all steps run on its arrays)
         target_frames: Target frame count (default: 60)
         apply_smoothing: Enable temporal smoothing with reset filters
         apply_procrustes: Enable Procrustes normalization
@@ -622,21 +664,26 @@ def preprocess_for_recording(
     Returns:
         Feature array (target_frames, 63) ready for storage
     """
-    from app.services.frame_resampler import resample_frames_linear
-    from app.services.temporal_smoothing import reset_temporal_filters, smooth_gesture_frames
+    from app.services.temporal_smoothing import reset_temporal_filters, smooth_landmark_sequence
 
     logger.info(f"🔧 Preprocessing for RECORDING (stateless): {len(frames)} frames → {target_frames}")
 
+    tensor = frames if isinstance(frames, GestureTensor) else GestureTensor.from_frames(frames)
+
     # Step 1: Resample to fixed frame count
-    if len(frames) != target_frames:
-        frames = resample_frames_linear(frames, target_frames=target_frames)
+    if len(tensor) != target_frames:
+        tensor = tensor.resample(target_frames)
         logger.info(f"  ✓ Resampled to {target_frames} frames")
 
+    # float32 storage, float64 math from here on
+    landmarks = tensor.landmarks_3d.astype(np.float64)
+
     # Step 2: Reset temporal filters for clean state
     if apply_smoothing:
         reset_temporal_filters()
-        frames = smooth_gesture_frames(
-            frames,
+        landmarks = smooth_landmark_sequence(
+            landmarks,
+            tensor.timestamps,
             method='one_euro',
             min_cutoff=1.0,
             beta=0.007
@@ -644,9 +691,13 @@ def preprocess_for_recording(
         logger.info(f"  ✓ Temporal smoothing applied (filters reset)")
 
     # Step 3: Apply preprocessing
+    if len(landmarks) < 5:
+        raise ValueError(f"Insufficient frames: {len(landmarks)} (minimum 5 required)")
+
     preprocessor = get_gesture_preprocessor()
-    normalized_landmarks, metadata = preprocessor.preprocess_frames(
-        frames,
+    normalized_landmarks, metadata = preprocessor.preprocess_landmarks(
+        landmarks,
+        tensor.confidence,
         apply_procrustes=apply_procrustes,
         apply_bone_normalization=apply_bone_normalization,
         remove_outliers=True
@@ -661,7 +712,7 @@ def preprocess_for_recording(
 
 
 def preprocess_for_matching(
-    frames: List[Dict],
+    frames: Union[List[Dict], GestureTensor],
     target_frames: int = 60,
     apply_smoothing: bool = True,
     apply_procrustes: bool = True,
@@ -681,7 +732,8 @@ def preprocess_for_matching(
     - Any operation that COMPARES against stored gestures
 
     Args:
-        frames: List of frame dictionaries from MediaPipe
+        frames: List of frame dictionaries from MediaPipe, or a GestureTensor
+                (converted once here otherwise; all steps run on its arrays)
         target_frames: Target frame count (default: 60)
         apply_smoothing: Enable temporal smoothing (preserves filter state)
         apply_procrustes: Enable Procrustes normalization
@@ -690,29 +742,38 @@ def preprocess_for_matching(
     Returns:
         Feature array (target_frames, 63) ready for DTW matching
     """
-    from app.services.frame_resampler import resample_frames_linear
-    from app.services.temporal_smoothing import ensure_smoother_initialized, smooth_gesture_frames
+    from app.services.temporal_smoothing import ensure_smoother_initialized, smooth_landmark_sequence
 
     logger.debug(f"🎯 Preprocessing for MATCHING (stateful): {len(frames)} frames → {target_frames}")
 
+    tensor = frames if isinstance(frames, GestureTensor) else GestureTensor.from_frames(frames)
+
     # Step 1: Resample to fixed frame count
-    if len(frames) != target_frames:
-        frames = resample_frames_linear(frames, target_frames=target_frames)
+    if len(tensor) != target_frames:
+        tensor = tensor.resample(target_frames)
+
+    # float32 storage, float64 math from here on
+    landmarks = tensor.landmarks_3d.astype(np.float64)
 
     # Step 2: Apply temporal smoothing (preserves filter state)
     if apply_smoothing:
         ensure_smoother_initialized()  # Don't reset filters!
-        frames = smooth_gesture_frames(
-            frames,
+        landmarks = smooth_landmark_sequence(
+            landmarks,
+            tensor.timestamps,
             method='one_euro',
             min_cutoff=1.0,
             beta=0.007
         )
 
     # Step 3: Apply preprocessing
+    if len(landmarks) < 5:
+        raise ValueError(f"Insufficient frames: {len(landmarks)} (minimum 5 required)")
+
     preprocessor = get_gesture_preprocessor()
-    normalized_landmarks, metadata = preprocessor.preprocess_frames(
-        frames,
+    normalized_landmarks, metadata = preprocessor.preprocess_landmarks(
+        landmarks,
+        tensor.confidence,
         apply_procrustes=apply_procrustes,
         apply_bone_normalization=apply_bone_normalization,
         remove_outliers=True
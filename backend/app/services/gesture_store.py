@@ -22,6 +22,19 @@ _store: Dict[int, List[dict]] = {}
 _lock = RLock()
 
 
+def _with_frame_buffer(landmark_data):
+    """
+    Shallow copy of landmark_data with its frames in a FrameBuffer, so the
+    cache hashes each stored template once per session instead of once per
+    match. The ORM object's own JSON is left untouched.
+    """
+    from app.services.gesture_cache import FrameBuffer
+
+    if not landmark_data or "frames" not in landmark_data:
+        return landmark_data
+    return {**landmark_data, "frames": FrameBuffer(landmark_data["frames"])}
+
+
 def load_user_gestures(user_id: int, db) -> None:
     """
     Load all gestures for user_id into memory from the DB.
@@ -37,7 +50,7 @@ def load_user_gestures(user_id: int, db) -> None:
             "name": g.name,
             "action": g.action,
             "app_context": g.app_context,
-            "landmark_data": g.landmark_data,
+            "landmark_data": _with_frame_buffer(g.landmark_data),
             "adaptive_threshold": g.adaptive_threshold,
             "template_index": g.template_index,
         }
@@ -0,0 +1,152 @@
+"""
+AirClick - Gesture Tensor
+=========================
+
+Structure-of-arrays form of a recorded or live gesture.
+
+Frames arrive as a list of dicts, each holding a list of 21 {x, y, z} dicts
+(or an already packed (21, 3) array). Walking that structure on every
+resample, smoothing and normalization pass is pure pointer chasing, so a
+gesture is converted once into a GestureTensor: one contiguous float32
+(n_frames, 63) landmark block plus per-frame timestamp/confidence side
+arrays. Everything downstream works on those arrays; frame dicts are only
+rebuilt (to_frames) when a caller needs the stored JSON format.
+
+Author: Muhammad Shawaiz
+Project: AirClick FYP
+"""
+
+import logging
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.frame_resampler import _interpolation_weights
+
+logger = logging.getLogger(__name__)
+
+_landmark_xyz = itemgetter('x', 'y', 'z')
+
+
+@dataclass
+class GestureTensor:
+    """
+    A gesture as flat arrays.
+
+    Timestamps are epoch milliseconds, which do not fit in int32, so they
+    are kept as int64.
+    """
+    landmarks: np.ndarray  # (n_frames, 63) float32: x0, y0, z0, x1, ...
+    timestamps: np.ndarray  # (n_frames,) int64 milliseconds
+    confidence: np.ndarray  # (n_frames,) float32
+    handedness: str = 'Right'
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+    @property
+    def landmarks_3d(self) -> np.ndarray:
+        """(n_frames, 21, 3) view of the landmark block."""
+        return self.landmarks.reshape(-1, 21, 3)
+
+    @classmethod
+    def from_frames(cls, frames: List[Dict]) -> "GestureTensor":
+        """
+        Convert frame dicts to a tensor in one pass.
+
+        Frames without exactly 21 landmarks are dropped. Landmarks may be
+        {x, y, z} dicts, [x, y, z] lists or a packed (21, 3) array.
+
+        Args:
+            frames: List of frame dictionaries from MediaPipe or the database
+
+        Returns:
+            GestureTensor with one row per valid frame
+        """
+        coords = []
+        timestamps = []
+        confidences = []
+
+        for frame in frames:
+            landmarks = frame.get('landmarks', [])
+            if len(landmarks) != 21:
+                logger.warning(f"Frame has {len(landmarks)} landmarks (expected 21), skipping")
+                continue
+
+            if isinstance(landmarks, np.ndarray):
+                coords.extend(landmarks.reshape(-1).tolist())
+            else:
+                for lm in landmarks:
+                    coords.extend(_landmark_xyz(lm) if isinstance(lm, dict) else lm[:3])
+
+            # Database rows may hold strings or nulls; an unreadable
+            # timestamp repeats the previous one
+            try:
+                timestamps.append(int(frame.get('timestamp') or 0))
+            except (TypeError, ValueError):
+                timestamps.append(timestamps[-1] if timestamps else 0)
+            try:
+                confidences.append(float(frame.get('confidence', 1.0)))
+            except (TypeError, ValueError):
+                confidences.append(1.0)
+
+        handedness = frames[0].get('handedness', 'Right') if frames else 'Right'
+
+        return cls(
+            landmarks=np.array(coords, dtype=np.float32).reshape(-1, 63),
+            timestamps=np.array(timestamps, dtype=np.int64),
+            confidence=np.array(confidences, dtype=np.float32),
+            handedness=handedness or 'Right'
+        )
+
+    def resample(self, target_frames: int = 60) -> "GestureTensor":
+        """
+        Linearly resample to a fixed frame count (see frame_resampler).
+
+        Args:
+            target_frames: Target number of frames
+
+        Returns:
+            New GestureTensor with target_frames rows (self if already there)
+        """
+        original_count = len(self)
+        if original_count == target_frames or original_count == 0:
+            return self
+
+        i_idx, j_idx, weights = _interpolation_weights(original_count, target_frames)
+        w = weights[:, None]
+
+        landmarks = (1 - w) * self.landmarks[i_idx] + w * self.landmarks[j_idx]
+        timestamps = (1 - weights) * self.timestamps[i_idx] + weights * self.timestamps[j_idx]
+        confidence = (1 - weights) * self.confidence[i_idx] + weights * self.confidence[j_idx]
+
+        return GestureTensor(
+            landmarks=landmarks.astype(np.float32),
+            timestamps=timestamps.astype(np.int64),
+            confidence=confidence.astype(np.float32),
+            handedness=self.handedness
+        )
+
+    def to_frames(self) -> List[Dict]:
+        """
+        Rebuild frame dicts (storage/JSON format).
+
+        Returns:
+            List of frame dicts with {x, y, z} landmark dicts
+        """
+        landmarks = self.landmarks_3d.tolist()
+        timestamps = self.timestamps.tolist()
+        confidences = self.confidence.tolist()
+
+        return [
+            {
+                'timestamp': timestamps[i],
+                'landmarks': [{'x': x, 'y': y, 'z': z} for x, y, z in landmarks[i]],
+                'handedness': self.handedness,
+                'confidence': confidences[i]
+            }
+            for i in range(len(landmarks))
+        ]
+
@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.models.gesture import Gesture
+from app.schemas.gesture import Frame, dump_frames
 from app.services.hand_pose_fingerprint import (
     calculate_pose_signature,
     compute_representative_pose,
@@ -60,15 +61,11 @@ def process_and_validate_gesture(
 
     # 1. Convert to dict format for internal processing
     # frames_input can be list of Pydantic models (from API) or dicts (if called internally)
-    frames_dict = []
-    for frame in frames_input:
-        if hasattr(frame, 'dict'):
-            f_dict = frame.dict()
-            # Pydantic dict might have landmarks as list of models, convert to dicts
-            f_dict['landmarks'] = [{"x": lm['x'], "y": lm['y'], "z": lm['z']} if isinstance(lm, dict) else {"x": lm.x, "y": lm.y, "z": lm.z} for lm in f_dict['landmarks']]
-            frames_dict.append(f_dict)
-        else:
-            frames_dict.append(frame)
+    if frames_input and isinstance(frames_input[0], Frame):
+        # Single pass through the cached List[Frame] adapter
+        frames_dict = dump_frames(frames_input)
+    else:
+        frames_dict = list(frames_input)
 
     # 2. Apply FULL preprocessing
     logger.info(f"📐 Applying FULL preprocessing (v6 standard):")
@@ -813,6 +813,11 @@ class HandPoseDetector:
         """
         try:
             import pyautogui
+            from app.services.cursor_controller import get_cursor_controller
+
+            # Cursor moves are coalesced on a background thread; make sure the
+            # latest position is applied before clicking at it
+            get_cursor_controller().flush()
 
             if click_type == ClickType.LEFT_CLICK.value:
                 pyautogui.click()
@@ -143,7 +143,7 @@ class HybridModeController:
                         with open(recording_state_path, 'r') as f:
                             is_recording = f.read().strip() == "true"
                 except Exception as e:
-                    logger.error(f"Failed to check recording state in cursor control: {e}")
+                    logger.error("Failed to check recording state in cursor control: %s", e)
 
                 # CRITICAL: Only block cursor if recording, NOT if unauthenticated
                 # Cursor control should work even without login
@@ -167,7 +167,7 @@ class HybridModeController:
                     if click_result['click_type'] != 'none':
                         self.hand_pose_detector.execute_click(click_result['click_type'])
                         self.stats['clicks_detected'] += 1
-                        logger.debug(f"Click executed: {click_result['click_type']}")
+                        logger.debug("Click executed: %s", click_result['click_type'])
 
                         # PHASE 4.1 FIX: Update state machine click activity
                         # This prevents gesture collection during multi-click workflows
@@ -183,7 +183,7 @@ class HybridModeController:
                             scroll_result['scroll_type'],
                             scroll_result['scroll_amount']
                         )
-                        logger.debug(f"Scroll executed: {scroll_result['scroll_type']} x{scroll_result['scroll_amount']}")
+                        logger.debug("Scroll executed: %s x%s", scroll_result['scroll_type'], scroll_result['scroll_amount'])
                 else:
                     # Cursor disabled - user is recording a gesture
                     result['cursor_enabled'] = False
@@ -0,0 +1,167 @@
+"""
+AirClick - Native Keyboard Input
+================================
+
+Sends keyboard shortcuts with a single Win32 SendInput call.
+
+pyautogui presses keys one event at a time (and sleeps PAUSE seconds after
+each call), so a three-key hotkey costs several calls into the OS. Here a
+shortcut is resolved once into a ready-made array of INPUT structs - key down
+for each key in order, then key up in reverse - which is submitted to the OS
+in one call.
+
+Only available on Windows; callers fall back to pyautogui elsewhere or for
+keys missing from VK_CODES.
+
+Author: Muhammad Shawaiz
+Project: AirClick FYP
+"""
+
+import logging
+import sys
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Check if Win32 SendInput is available
+SENDINPUT_AVAILABLE = False
+if sys.platform == "win32":
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        _user32 = ctypes.WinDLL("user32", use_last_error=True)
+        SENDINPUT_AVAILABLE = True
+        logger.info("✓ SendInput is available for keyboard shortcuts")
+    except (ImportError, OSError, AttributeError) as e:
+        logger.warning(f"⚠ SendInput unavailable, keyboard shortcuts will use pyautogui: {e}")
+
+
+# Virtual-key codes for pyautogui-style key names, built once at import
+VK_CODES: Dict[str, int] = {
+    # Modifiers
+    "ctrl": 0x11, "ctrlleft": 0xA2, "ctrlright": 0xA3,
+    "shift": 0x10, "shiftleft": 0xA0, "shiftright": 0xA1,
+    "alt": 0x12, "altleft": 0xA4, "altright": 0xA5,
+    "win": 0x5B, "winleft": 0x5B, "winright": 0x5C,
+    # Editing / whitespace
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "return": 0x0D,
+    "esc": 0x1B, "escape": 0x1B, "space": 0x20, "delete": 0x2E, "del": 0x2E,
+    "insert": 0x2D,
+    # Navigation
+    "pageup": 0x21, "pgup": 0x21, "pagedown": 0x22, "pgdn": 0x22,
+    "end": 0x23, "home": 0x24,
+    "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    # Locks / misc
+    "capslock": 0x14, "numlock": 0x90, "scrolllock": 0x91,
+    "printscreen": 0x2C, "prtsc": 0x2C, "pause": 0x13, "apps": 0x5D,
+    # Media
+    "volumemute": 0xAD, "volumedown": 0xAE, "volumeup": 0xAF,
+    "nexttrack": 0xB0, "prevtrack": 0xB1, "stop": 0xB2, "playpause": 0xB3,
+    # Punctuation (US layout)
+    ";": 0xBA, "=": 0xBB, ",": 0xBC, "-": 0xBD, ".": 0xBE, "/": 0xBF,
+    "`": 0xC0, "[": 0xDB, "\\": 0xDC, "]": 0xDD, "'": 0xDE,
+}
+VK_CODES.update({chr(c): c for c in range(ord("0"), ord("9") + 1)})
+VK_CODES.update({chr(c).lower(): c for c in range(ord("A"), ord("Z") + 1)})
+VK_CODES.update({f"f{n}": 0x6F + n for n in range(1, 25)})
+
+# Keys that need KEYEVENTF_EXTENDEDKEY, otherwise Windows treats them as numpad keys
+_EXTENDED_VK = frozenset({
+    0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28,  # page up/down, end, home, arrows
+    0x2D, 0x2E,  # insert, delete
+    0x5B, 0x5C, 0x5D,  # windows keys, apps
+    0xA3, 0xA5,  # right ctrl, right alt
+})
+
+
+if SENDINPUT_AVAILABLE:
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_EXTENDEDKEY = 0x0001
+    KEYEVENTF_KEYUP = 0x0002
+    ULONG_PTR = ctypes.c_size_t
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = (("dx", wintypes.LONG),
+                    ("dy", wintypes.LONG),
+                    ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ULONG_PTR))
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = (("wVk", wintypes.WORD),
+                    ("wScan", wintypes.WORD),
+                    ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ULONG_PTR))
+
+    class HARDWAREINPUT(ctypes.Structure):
+        _fields_ = (("uMsg", wintypes.DWORD),
+                    ("wParamL", wintypes.WORD),
+                    ("wParamH", wintypes.WORD))
+
+    class _INPUTUNION(ctypes.Union):
+        # All members declared so sizeof(INPUT) matches the Win32 definition
+        _fields_ = (("ki", KEYBDINPUT),
+                    ("mi", MOUSEINPUT),
+                    ("hi", HARDWAREINPUT))
+
+    class INPUT(ctypes.Structure):
+        _anonymous_ = ("_input",)
+        _fields_ = (("type", wintypes.DWORD),
+                    ("_input", _INPUTUNION))
+
+    _INPUT_SIZE = ctypes.sizeof(INPUT)
+
+    _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _user32.SendInput.restype = wintypes.UINT
+
+
+def build_key_inputs(keys: List[str]):
+    """
+    Resolve a shortcut into a ready-to-send INPUT array.
+
+    Args:
+        keys: List of keys to press (e.g., ['ctrl', 'shift', 'p'])
+
+    Returns:
+        ctypes INPUT array (downs in order, ups in reverse), or None if
+        SendInput is unavailable or any key has no known VK code
+    """
+    if not SENDINPUT_AVAILABLE or not keys:
+        return None
+
+    vk_codes = []
+    for key in keys:
+        vk = VK_CODES.get(key.lower())
+        if vk is None:
+            return None
+        vk_codes.append(vk)
+
+    events = []
+    for vk in vk_codes:
+        events.append((vk, 0))
+    for vk in reversed(vk_codes):
+        events.append((vk, KEYEVENTF_KEYUP))
+
+    inputs = (INPUT * len(events))()
+    for i, (vk, flags) in enumerate(events):
+        if vk in _EXTENDED_VK:
+            flags |= KEYEVENTF_EXTENDEDKEY
+        inputs[i].type = INPUT_KEYBOARD
+        inputs[i].ki = KEYBDINPUT(wVk=vk, wScan=0, dwFlags=flags, time=0, dwExtraInfo=0)
+    return inputs
+
+
+def send_inputs(inputs) -> None:
+    """
+    Submit a prebuilt INPUT array with one SendInput call.
+
+    Raises:
+        OSError: If the OS accepted fewer events than were sent
+            (e.g. input blocked by a higher-integrity window)
+    """
+    sent = _user32.SendInput(len(inputs), inputs, _INPUT_SIZE)
+    if sent != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
@@ -23,9 +23,45 @@ import numpy as np
 from typing import List, Dict, Optional
 import logging
 
+from app.core.jit import njit
+
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def one_euro_step(x, x_prev, dx_prev, dt, min_cutoff, beta, d_cutoff):
+    """
+    One One Euro Filter update on plain scalars (same math as OneEuroFilter).
+
+    Compiled with Numba when available, so a caller keeping its own
+    (x_prev, dx_prev) state avoids a Python filter object per sample.
+
+    Args:
+        x: Current value
+        x_prev: Previous filtered value
+        dx_prev: Previous smoothed derivative
+        dt: Seconds since the previous sample (must be > 0)
+        min_cutoff: Minimum cutoff frequency (Hz)
+        beta: Speed coefficient
+        d_cutoff: Cutoff frequency for derivative (Hz)
+
+    Returns:
+        (x_filtered, dx_smooth) - the new filter state
+    """
+    # Smooth the derivative
+    dx = (x - x_prev) / dt
+    tau_d = 1.0 / (2.0 * np.pi * d_cutoff)
+    alpha_d = 1.0 / (1.0 + tau_d / dt)
+    dx_smooth = alpha_d * dx + (1.0 - alpha_d) * dx_prev
+
+    # Smooth the signal with a velocity-adaptive cutoff
+    cutoff = min_cutoff + beta * abs(dx_smooth)
+    tau = 1.0 / (2.0 * np.pi * cutoff)
+    alpha = 1.0 / (1.0 + tau / dt)
+    x_filtered = alpha * x + (1.0 - alpha) * x_prev
+    return x_filtered, dx_smooth
+
+
 class OneEuroFilter:
     """
     One Euro Filter for reducing jitter in noisy signals.
@@ -314,6 +350,47 @@ class GaussianTemporalSmoother:
         return smoothed
 
 
+def smooth_landmark_sequence(
+    landmarks_sequence: np.ndarray,
+    timestamps: np.ndarray,
+    method: str = 'one_euro',
+    **kwargs
+) -> Optional[np.ndarray]:
+    """
+    Smooth a (num_frames, 21, 3) landmark array.
+
+    Args:
+        landmarks_sequence: (num_frames, 21, 3) array
+        timestamps: (num_frames,) timestamps in milliseconds or seconds
+        method: Smoothing method ('one_euro' or 'gaussian')
+        **kwargs: Additional parameters for the smoother
+
+    Returns:
+        Smoothed sequence (num_frames, 21, 3), or None for an unknown method
+    """
+    if len(landmarks_sequence) < 2:
+        return landmarks_sequence
+
+    # Convert timestamps from milliseconds to seconds
+    if timestamps[0] > 100000:  # Likely milliseconds
+        timestamps = timestamps / 1000.0
+
+    # Normalize timestamps to start at 0
+    timestamps = timestamps - timestamps[0]
+
+    # Apply smoothing
+    if method == 'one_euro':
+        smoother = LandmarkSmoother(**kwargs)
+        return smoother.smooth_sequence(landmarks_sequence, timestamps)
+
+    elif method == 'gaussian':
+        smoother = GaussianTemporalSmoother(**kwargs)
+        return smoother.smooth_sequence(landmarks_sequence)
+
+    logger.warning(f"Unknown smoothing method '{method}', returning original frames")
+    return None
+
+
 def smooth_gesture_frames(
     frames: List[Dict],
     method: str = 'one_euro',
@@ -356,27 +433,10 @@ def smooth_gesture_frames(
     if len(landmarks_list) < 2:
         return frames
 
-    landmarks_sequence = np.array(landmarks_list)
-    timestamps = np.array(timestamps)
-
-    # Convert timestamps from milliseconds to seconds
-    if timestamps[0] > 100000:  # Likely milliseconds
-        timestamps = timestamps / 1000.0
-
-    # Normalize timestamps to start at 0
-    timestamps = timestamps - timestamps[0]
-
-    # Apply smoothing
-    if method == 'one_euro':
-        smoother = LandmarkSmoother(**kwargs)
-        smoothed_sequence = smoother.smooth_sequence(landmarks_sequence, timestamps)
-
-    elif method == 'gaussian':
-        smoother = GaussianTemporalSmoother(**kwargs)
-        smoothed_sequence = smoother.smooth_sequence(landmarks_sequence)
-
-    else:
-        logger.warning(f"Unknown smoothing method '{method}', returning original frames")
+    smoothed_sequence = smooth_landmark_sequence(
+        np.array(landmarks_list), np.array(timestamps), method, **kwargs
+    )
+    if smoothed_sequence is None:
         return frames
 
     # Convert back to frame format